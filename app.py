@@ -14,7 +14,7 @@ Features:
 
 import os
 from src.config.settings import Config
-from src.retrievers.pinecone import PineconeManager
+from src.retrievers.pinecone import get_pinecone_manager
 from src.processing.transcription import TranscriptionService
 from src.agents.conversational import ConversationalMeetingAgent
 from src.ui.gradio_app import create_demo
@@ -29,7 +29,7 @@ print("🚀 Initializing Conversational Meeting Intelligence Agent...")
 transcription_svc = TranscriptionService()
 
 try:
-    pinecone_mgr = PineconeManager()
+    pinecone_mgr = get_pinecone_manager()
     pinecone_available = True
     print("✅ Pinecone service initialized")
 except Exception as e:
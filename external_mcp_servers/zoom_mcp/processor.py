@@ -1,6 +1,6 @@
 import asyncio
 from typing import List, Dict, Any
-from src.retrievers.pinecone import PineconeManager
+from src.retrievers.pinecone import get_pinecone_manager
 from src.zoom_mcp.normalizer import TranscriptNormalizer
 
 class ZoomProcessor:
@@ -10,7 +10,7 @@ class ZoomProcessor:
     """
     
     def __init__(self):
-        self.pinecone_mgr = PineconeManager()
+        self.pinecone_mgr = get_pinecone_manager()
         self.normalizer = TranscriptNormalizer()
         self.batch: List[Dict[str, Any]] = []
         self.batch_size = 5 # Upsert every 5 chunks to reduce API calls
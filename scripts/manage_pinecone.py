@@ -7,11 +7,13 @@ This script provides easy commands to manage your Pinecone vector database:
 - Delete specific meetings by ID
 - View statistics
 - Clear test data
+- Backfill per-meeting records for older meetings
 
 Usage:
     python scripts/manage_pinecone.py list
     python scripts/manage_pinecone.py delete meeting_abc12345
     python scripts/manage_pinecone.py stats
+    python scripts/manage_pinecone.py backfill
 """
 
 import sys
@@ -20,7 +22,7 @@ import os
 # Add parent directory to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from src.retrievers.pinecone import PineconeManager
+from src.retrievers.pinecone import get_pinecone_manager
 from src.config.settings import Config
 
 
@@ -28,7 +30,7 @@ def list_meetings():
     """List all meetings stored in Pinecone."""
     print("\n📋 Listing all meetings in Pinecone...\n")
     
-    pm = PineconeManager()
+    pm = get_pinecone_manager()
     meetings = pm.list_meetings(namespace=Config.PINECONE_NAMESPACE, limit=1000)
     
     if not meetings:
@@ -58,7 +60,7 @@ def delete_meeting(meeting_id: str):
         print("❌ Deletion cancelled.")
         return
     
-    pm = PineconeManager()
+    pm = get_pinecone_manager()
     deleted_count = pm.delete_by_meeting_id(meeting_id, namespace=Config.PINECONE_NAMESPACE)
     
     if deleted_count > 0:
@@ -71,7 +73,7 @@ def show_stats():
     """Show Pinecone index statistics."""
     print("\n📊 Pinecone Index Statistics\n")
     
-    pm = PineconeManager()
+    pm = get_pinecone_manager()
     stats = pm.index.describe_index_stats()
     
     print(f"Index Name: {pm.index_name}")
@@ -91,11 +93,20 @@ def clear_namespace():
         print("❌ Operation cancelled.")
         return
     
-    pm = PineconeManager()
+    pm = get_pinecone_manager()
     pm.delete_namespace(Config.PINECONE_NAMESPACE)
     print(f"\n✅ All data cleared from '{Config.PINECONE_NAMESPACE}' namespace.")
 
 
+def backfill_meetings():
+    """Create meeting records for meetings ingested before records were written."""
+    print(f"\n🔄 Backfilling meeting records for '{Config.PINECONE_NAMESPACE}'...\n")
+    
+    pm = get_pinecone_manager()
+    count = pm.backfill_meeting_records(namespace=Config.PINECONE_NAMESPACE)
+    print(f"✅ Wrote records for {count} meeting(s).")
+
+
 def main():
     if len(sys.argv) < 2:
         print(__doc__)
@@ -121,6 +132,9 @@ def main():
         elif command == "clear":
             clear_namespace()
         
+        elif command == "backfill":
+            backfill_meetings()
+        
         else:
             print(f"❌ Unknown command: {command}")
             print(__doc__)
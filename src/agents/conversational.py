@@ -10,11 +10,16 @@ the entire meeting intelligence workflow through natural conversation, including
 """
 
 # Standard library imports
+import asyncio
+import functools
+import hashlib
+import threading
+from collections import OrderedDict
 from typing import Annotated, Any, Dict, List, Optional, TypedDict
 
 # Third-party imports
-from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
-from langchain_openai import ChatOpenAI
+import tiktoken
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
 from langgraph.graph import END, StateGraph
 from langgraph.graph.message import add_messages
 from langgraph.prebuilt import ToolNode
@@ -32,6 +37,8 @@ from src.tools.general import (
 )
 from src.tools.video import (
     cancel_video_workflow,
+    check_upload_status,
+    get_transcription_stage,
     initialize_video_tools,
     request_transcription_edit,
     request_video_upload,
@@ -40,6 +47,157 @@ from src.tools.video import (
     update_transcription,
     upload_transcription_to_pinecone,
 )
+from src.utils.llm import get_chat_model
+
+
+# Token budget for conversation history sent to the LLM (system prompt and current turn excluded)
+_HISTORY_MAX_TOKENS = 2000
+# Number of chat sessions whose converted history is kept for incremental updates
+_HISTORY_CACHE_SIZE = 128
+# Max LLM calls per turn in the direct runtime (matches LangGraph's default recursion limit of 25 steps)
+_MAX_AGENT_STEPS = 12
+# How often a running transcription is checked for a new pipeline stage
+_PROGRESS_POLL_SECONDS = 1.0
+
+
+def _transcription_calls(event) -> List[str]:
+    """video_path arguments of the transcribe_uploaded_video calls an agent event issues."""
+    messages = (event.get("agent") or {}).get("llm_messages") or []
+    if not messages:
+        return []
+    return [
+        str((call.get("args") or {}).get("video_path", ""))
+        for call in getattr(messages[-1], "tool_calls", None) or []
+        if call.get("name") == "transcribe_uploaded_video"
+    ]
+
+
+async def _with_transcription_progress(events):
+    """
+    Re-yield agent events, adding {"progress": stage} whenever this turn's own
+    transcription reports a new pipeline stage while no event is ready.
+    
+    Progress is only relayed between the agent event that issues a
+    transcribe_uploaded_video call and the tools event that completes it, and
+    only for the video that call names, so other chats' transcriptions never
+    show up here.
+    """
+    last_stage = None
+    video_paths = []  # transcriptions this turn is waiting on
+    pending = asyncio.ensure_future(anext(events))
+    try:
+        while True:
+            done, _ = await asyncio.wait({pending}, timeout=_PROGRESS_POLL_SECONDS)
+            if not done:
+                for video_path in video_paths:
+                    stage = get_transcription_stage(video_path)
+                    if stage and stage != last_stage:
+                        last_stage = stage
+                        yield {"progress": stage}
+                continue
+            try:
+                event = pending.result()
+            except StopAsyncIteration:
+                return
+            if "tools" in event:
+                video_paths = []
+            video_paths.extend(_transcription_calls(event))
+            yield event
+            pending = asyncio.ensure_future(anext(events))
+    finally:
+        # The consumer stopped early (or failed): don't leave a step running
+        pending.cancel()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_encoder():
+    """Load the tiktoken encoder for the configured model (None if unavailable)."""
+    try:
+        try:
+            return tiktoken.encoding_for_model(Config.MODEL_NAME)
+        except KeyError:
+            return tiktoken.get_encoding("o200k_base")
+    except Exception as e:
+        print(f"⚠️  Tokenizer unavailable, estimating history tokens by length: {e}")
+        return None
+
+
+def _count_tokens(text) -> int:
+    """Count tokens in a history entry, falling back to a ~4 chars/token estimate."""
+    if not text:
+        return 0
+    text = str(text)
+    encoder = _get_encoder()
+    if encoder is None:
+        return len(text) // 4 + 1
+    return len(encoder.encode(text, disallowed_special=()))
+
+
+def _hist_from_pair(item) -> List[BaseMessage]:
+    """Tuple/list format: [user_msg, assistant_msg]"""
+    if len(item) != 2:
+        return []
+    user_msg, assistant_msg = item
+    messages = []
+    if user_msg:
+        messages.append(HumanMessage(content=user_msg))
+    if assistant_msg:
+        messages.append(AIMessage(content=assistant_msg))
+    return messages
+
+
+def _hist_from_dict(item) -> List[BaseMessage]:
+    """Dict format: {"role": "user", "content": "..."}"""
+    role = item.get("role")
+    content = item.get("content")
+    if role == "user" and content:
+        return [HumanMessage(content=content)]
+    if role == "assistant" and content:
+        return [AIMessage(content=content)]
+    return []
+
+
+# One dict lookup per history entry instead of chained isinstance checks
+_HIST_DISPATCH = {list: _hist_from_pair, tuple: _hist_from_pair, dict: _hist_from_dict}
+
+
+def _history_item_messages(item) -> List[BaseMessage]:
+    """Convert one Gradio history entry into LLM messages."""
+    handler = _HIST_DISPATCH.get(type(item))
+    if handler is None:
+        return []
+    return handler(item)
+
+
+def _history_prefix_keys(history: List[Any]) -> List[bytes]:
+    """
+    Chained digests of every history prefix: keys[i] identifies history[:i + 1].
+
+    Two sessions only share a key when their whole converted history is identical.
+    """
+    keys = []
+    digest = b""
+    for item in history:
+        digest = hashlib.blake2b(digest + repr(item).encode("utf-8"), digest_size=16).digest()
+        keys.append(digest)
+    return keys
+
+
+def _window_turns(turns: List[Any], budget: int = _HISTORY_MAX_TOKENS) -> List[BaseMessage]:
+    """
+    Keep only the most recent converted turns that fit within the token budget.
+
+    Walks from newest to oldest and stops at the first turn that would exceed
+    the budget, so the prompt length stays bounded on long sessions.
+    """
+    used = 0
+    kept = []
+    for tokens, messages in reversed(turns):
+        used += tokens
+        if used > budget:
+            break
+        kept.append(messages)
+    return [message for messages in reversed(kept) for message in messages]
 
 
 class ConversationalAgentState(TypedDict):
@@ -110,7 +268,8 @@ You can help users with two main workflows:
 - `transcribe_uploaded_video`: Process and transcribe video
 - `request_transcription_edit`: Allow manual transcription editing
 - `update_transcription`: Save edited transcription
-- `upload_transcription_to_pinecone`: Store transcription in database
+- `upload_transcription_to_pinecone`: Store transcription in database (finishes in the background)
+- `check_upload_status`: Check whether a background upload has finished
 - `update_speaker_names`: Update speaker names in transcript (e.g., replace SPEAKER_00 with "John Smith")
 - `cancel_video_workflow`: Cancel current video workflow
 
@@ -223,7 +382,8 @@ You: `upsert_text_to_pinecone(text="Discussion about budget", title="Manual Note
      2. Make their edits
      3. Click "Save & Upload to Pinecone"
    - If ready to upload directly: call `upload_transcription_to_pinecone`
-   - Confirm success and offer to help with queries
+   - The upload finishes in the background: share the meeting ID and offer to help with queries
+   - If the user asks whether it is ready (or a search misses the new meeting): call `check_upload_status`
 
 4. **Meeting Query Flow**:
    - For "what meetings" (db): call `list_recent_meetings`
@@ -294,15 +454,20 @@ Would you like me to summarize any of these meetings?
 ```
 
 Remember: You're a helpful assistant focused on making meeting management effortless through natural conversation!"""
+    
+    # Built once and shared by every turn: the prompt is constant, and an
+    # identical leading message keeps the provider's prompt-prefix cache warm
+    SYSTEM_MESSAGE = SystemMessage(content=SYSTEM_PROMPT)
 
 
-    def __init__(self, pinecone_manager, transcription_service):
+    def __init__(self, pinecone_manager, transcription_service, llm=None):
         """
         Initialize the conversational agent.
         
         Args:
             pinecone_manager: Instance of PineconeManager for database access
             transcription_service: Instance of TranscriptionService for video processing
+            llm: Optional chat model to use (default: shared pooled client from get_chat_model)
         """
         self.pinecone_mgr = pinecone_manager
         self.transcription_svc = transcription_service
@@ -319,6 +484,7 @@ Remember: You're a helpful assistant focused on making meeting management effort
             request_transcription_edit,
             update_transcription,
             upload_transcription_to_pinecone,
+            check_upload_status,
             cancel_video_workflow,
             update_speaker_names,
             # Meeting query tools
@@ -340,15 +506,15 @@ Remember: You're a helpful assistant focused on making meeting management effort
         # Combine all tools
         self.tools = standard_tools + mcp_tools
         
-        # Create LLM with tool binding
-        self.llm = ChatOpenAI(
-            model=Config.MODEL_NAME,
-            temperature=0.7,
-            openai_api_key=Config.OPENAI_API_KEY,
-            streaming=False
-        ).bind_tools(self.tools)
+        # Bind tools to the shared LLM (reuses pooled keep-alive connections across sessions)
+        self.llm = (llm or get_chat_model()).bind_tools(self.tools)
+        
+        # Converted history per chat session, so each turn only converts new entries
+        self._history_cache: OrderedDict = OrderedDict()
+        self._history_lock = threading.Lock()
         
         # Build the state graph
+        self.tool_node = ToolNode(self.tools, messages_key="llm_messages")
         self.graph = self._build_graph()
 
     
@@ -398,7 +564,7 @@ Remember: You're a helpful assistant focused on making meeting management effort
         # Add nodes
         workflow.add_node("prepare", self._prepare_messages)
         workflow.add_node("agent", self._call_agent)
-        workflow.add_node("tools", ToolNode(self.tools, messages_key="llm_messages"))
+        workflow.add_node("tools", self.tool_node)
         
         # Define edges
         workflow.set_entry_point("prepare")
@@ -417,34 +583,52 @@ Remember: You're a helpful assistant focused on making meeting management effort
         # After tools, go back to agent
         workflow.add_edge("tools", "agent")
         
-        return workflow.compile()
+        # Chat history is owned by the UI and passed in on every call, so the
+        # graph never checkpoints state (no per-step serialization of messages)
+        return workflow.compile(checkpointer=None)
+    
+    def _history_messages(self, history: List[Any]) -> List[BaseMessage]:
+        """
+        Convert Gradio history to LLM messages, reusing turns converted on earlier calls.
+        
+        Entries are keyed by a digest of the whole history they were converted
+        from; the longest cached prefix of the current history is extended with
+        the new entries and re-stored under the full history's key.
+        """
+        if not history:
+            return []
+        
+        keys = _history_prefix_keys(history)
+        with self._history_lock:
+            count, turns = 0, []
+            for i in range(len(keys) - 1, -1, -1):
+                cached = self._history_cache.pop(keys[i], None)
+                if cached is not None:
+                    count, turns = i + 1, cached
+                    break
+            
+            # Convert only the entries added since the cached prefix
+            if count < len(history):
+                for item in history[count:]:
+                    messages = _history_item_messages(item)
+                    tokens = sum(_count_tokens(m.content) for m in messages)
+                    turns.append((tokens, messages))
+            
+            self._history_cache[keys[-1]] = turns
+            if len(self._history_cache) > _HISTORY_CACHE_SIZE:
+                self._history_cache.popitem(last=False)
+            
+            return _window_turns(turns)
     
     def _prepare_messages(self, state: ConversationalAgentState) -> ConversationalAgentState:
         """
         Node 1: Prepare LLM messages from conversation history.
         """
         try:
-            llm_messages = [
-                SystemMessage(content=self.SYSTEM_PROMPT)
-            ]
+            llm_messages = [self.SYSTEM_MESSAGE]
             
-            # Add conversation history - handle different Gradio formats
-            for item in state["history"]:
-                # Handle tuple/list format: [user_msg, assistant_msg]
-                if isinstance(item, (list, tuple)) and len(item) == 2:
-                    user_msg, assistant_msg = item
-                    if user_msg:
-                        llm_messages.append(HumanMessage(content=user_msg))
-                    if assistant_msg:
-                        llm_messages.append(AIMessage(content=assistant_msg))
-                # Handle dict format: {"role": "user", "content": "..."}
-                elif isinstance(item, dict):
-                    role = item.get("role")
-                    content = item.get("content")
-                    if role == "user" and content:
-                        llm_messages.append(HumanMessage(content=content))
-                    elif role == "assistant" and content:
-                        llm_messages.append(AIMessage(content=content))
+            # Add conversation history (windowed to the most recent turns that fit the token budget)
+            llm_messages.extend(self._history_messages(state["history"]))
             
             # Add current query
             llm_messages.append(HumanMessage(content=state["message"]))
@@ -454,16 +638,19 @@ Remember: You're a helpful assistant focused on making meeting management effort
         except Exception as e:
             return {"error": f"Error preparing messages: {str(e)}"}
     
-    def _call_agent(self, state: ConversationalAgentState) -> Dict[str, Any]:
+    async def _call_agent(self, state: ConversationalAgentState) -> Dict[str, Any]:
         """
         Node 2: Call the LLM agent (may invoke tools).
+        
+        Async so the LLM round-trip awaits on the event loop instead of tying up
+        an executor thread; concurrent chat sessions overlap their network I/O.
         """
         if state.get("error"):
             return {}
         
         try:
             llm_messages = state["llm_messages"]
-            response = self.llm.invoke(llm_messages)
+            response = await self.llm.ainvoke(llm_messages)
             
             # Return the new message to be appended
             return {"llm_messages": [response]}
@@ -487,6 +674,35 @@ Remember: You're a helpful assistant focused on making meeting management effort
         
         return "end"
     
+    async def _astream_direct(self, state: ConversationalAgentState):
+        """
+        Run the prepare -> agent -> tools loop with direct method calls.
+        
+        Yields the same per-node update events as `self.graph.astream`, without
+        LangGraph's per-step state copying, reducers and checkpoint bookkeeping.
+        """
+        state = dict(state)
+        
+        update = self._prepare_messages(state)
+        state.update(update)
+        yield {"prepare": update}
+        
+        for _ in range(_MAX_AGENT_STEPS):
+            update = await self._call_agent(state)
+            if "error" in update:
+                state["error"] = update["error"]
+            state["llm_messages"] = state["llm_messages"] + update.get("llm_messages", [])
+            yield {"agent": update}
+            
+            if self._should_continue(state) == "end":
+                return
+            
+            update = await self.tool_node.ainvoke(state)
+            state["llm_messages"] = state["llm_messages"] + update["llm_messages"]
+            yield {"tools": update}
+        
+        raise RuntimeError(f"Agent did not finish within {_MAX_AGENT_STEPS} steps")
+    
     async def generate_response(self, message: str, history: List[List[str]]):
         """
         Main entry point - generates a streaming response using the conversational agent.
@@ -514,7 +730,17 @@ Remember: You're a helpful assistant focused on making meeting management effort
             # This is REQUIRED for async MCP tools to work properly
             final_response = ""
             
-            async for event in self.graph.astream(initial_state):
+            if Config.USE_GRAPH_RUNTIME:
+                events = self.graph.astream(initial_state)
+            else:
+                events = self._astream_direct(initial_state)
+            
+            # Long tools (video transcription) report their progress in between events
+            async for event in _with_transcription_progress(events):
+                if "progress" in event:
+                    yield f"🎬 {event['progress']}\n"
+                    continue
+                
                 # Handle agent events
                 if "agent" in event:
                     agent_update = event["agent"]
@@ -1,21 +1,38 @@
 # config.py
 import os
-from dotenv import load_dotenv
-import torch
+import functools
+from dataclasses import dataclass
+from typing import Optional
+from dotenv import find_dotenv, load_dotenv
 
 import warnings
 warnings.filterwarnings("ignore", message="torchaudio._backend.list_audio_backends has been deprecated")
 # warnings.filterwarnings("ignore", message="Model was trained with.*Bad things might happen")
 warnings.filterwarnings("ignore", message="std(): degrees of freedom is <= 0")
 
-load_dotenv()
+# Parse .env once per process tree: the sentinel survives module reloads and is
+# inherited by child processes, which already get the loaded values via os.environ
+if not os.environ.get("_SETTINGS_LOADED"):
+    load_dotenv(find_dotenv(usecwd=True), override=False)
+    os.environ["_SETTINGS_LOADED"] = "1"
 
-class Config:
+
+@functools.lru_cache(maxsize=None)
+def _detect_device():
+    """Pick the torch device on first use (importing torch takes seconds)."""
+    import torch
+    return "cuda" if torch.cuda.is_available() else "cpu"
+
+
+# All env-derived values are read exactly once, here at import time; the
+# frozen instance below turns every later access into a plain attribute load.
+@dataclass(frozen=True)
+class _Settings:
     # API Keys
-    HUGGINGFACE_TOKEN = os.getenv("HUGGINGFACE_TOKEN")
-    PINECONE_API_KEY = os.getenv("PINECONE_API_KEY")
+    HUGGINGFACE_TOKEN: Optional[str] = os.getenv("HUGGINGFACE_TOKEN")
+    PINECONE_API_KEY: Optional[str] = os.getenv("PINECONE_API_KEY")
 
-    OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+    OPENAI_API_KEY: Optional[str] = os.getenv("OPENAI_API_KEY")
     # Model Settings 1 (Default)
     # MODEL_NAME = "gpt-3.5-turbo"
     # METADATA_MODEL = "gpt-4o-mini" # Cheaper model for metadata extraction
@@ -32,11 +49,11 @@ class Config:
     # THE BRAIN: GPT-5.2 (Reasoning Model)
     # Why: 98.7% tool-use accuracy. It "thinks" before it acts.
     # Cost: $1.75/1M input. This will solve your routing bugs.
-    MODEL_NAME = "gpt-5.2" 
+    MODEL_NAME: str = "gpt-5.2" 
     # THE WORKER: GPT-5-mini
     # Why: High-speed extraction with reasoning capabilities. 
     # Better than 4o-mini at inferring speaker roles from context.
-    METADATA_MODEL = "gpt-5-mini"
+    METADATA_MODEL: str = "gpt-5-mini"
 
 
     # # Zoom API Settings
@@ -46,44 +63,68 @@ class Config:
     # ZOOM_WEBHOOK_SECRET = os.getenv("ZOOM_WEBHOOK_SECRET")
 
     # Pinecone Settings
-    PINECONE_INDEX = "meeting-transcripts-1-dev"
-    PINECONE_ENVIRONMENT = "us-west1-gcp"  # Change to your environment
-    PINECONE_NAMESPACE = "development" # Default namespace for environment isolation options: "default", "development", "production"
+    PINECONE_INDEX: str = "meeting-transcripts-1-dev"
+    PINECONE_ENVIRONMENT: str = "us-west1-gcp"  # Change to your environment
+    PINECONE_NAMESPACE: str = "development" # Default namespace for environment isolation options: "default", "development", "production"
     
     # LangSmith Settings (optional - for tracing and debugging)
-    LANGCHAIN_TRACING_V2 = os.getenv("LANGCHAIN_TRACING_V2", "false")
-    LANGCHAIN_API_KEY = os.getenv("LANGCHAIN_API_KEY", "")
-    LANGCHAIN_PROJECT = os.getenv("LANGCHAIN_PROJECT", "meeting-agent")
+    LANGCHAIN_TRACING_V2: str = os.getenv("LANGCHAIN_TRACING_V2", "false")
+    LANGCHAIN_API_KEY: str = os.getenv("LANGCHAIN_API_KEY", "")
+    LANGCHAIN_PROJECT: str = os.getenv("LANGCHAIN_PROJECT", "meeting-agent")
     
     # Service Configuration
-    DEVICE = "cuda" if torch.cuda.is_available() else "cpu"
-    COMPUTE_TYPE = "float16" if DEVICE == "cuda" else "int8"
+    # Resolved lazily so importing Config doesn't pull in torch/CUDA
+    @property
+    def DEVICE(self) -> str:
+        return _detect_device()
+
+    @property
+    def COMPUTE_TYPE(self) -> str:
+        return "float16" if self.DEVICE == "cuda" else "int8"
+
+    # Run the diarization forward passes under fp16 autocast on CUDA
+    # (CPU always stays fp32)
+    DIARIZATION_FP16: bool = os.getenv("DIARIZATION_FP16", "true").lower() == "true"
+    
+    # Agent Runtime
+    # "true": run the agent through the compiled LangGraph (tracing/observability)
+    # "false": run the same prepare -> agent -> tools loop with direct method calls
+    USE_GRAPH_RUNTIME: bool = os.getenv("USE_GRAPH_RUNTIME", "true").lower() == "true"
+    
+    # Search Cache (optional Redis layer shared across workers)
+    REDIS_URL: str = os.getenv("REDIS_URL", "")
+    REDIS_CACHE_TTL: int = int(os.getenv("REDIS_CACHE_TTL", "3600"))
+    # Cosine similarity above which a paraphrased query reuses cached results
+    SEMANTIC_CACHE_THRESHOLD: float = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.95"))
+    
+    # Local cache directory (e.g. extracted metadata keyed by transcript hash)
+    CACHE_DIR: str = os.getenv("CACHE_DIR", ".cache")
     
     # Model Settings
-    WHISPER_MODEL = "small" # Options: tiny, base, small, medium, large-v2, large-v3
+    WHISPER_MODEL: str = "small" # Options: tiny, base, small, medium, large-v2, large-v3
     
     # MCP (Model Context Protocol) Settings
-    ENABLE_MCP = os.getenv("ENABLE_MCP", "false").lower() == "true"
+    ENABLE_MCP: bool = os.getenv("ENABLE_MCP", "false").lower() == "true"
     # Read from NOTION_TOKEN (the variable name in .env)
-    NOTION_TOKEN = os.getenv("NOTION_TOKEN", "")
+    NOTION_TOKEN: str = os.getenv("NOTION_TOKEN", "")
     
     # MCP Server Configurations
-    @staticmethod
-    def get_mcp_servers():
-        """Get MCP server configurations."""
-        if not Config.ENABLE_MCP:
+    @functools.lru_cache(maxsize=1)
+    def get_mcp_servers(self):
+        """Get MCP server configurations (built once; treat as read-only)."""
+        if not self.ENABLE_MCP:
             return {}
 
         servers = {}
         
         # 1. Notion MCP Server (if token is present)
-        if Config.NOTION_TOKEN:
+        if self.NOTION_TOKEN:
             servers["notion"] = {
                 "command": "npx",
                 "args": ["-y", "@notionhq/notion-mcp-server"],
                 "transport": "stdio",
                 "env": {
-                    "NOTION_TOKEN": Config.NOTION_TOKEN
+                    "NOTION_TOKEN": self.NOTION_TOKEN
                 }
             }
             
@@ -97,6 +138,9 @@ class Config:
         return servers
 
 
+Config = _Settings()
+
+
 # Enable LangSmith tracing if configured
 if Config.LANGCHAIN_TRACING_V2 == "true" and Config.LANGCHAIN_API_KEY:
     os.environ["LANGCHAIN_TRACING_V2"] = "true"
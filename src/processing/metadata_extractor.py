@@ -1,34 +1,44 @@
-import json
+import functools
+import hashlib
+import os
+import re
 from datetime import datetime
-from typing import Dict, Any, List
-from langchain_openai import ChatOpenAI
+from typing import Dict, Any, List, Optional
+import orjson
+from pydantic import BaseModel, Field, field_validator
 from langchain_core.messages import SystemMessage, HumanMessage
 from src.config.settings import Config
+from src.utils.cache import write_json_atomic
+from src.utils.llm import get_chat_model
+
+
+class MeetingMeta(BaseModel):
+    """Structured metadata returned by the extraction model."""
+    title: Optional[str] = None
+    summary: Optional[str] = None
+    meeting_date: Optional[str] = None
+    speaker_mapping: Dict[str, str] = Field(default_factory=dict)
+
+    @field_validator("speaker_mapping", mode="before")
+    @classmethod
+    def _empty_mapping(cls, value):
+        # Models sometimes answer null instead of {}
+        return value or {}
+
+
+def _cache_path(analysis_text: str) -> str:
+    """Disk cache location for a transcript prefix, keyed by model + content hash."""
+    digest = hashlib.blake2b(f"{Config.METADATA_MODEL}\0{analysis_text}".encode("utf-8"), digest_size=16).hexdigest()
+    return os.path.join(Config.CACHE_DIR, "metadata", f"{digest}.json")
+
 
 class MetadataExtractor:
     """
     Service to extract intelligent metadata from meeting transcripts using an LLM.
     Extracts: Title, Summary, Date, and Speaker Identities.
     """
-    
-    def __init__(self):
-        # Use a cost-effective model for metadata extraction if possible
-        # defaulting to the configured model
-        self.llm = ChatOpenAI(
-            model=Config.METADATA_MODEL,
-            temperature=0, # Deterministic output
-            openai_api_key=Config.OPENAI_API_KEY
-        )
-    
-    def extract_metadata(self, transcript_text: str) -> Dict[str, Any]:
-        """
-        Analyze transcript to extract title, summary, date, and speaker mapping.
-        """
-        # Truncate transcript if too long to avoid token limits (e.g., first 15k chars)
-        # usually enough for context
-        analysis_text = transcript_text[:15000]
-        
-        system_prompt = """You are a Metadata Extraction Expert. Analyze the provided meeting transcript and extract the following information in JSON format:
+
+    SYSTEM_PROMPT = """You are a Metadata Extraction Expert. Analyze the provided meeting transcript and extract the following information in JSON format:
 
 1. "title": A concise, meaningful title for the meeting (e.g., "Q3 Marketing Strategy Review").
 2. "summary": A brief 2-3 sentence summary of the meeting.
@@ -46,21 +56,43 @@ Example Output:
     }
 }
 """
+
+    # Built once: the prompt is constant across calls
+    SYSTEM_MESSAGE = SystemMessage(content=SYSTEM_PROMPT)
+    
+    def __init__(self):
+        # Use a cost-effective model for metadata extraction if possible
+        # defaulting to the configured model
+        # (shared, memoized client - creating ChatOpenAI per extractor is slow)
+        # JSON mode + schema parsing: the API returns a bare JSON object, so no fence stripping
+        self.llm = get_chat_model(Config.METADATA_MODEL, temperature=0).with_structured_output(  # Deterministic output
+            MeetingMeta, method="json_mode"
+        )
+    
+    def extract_metadata(self, transcript_text: str) -> Dict[str, Any]:
+        """
+        Analyze transcript to extract title, summary, date, and speaker mapping.
+        """
+        # Truncate transcript if too long to avoid token limits (e.g., first 15k chars)
+        # usually enough for context
+        analysis_text = transcript_text[:15000]
+        
+        # Re-uploads and retries of the same transcript skip the LLM call
+        cache_path = _cache_path(analysis_text)
+        try:
+            with open(cache_path, "rb") as f:
+                return orjson.loads(f.read())
+        except (OSError, orjson.JSONDecodeError):
+            pass
         
         try:
             response = self.llm.invoke([
-                SystemMessage(content=system_prompt),
+                self.SYSTEM_MESSAGE,
                 HumanMessage(content=f"Transcript:\n{analysis_text}")
             ])
-            
-            # Parse JSON from response
-            content = response.content.strip()
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0].strip()
-            elif "```" in content:
-                content = content.split("```")[1].split("```")[0].strip()
-                
-            metadata = json.loads(content)
+            # Drop unset fields so callers' .get(key, default) fallbacks still apply
+            metadata = response.model_dump(exclude_none=True)
+            self._write_cache(cache_path, metadata)
             return metadata
             
         except Exception as e:
@@ -73,6 +105,13 @@ Example Output:
                 "speaker_mapping": {}
             }
 
+    def _write_cache(self, cache_path: str, metadata: Dict[str, Any]):
+        """Persist extracted metadata; failures only cost a cache miss."""
+        try:
+            write_json_atomic(cache_path, metadata)
+        except (OSError, TypeError) as e:
+            print(f"⚠️ Could not cache extracted metadata: {e}")
+
     def apply_speaker_mapping(self, transcript: str, mapping: Dict[str, str]) -> str:
         """
         Replace generic speaker labels with identified names in the transcript.
@@ -80,10 +119,18 @@ Example Output:
         if not mapping:
             return transcript
             
-        updated_transcript = transcript
-        for generic, real_name in mapping.items():
-            # Replace "SPEAKER_00" with "John Smith"
-            # We handle common variations in formatting
-            updated_transcript = updated_transcript.replace(generic, real_name)
-            
-        return updated_transcript
+        # Single pass over the transcript; longest labels first so "SPEAKER_1"
+        # never matches inside "SPEAKER_10", and replaced names are never re-scanned
+        pattern = re.compile("|".join(map(re.escape, sorted(mapping, key=len, reverse=True))))
+        return pattern.sub(lambda m: mapping[m.group(0)], transcript)
+
+
+@functools.lru_cache(maxsize=None)
+def get_metadata_extractor() -> MetadataExtractor:
+    """
+    Return the process-wide MetadataExtractor.
+
+    The extractor holds no per-call state, so bulk imports reuse one
+    instance instead of rebuilding the structured-output chain per upsert.
+    """
+    return MetadataExtractor()
@@ -1,9 +1,14 @@
 # core/transcription_service.py
 import whisperx
 import gradio as gr
+import contextlib
 import gc
+import functools
+import hashlib
 import time
 import os
+import orjson
+import torch
 from datetime import datetime
 import warnings
 
@@ -11,10 +16,62 @@ import warnings
 warnings.filterwarnings("ignore", message="std\(\): degrees of freedom is <= 0")
 
 from src.config.settings import Config
+from src.utils.cache import write_json_atomic
 
 # CORRECT WAY: Import DiarizationPipeline at point of use
 from whisperx.diarize import DiarizationPipeline
 
+
+# Model loads take seconds (disk I/O + GPU allocation), so each model is
+# loaded once per process and shared by every TranscriptionService
+@functools.lru_cache(maxsize=2)
+def _get_whisper_model(model_name, device, compute_type):
+    return whisperx.load_model(model_name, device, compute_type=compute_type, language="en")
+
+
+@functools.lru_cache(maxsize=2)
+def _get_diarize_pipeline(hf_token, device):
+    return DiarizationPipeline(use_auth_token=hf_token, device=device)
+
+
+@functools.lru_cache(maxsize=4)
+def _get_align_model(language_code, device):
+    """Alignment model and its metadata for a language."""
+    return whisperx.load_align_model(language_code=language_code, device=device)
+
+
+# Bytes hashed from each end of a video for its cache key (plus the file size)
+_HASH_SPAN = 1 << 20
+
+
+def _transcript_cache_path(video_file_path):
+    """Disk cache location for a video, keyed by model + file size + first/last MiB."""
+    size = os.path.getsize(video_file_path)
+    digest = hashlib.blake2b(f"{Config.WHISPER_MODEL}\0{size}\0".encode("utf-8"), digest_size=16)
+    with open(video_file_path, "rb") as f:
+        digest.update(f.read(_HASH_SPAN))
+        if size > _HASH_SPAN:
+            f.seek(max(size - _HASH_SPAN, _HASH_SPAN))
+            digest.update(f.read())
+    return os.path.join(Config.CACHE_DIR, "transcripts", f"{digest.hexdigest()}.json")
+
+
+def _read_cached_transcript(cache_path):
+    try:
+        with open(cache_path, "rb") as f:
+            return orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+
+def _write_cached_transcript(cache_path, result):
+    """Persist a WhisperX result; failures only cost a cache miss."""
+    try:
+        write_json_atomic(cache_path, result, option=orjson.OPT_SERIALIZE_NUMPY)
+    except (OSError, TypeError) as e:
+        print(f"⚠️ Could not cache transcription: {e}")
+
+
 class TranscriptionService:
     def __init__(self):
         self.config = Config
@@ -30,16 +87,15 @@ class TranscriptionService:
             print("📥 Loading transcription models...")
             
             # Use the model from config instead of hardcoding
-            self.whisper_model = whisperx.load_model(
+            self.whisper_model = _get_whisper_model(
                 self.config.WHISPER_MODEL,
                 self.config.DEVICE,
-                compute_type=self.config.COMPUTE_TYPE,
-                language="en"
+                self.config.COMPUTE_TYPE
             )
             
-            self.diarize_model = DiarizationPipeline(
-                use_auth_token=self.config.HUGGINGFACE_TOKEN,
-                device=self.config.DEVICE
+            self.diarize_model = _get_diarize_pipeline(
+                self.config.HUGGINGFACE_TOKEN,
+                self.config.DEVICE
             )
             
             self.models_loaded = True
@@ -50,104 +106,25 @@ class TranscriptionService:
             """Clean transcription pipeline without Gradio dependencies.
             Added optional progress callback"""
             try:
-                if not self.models_loaded:
-                    self.load_models()
-                
                 start_time = time.time()
                 print(f"🎬 Processing video: {os.path.basename(video_file_path)}")
                 
-                # ======================
-                # STEP 1: Load Audio from Video
-                # ======================
-                if progress_callback:
-                    print(f"DEBUG: Calling progress callback 0.1. Type: {type(progress_callback)}")
-                    try:
-                        progress_callback(0.1, desc="🎬 Loading audio from video...")
-                        print("DEBUG: Progress callback 0.1 called successfully")
-                    except Exception as e:
-                        print(f"DEBUG: Error calling progress callback: {e}")
-                    time.sleep(0.5)
-                print("1️⃣ Loading audio directly from video...")
-                audio = whisperx.load_audio(video_file_path)
-
-                print(f"✅ Audio loaded: {len(audio)} samples")
-                
-                # ======================
-                # STEP 2: Transcribe with Whisper
-                # ======================
-                print("2️⃣ Loading Whisper model...")
-                if progress_callback:
-                    progress_callback(0.3, desc="🤖 Loading Whisper model...")
-                    time.sleep(0.5)
-
-                if progress_callback:
-                    progress_callback(0.4, desc="📝 Transcribing audio...")
-                    time.sleep(0.5)
-                print("3️⃣ Transcribing audio...")
-
-                result = self.whisper_model.transcribe(audio, batch_size=self.batch_size)
-                detected_language = result['language']  # Save language before it gets lost
-                print(f"✅ Transcription complete ({detected_language} detected)")            
-                
-                # ======================
-                # STEP 3: Align Timestamps
-                # ======================
-                if progress_callback:
-                    progress_callback(0.5, desc="⏱️ Aligning timestamps...")
-                    time.sleep(0.5)
-                print("4️⃣ Aligning word-level timestamps...")
-                
-                # Load the alignment model and its metadata from whisperx for word-level timestamp alignment.
-                model_a, metadata = whisperx.load_align_model(
-                    language_code=detected_language,
-                    device=self.config.DEVICE
-                )
-                result = whisperx.align(
-                    result["segments"],
-                    model_a,
-                    metadata,
-                    audio,
-                    self.config.DEVICE,
-                    return_char_alignments=False
-                )
-                # Restore language to result dict after alignment
-                result["language"] = detected_language
-                print("✅ Timestamps aligned")
-                
-                # ======================
-                # STEP 4: Speaker Diarization - CORRECT IMPORT
-                # ======================
-                if progress_callback:
-                    progress_callback(0.7, desc="👥 Identifying speakers...")
-                    time.sleep(0.5)
-                print("5️⃣ Loading speaker diarization model...")
-                diarize_segments = self.diarize_model(audio)            
-                    
-                
-                # ======================
-                # STEP 5: Assign speakers
-                # ======================
-                #
-                if progress_callback:
-                    progress_callback(0.9, desc="🔗 Assigning speakers to text...")
-                    time.sleep(0.5)
-                result = whisperx.assign_word_speakers(diarize_segments, result)
-                print("6️⃣ Assigning speakers to transcript...")
-                             
-                print("🔗 Assigning speakers to text...")
-                result = whisperx.assign_word_speakers(diarize_segments, result)
-                print("✅ Speaker assignment complete")
-                
-
-                if progress_callback:
-                    progress_callback(1.0, desc="✅ Complete!")
-                    time.sleep(0.5)
+                # Re-uploads of the same video skip model loading and inference
+                cache_path = _transcript_cache_path(video_file_path)
+                result = _read_cached_transcript(cache_path)
+                if result is not None:
+                    print("♻️ Using cached transcription for this video")
+                    if progress_callback:
+                        progress_callback(1.0, desc="✅ Complete!")
+                else:
+                    result = self._run_pipeline(video_file_path, progress_callback)
+                    _write_cached_transcript(cache_path, result)
                     
                 # ======================
                 # STEP 6: Format results
                 # ======================
                 processing_time = time.time() - start_time
-                transcription = self._format_results(result, video_file_path)
+                transcription, speakers = self._format_results(result, video_file_path)
                 timing_info = self._get_timing_info(result, processing_time, video_file_path)
                 
                 return {
@@ -156,7 +133,7 @@ class TranscriptionService:
                     "timing_info": timing_info,
                     "raw_data": result,  # Keep for potential storage
                     "processing_time": processing_time,
-                    "speakers_count": len(set(seg.get("speaker", "UNKNOWN") for seg in result["segments"]))
+                    "speakers_count": len(speakers)  # collected while formatting, no second pass
                 }
                 
             except Exception as e:
@@ -168,55 +145,155 @@ class TranscriptionService:
                 }
     
 
+    def _run_pipeline(self, video_file_path, progress_callback=None):
+        """Load audio, transcribe, align and diarize; returns the WhisperX result."""
+        if not self.models_loaded:
+            self.load_models()
+        
+        # ======================
+        # STEP 1: Load Audio from Video
+        # ======================
+        if progress_callback:
+            progress_callback(0.1, desc="🎬 Loading audio from video...")
+        print("1️⃣ Loading audio directly from video...")
+        audio = whisperx.load_audio(video_file_path)
+
+        print(f"✅ Audio loaded: {len(audio)} samples")
+        
+        # ======================
+        # STEP 2: Transcribe with Whisper
+        # ======================
+        print("2️⃣ Loading Whisper model...")
+        if progress_callback:
+            progress_callback(0.3, desc="🤖 Loading Whisper model...")
+
+        if progress_callback:
+            progress_callback(0.4, desc="📝 Transcribing audio...")
+        print("3️⃣ Transcribing audio...")
+
+        result = self.whisper_model.transcribe(audio, batch_size=self.batch_size)
+        detected_language = result['language']  # Save language before it gets lost
+        print(f"✅ Transcription complete ({detected_language} detected)")            
+        
+        # ======================
+        # STEP 3: Align Timestamps
+        # ======================
+        if progress_callback:
+            progress_callback(0.5, desc="⏱️ Aligning timestamps...")
+        print("4️⃣ Aligning word-level timestamps...")
+        
+        # Load the alignment model and its metadata from whisperx for word-level timestamp alignment.
+        # (cached per language, so only the first video in a language pays the load)
+        model_a, metadata = _get_align_model(detected_language, self.config.DEVICE)
+        result = whisperx.align(
+            result["segments"],
+            model_a,
+            metadata,
+            audio,
+            self.config.DEVICE,
+            return_char_alignments=False
+        )
+        # Restore language to result dict after alignment
+        result["language"] = detected_language
+        print("✅ Timestamps aligned")
+        
+        # ======================
+        # STEP 4: Speaker Diarization - CORRECT IMPORT
+        # ======================
+        if progress_callback:
+            progress_callback(0.7, desc="👥 Identifying speakers...")
+        print("5️⃣ Loading speaker diarization model...")
+        with self._diarization_precision():
+            diarize_segments = self.diarize_model(audio)
+            
+        
+        # ======================
+        # STEP 5: Assign speakers
+        # ======================
+        #
+        if progress_callback:
+            progress_callback(0.9, desc="🔗 Assigning speakers to text...")
+        result = whisperx.assign_word_speakers(diarize_segments, result)
+        print("6️⃣ Assigning speakers to transcript...")
+                     
+        print("🔗 Assigning speakers to text...")
+        result = whisperx.assign_word_speakers(diarize_segments, result)
+        print("✅ Speaker assignment complete")
+        
+
+        if progress_callback:
+            progress_callback(1.0, desc="✅ Complete!")
+        
+        return result
+
+    def _diarization_precision(self):
+        """fp16 autocast for the pyannote passes on CUDA (tensor cores); a no-op elsewhere."""
+        if self.config.DEVICE == "cuda" and self.config.DIARIZATION_FP16:
+            return torch.autocast("cuda", dtype=torch.float16)
+        return contextlib.nullcontext()
+
     def _format_results(self, result, video_file_path):
-        """Format transcription with speaker labels and comprehensive meeting metadata"""
+        """Format transcription with speaker labels and comprehensive meeting metadata.
+        Returns (markdown, set of speaker labels)"""
         if not result["segments"]:
-            return "No transcription segments found"
+            return "No transcription segments found", set()
         
         # Extract meeting metadata
         segments = result["segments"]
-        speakers = set(segment.get("speaker", "UNKNOWN") for segment in segments)
         total_duration = segments[-1]["end"] if segments else 0
         language = result.get("language", "unknown")
         
-        # Calculate statistics
-        total_words = sum(len(seg.get("text", "").split()) for seg in segments)
-        avg_segment_length = total_words / len(segments) if segments else 0
-        
-        # Build header with meeting context
-        output = "# 🎯 Meeting Transcription\n\n"
-        output += "## 📋 Meeting Information\n\n"
-        output += f"**📁 File:** `{os.path.basename(video_file_path)}`\n"
-        output += f"**📅 Date:** {datetime.now().strftime('%Y-%m-%d %H:%M')}\n"
-        output += f"**⏱️ Duration:** {self._format_timestamp(total_duration)}\n"
-        output += f"**👥 Speakers:** {len(speakers)}\n"
-        output += f"**🌐 Language:** {language.upper()}\n"
-        output += f"**🤖 Model:** {self.config.WHISPER_MODEL}\n\n"
-        output += "---\n\n"
-        output += "## 💬 Transcript\n\n"
-        
-        # Add transcript content
+        # Build the transcript body in one walk, collecting speaker and word
+        # statistics along the way (parts are joined once at the end)
+        body = []
+        speakers = set()
+        total_words = 0
         current_speaker = None
         for segment in segments:
             speaker = segment.get("speaker", "UNKNOWN")
+            speakers.add(speaker)
+            text = segment.get("text", "")
+            total_words += len(text.split())
             start_time = self._format_timestamp(segment["start"])
             
             if speaker != current_speaker:
-                output += f"\n**👤 {speaker}:**\n"
+                body.append(f"\n**👤 {speaker}:**\n")
                 current_speaker = speaker
             
-            output += f"[{start_time}] {segment['text'].strip()}\n"
+            body.append(f"[{start_time}] {text.strip()}\n")
+        
+        # Calculate statistics
+        avg_segment_length = total_words / len(segments) if segments else 0
+        
+        # Build header with meeting context
+        parts = [
+            "# 🎯 Meeting Transcription\n\n",
+            "## 📋 Meeting Information\n\n",
+            f"**📁 File:** `{os.path.basename(video_file_path)}`\n",
+            f"**📅 Date:** {datetime.now().strftime('%Y-%m-%d %H:%M')}\n",
+            f"**⏱️ Duration:** {self._format_timestamp(total_duration)}\n",
+            f"**👥 Speakers:** {len(speakers)}\n",
+            f"**🌐 Language:** {language.upper()}\n",
+            f"**🤖 Model:** {self.config.WHISPER_MODEL}\n\n",
+            "---\n\n",
+            "## 💬 Transcript\n\n",
+        ]
+        
+        # Add transcript content
+        parts.extend(body)
         
         # Add comprehensive footer
-        output += "\n---\n\n"
-        output += "## 📊 Transcript Statistics\n\n"
-        output += f"**Total Segments:** {len(segments)}\n"
-        output += f"**Total Words:** {total_words:,}\n"
-        output += f"**Avg Words/Segment:** {avg_segment_length:.1f}\n"
-        output += f"**Unique Speakers:** {len(speakers)}\n"
-        output += f"**Speaker IDs:** {', '.join(sorted(speakers))}\n"
-        
-        return output
+        parts.extend([
+            "\n---\n\n",
+            "## 📊 Transcript Statistics\n\n",
+            f"**Total Segments:** {len(segments)}\n",
+            f"**Total Words:** {total_words:,}\n",
+            f"**Avg Words/Segment:** {avg_segment_length:.1f}\n",
+            f"**Unique Speakers:** {len(speakers)}\n",
+            f"**Speaker IDs:** {', '.join(sorted(speakers))}\n",
+        ])
+        
+        return "".join(parts), speakers
     
     def _get_timing_info(self, result, processing_time, video_file_path):
         """Generate timing information"""
@@ -241,6 +318,5 @@ class TranscriptionService:
         """Convert seconds to MM:SS format"""
         if seconds is None:
             return "00:00"
-        minutes = int(seconds // 60)
-        seconds = int(seconds % 60)
+        minutes, seconds = divmod(int(seconds), 60)
         return f"{minutes:02d}:{seconds:02d}"
\ No newline at end of file
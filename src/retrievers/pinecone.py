@@ -1,8 +1,29 @@
+import asyncio
 import os
+import time
+import uuid
+import functools
 from pinecone import Pinecone, ServerlessSpec
+from pinecone.exceptions import NotFoundException
 from langchain_pinecone import PineconeVectorStore
 from src.config.settings import Config
 from src.utils.embedding import get_embedding_model
+from src.utils.cache import clear_index_caches
+
+# Pinecone recommends <= 100 vectors (and < 2MB) per upsert request
+UPSERT_BATCH_SIZE = 100
+# Worker threads the index client uses to send upsert batches concurrently
+UPSERT_POOL_THREADS = 8
+# Pinecone caps top_k at 1000 when metadata is included
+MAX_METADATA_TOP_K = 1000
+# One record per meeting lives in "<namespace>__meetings" (ID = meeting_id)
+MEETINGS_NAMESPACE_SUFFIX = "__meetings"
+# Meeting-level fields copied from the chunk metadata into the meeting record
+MEETING_FIELDS = (
+    "meeting_id", "meeting_date", "meeting_title", "summary", "meeting_duration",
+    "speaker_mapping", "source", "source_file", "transcription_model", "language",
+    "date_transcribed",
+)
 
 class PineconeManager:
     def __init__(self, index_name=None):
@@ -17,15 +38,17 @@ class PineconeManager:
         self.pc = Pinecone(api_key=self.api_key)
         self.index_name = index_name or Config.PINECONE_INDEX
         
-        # Check if index exists, create it if it doesn't
+        # Check if index exists (single point lookup), create it if it doesn't
         try:
-            existing_indexes = [i.name for i in self.pc.list_indexes()]
-            if self.index_name not in existing_indexes:
+            try:
+                description = self.pc.describe_index(self.index_name)
+                print(f"✅ Connected to existing index '{self.index_name}'")
+            except NotFoundException:
                 print(f"Index '{self.index_name}' does not exist. Creating it now...")
                 
                 # Create index with ServerlessSpec
                 # OpenAI embeddings (text-embedding-ada-002) use dimension 1536
-                self.pc.create_index(
+                description = self.pc.create_index(
                     name=self.index_name,
                     dimension=1536,  # OpenAI embedding dimension
                     metric='cosine',  # Cosine similarity for semantic search
@@ -35,13 +58,14 @@ class PineconeManager:
                     )
                 )
                 print(f"✅ Successfully created index '{self.index_name}'")
-            else:
-                print(f"✅ Connected to existing index '{self.index_name}'")
         except Exception as e:
             print(f"Error managing Pinecone index: {e}")
             raise e
 
-        self.index = self.pc.Index(self.index_name)
+        # Connect by host so Index() doesn't look the index up a second time
+        self.index = self.pc.Index(host=description.host, pool_threads=UPSERT_POOL_THREADS)
+        # Non-zero constant vector for metadata scans (cosine rejects all-zero queries)
+        self._probe_vector = [1.0] * description.dimension
         self.embeddings = get_embedding_model()
 
     def upsert_documents(self, documents, namespace=None):
@@ -55,19 +79,125 @@ class PineconeManager:
             return
 
         try:
-            # Using LangChain's PineconeVectorStore for easy upsert
-            PineconeVectorStore.from_documents(
-                documents=documents,
-                embedding=self.embeddings,
-                index_name=self.index_name,
-                namespace=namespace,
-                pinecone_api_key=self.api_key
-            )
+            # Embed all chunks in one batched call, then upsert with the native
+            # client in fixed-size batches (skips the vector store's per-call overhead)
+            texts = [doc.page_content for doc in documents]
+            embeddings = self.embeddings.embed_documents(texts)
+            
+            # Send all batches concurrently, then wait for every one to finish
+            for future in self._send_upserts(texts, embeddings, documents, namespace):
+                future.get()
+            
+            clear_index_caches()
+            print(f"Successfully upserted {len(documents)} documents to namespace '{namespace}'.")
+        except Exception as e:
+            print(f"Error upserting documents: {e}")
+            raise e
+
+    async def aupsert_documents(self, documents, namespace=None):
+        """
+        Async variant of upsert_documents for callers running on an event loop.
+        
+        The embedding call is awaited natively; the upsert batches are sent
+        through the same bounded pool (UPSERT_POOL_THREADS in flight) and
+        awaited from a worker thread, so the loop is never blocked.
+        """
+        if namespace is None:
+            namespace = Config.PINECONE_NAMESPACE
+        if not documents:
+            print("No documents to upsert.")
+            return
+
+        try:
+            texts = [doc.page_content for doc in documents]
+            embeddings = await self.embeddings.aembed_documents(texts)
+            
+            futures = self._send_upserts(texts, embeddings, documents, namespace)
+            await asyncio.to_thread(lambda: [future.get() for future in futures])
+            
+            clear_index_caches()
             print(f"Successfully upserted {len(documents)} documents to namespace '{namespace}'.")
         except Exception as e:
             print(f"Error upserting documents: {e}")
             raise e
 
+    def _send_upserts(self, texts, embeddings, documents, namespace):
+        """
+        Start the chunk and meeting-record upserts on the index's thread pool.
+        Returns the async upsert futures.
+        """
+        vectors = []
+        for text, embedding, doc in zip(texts, embeddings, documents):
+            # Stored under "text" so PineconeVectorStore retrievers can rebuild the Document
+            metadata = {**doc.metadata, "text": text}
+            vectors.append((str(uuid.uuid4()), embedding, metadata))
+        
+        futures = [
+            self.index.upsert(vectors=vectors[i:i + UPSERT_BATCH_SIZE], namespace=namespace, async_req=True)
+            for i in range(0, len(vectors), UPSERT_BATCH_SIZE)
+        ]
+        futures.append(self._upsert_meeting_records((doc.metadata for doc in documents), namespace))
+        return futures
+
+    def _upsert_meeting_records(self, chunk_metadatas, namespace):
+        """
+        Write one canonical record per meeting into the meetings namespace,
+        so meeting-level lookups don't have to scrape a chunk.
+        Returns the async upsert future.
+        """
+        created_at = time.time()
+        records = {}
+        for chunk_metadata in chunk_metadatas:
+            meeting_id = chunk_metadata.get("meeting_id")
+            if meeting_id and meeting_id not in records:
+                metadata = {key: chunk_metadata[key] for key in MEETING_FIELDS if key in chunk_metadata}
+                metadata["created_at"] = created_at
+                records[meeting_id] = (meeting_id, self._probe_vector, metadata)
+        
+        return self.index.upsert(
+            vectors=list(records.values()),
+            namespace=namespace + MEETINGS_NAMESPACE_SUFFIX,
+            async_req=True
+        )
+
+    def get_meeting_record(self, meeting_id: str, namespace: str = None):
+        """
+        Fetch the stored meeting record by ID (no embedding or similarity search).
+        
+        Returns:
+            The meeting's metadata dict, or None if no record exists
+            (e.g. meetings ingested before meeting records were written).
+        """
+        if namespace is None:
+            namespace = Config.PINECONE_NAMESPACE
+        fetched = self.index.fetch(ids=[meeting_id], namespace=namespace + MEETINGS_NAMESPACE_SUFFIX)
+        vector = fetched.vectors.get(meeting_id)
+        return dict(vector.metadata) if vector is not None and vector.metadata else None
+
+    def backfill_meeting_records(self, namespace: str = None):
+        """
+        Create meeting records for meetings ingested before records existed,
+        by scanning chunk metadata once.
+        
+        Returns:
+            Number of meetings found in the scan
+        """
+        if namespace is None:
+            namespace = Config.PINECONE_NAMESPACE
+        results = self.index.query(
+            namespace=namespace,
+            vector=self._probe_vector,
+            top_k=MAX_METADATA_TOP_K,
+            include_values=False,
+            include_metadata=True
+        )
+        chunk_metadatas = [match.metadata for match in results.matches if match.metadata]
+        if not chunk_metadatas:
+            return 0
+        self._upsert_meeting_records(chunk_metadatas, namespace).get()
+        clear_index_caches()
+        return len({metadata.get("meeting_id") for metadata in chunk_metadatas} - {None})
+
     def get_retriever(self, namespace=None, search_kwargs=None):
         """
         Returns a LangChain retriever for the specified namespace.
@@ -77,11 +207,11 @@ class PineconeManager:
         if search_kwargs is None:
             search_kwargs = {"k": 5}
 
+        # Reuse the already-connected index so retrievers share its HTTP pool
         vectorstore = PineconeVectorStore(
-            index_name=self.index_name,
+            index=self.index,
             embedding=self.embeddings,
-            namespace=namespace,
-            pinecone_api_key=self.api_key
+            namespace=namespace
         )
         
         return vectorstore.as_retriever(search_kwargs=search_kwargs)
@@ -103,6 +233,8 @@ class PineconeManager:
                 filter={"meeting_id": {"$eq": meeting_id}},
                 namespace=namespace
             )
+            self.index.delete(ids=[meeting_id], namespace=namespace + MEETINGS_NAMESPACE_SUFFIX)
+            clear_index_caches()
             
             print(f"✅ Successfully deleted vectors for meeting_id: {meeting_id}")
             
@@ -124,6 +256,11 @@ class PineconeManager:
         """
         try:
             self.index.delete(delete_all=True, namespace=namespace)
+            try:
+                self.index.delete(delete_all=True, namespace=namespace + MEETINGS_NAMESPACE_SUFFIX)
+            except NotFoundException:
+                pass  # No meeting records were ever written for this namespace
+            clear_index_caches()
             print(f"✅ Successfully deleted all vectors in namespace: {namespace}")
         except Exception as e:
             print(f"Error deleting namespace {namespace}: {e}")
@@ -135,7 +272,7 @@ class PineconeManager:
         
         Args:
             namespace: The namespace to query (default: Config.PINECONE_NAMESPACE)
-            limit: Maximum number of vectors to scan (default: 100)
+            limit: Maximum number of vectors to scan (default: 100, capped at 1000)
             
         Returns:
             List of dictionaries with meeting metadata
@@ -143,18 +280,26 @@ class PineconeManager:
         if namespace is None:
             namespace = Config.PINECONE_NAMESPACE
         try:
-            # Query random vectors to get metadata
-            results = self.index.query(
-                namespace=namespace,
-                vector=[0.0] * 1536,  # Dummy vector
-                top_k=limit,
-                include_metadata=True
-            )
+            # Metadata-only query: a constant probe vector (no embedding call)
+            # and include_values=False, so no vector bytes come over the wire
+            # (fetch() always returns the full values).
+            # Meeting records come first; the chunk scan is always merged in so
+            # meetings ingested before records existed (never backfilled) still show.
+            matches = []
+            for scan_namespace in (namespace + MEETINGS_NAMESPACE_SUFFIX, namespace):
+                results = self.index.query(
+                    namespace=scan_namespace,
+                    vector=self._probe_vector,
+                    top_k=min(limit, MAX_METADATA_TOP_K),
+                    include_values=False,
+                    include_metadata=True
+                )
+                matches.extend(results.matches)
             
-            # Extract unique meetings
+            # Extract unique meetings (a record wins over its chunks)
             meetings = {}
-            for match in results.matches:
-                metadata = match.metadata
+            for match in matches:
+                metadata = match.metadata or {}
                 meeting_id = metadata.get("meeting_id")
                 
                 if meeting_id and meeting_id not in meetings:
@@ -170,4 +315,19 @@ class PineconeManager:
             
         except Exception as e:
             print(f"Error listing meetings: {e}")
-            return []
\ No newline at end of file
+            return []
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_manager(index_name):
+    return PineconeManager(index_name)
+
+
+def get_pinecone_manager(index_name=None):
+    """
+    Return the process-wide PineconeManager for an index.
+
+    The client, index connection and embedding model are created once and
+    shared by every caller instead of being rebuilt per PineconeManager().
+    """
+    return _cached_manager(index_name or Config.PINECONE_INDEX)
@@ -1,8 +1,13 @@
-import json
+import functools
+import re
+import orjson
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain_core.documents import Document
 from datetime import datetime
 
+# Any whitespace other than single spaces (runs, tabs, newlines, unicode spaces)
+_IRREGULAR_WS = re.compile(r"\s\s|[^\S ]")
+
 def process_transcript_to_documents(
     transcript_text, 
     speaker_data, 
@@ -29,42 +34,55 @@ def process_transcript_to_documents(
     Returns:
         list[Document]: List of processed LangChain Documents with rich metadata.
     """
+    return list(iter_documents(
+        transcript_text, speaker_data, meeting_id, meeting_metadata,
+        min_chunk_size, max_chunk_size, chunk_overlap
+    ))
+
+
+def iter_documents(
+    transcript_text,
+    speaker_data,
+    meeting_id,
+    meeting_metadata=None,
+    min_chunk_size=1500,
+    max_chunk_size=3000,
+    chunk_overlap=200
+):
+    """
+    Generator variant of process_transcript_to_documents.
+    
+    Chunk grouping still runs up front (total_chunks must be known), but the
+    Documents and their wide metadata dicts are built one at a time, so a
+    consumer that works in batches never holds them all at once.
+    
+    Yields:
+        Document: Processed LangChain Documents, in chunk order.
+    """
     if not speaker_data:
         # Fallback: use RecursiveCharacterTextSplitter on raw text
-        return _fallback_chunking(transcript_text, meeting_id, meeting_metadata, min_chunk_size, max_chunk_size, chunk_overlap)
+        yield from _fallback_chunking(transcript_text, meeting_id, meeting_metadata, min_chunk_size, max_chunk_size, chunk_overlap)
+        return
     
     # Initialize metadata defaults
     meeting_metadata = meeting_metadata or {}
     
     # Group segments into meaningful chunks
+    # Chunk state lives in plain locals (fast name access in this per-segment loop).
+    # Text is collected as a list of segment fragments and joined once on
+    # finalize (repeated += would copy the whole chunk on every segment).
+    # The overlap tail of the previous chunk is kept aside and prepended on
+    # finalize, so it doesn't count toward the size limits.
     chunks = []
-    current_chunk = {
-        "text": "",
-        "speaker": None,
-        "speakers": set(),
-        "start_time": None,
-        "end_time": None,
-        "segment_count": 0
-    }
-    
-    def finalize_chunk():
-        """Finalize the current chunk and add to chunks list."""
-        if current_chunk["text"].strip():
-            chunks.append({
-                "text": current_chunk["text"].strip(),
-                "speaker": current_chunk["speaker"],
-                "speakers": list(current_chunk["speakers"]),
-                "start_time": current_chunk["start_time"],
-                "end_time": current_chunk["end_time"],
-                "segment_count": current_chunk["segment_count"]
-            })
-        # Reset current chunk
-        current_chunk["text"] = ""
-        current_chunk["speaker"] = None
-        current_chunk["speakers"] = set()
-        current_chunk["start_time"] = None
-        current_chunk["end_time"] = None
-        current_chunk["segment_count"] = 0
+    cur_parts = []
+    cur_len = 0
+    cur_speaker = None
+    cur_speakers = None  # only allocated once a second speaker joins the chunk
+    cur_start = None
+    cur_end = None
+    cur_segcount = 0
+    overlap = ""
+    prev_text = prev_speaker = None
     
     # Process segments with semantic grouping
     for segment in speaker_data:
@@ -73,135 +91,252 @@ def process_transcript_to_documents(
             continue
         
         speaker = segment.get("speaker", "UNKNOWN")
+        # Whisper hallucination loops repeat a segment verbatim (often over
+        # silence); embedding the copies only adds noise
+        if text == prev_text and speaker == prev_speaker:
+            continue
+        prev_text, prev_speaker = text, speaker
         start = segment.get("start", 0)
         end = segment.get("end", 0)
         
         # Initialize chunk if empty
-        if current_chunk["speaker"] is None:
-            current_chunk["speaker"] = speaker
-            current_chunk["start_time"] = start
+        if cur_speaker is None:
+            cur_speaker = speaker
+            cur_start = start
         
         # Check if we should finalize the current chunk
-        current_length = len(current_chunk["text"])
-        new_length = current_length + len(text) + 1  # +1 for space
+        new_length = cur_len + len(text) + 1  # +1 for space
         
         should_finalize = False
         
         # Finalize if we exceed max_chunk_size
-        if new_length > max_chunk_size and current_length >= min_chunk_size:
+        if new_length > max_chunk_size and cur_len >= min_chunk_size:
             should_finalize = True
         
         # Finalize if speaker changes AND we've met min_chunk_size
-        elif speaker != current_chunk["speaker"] and current_length >= min_chunk_size:
+        elif speaker != cur_speaker and cur_len >= min_chunk_size:
             should_finalize = True
         
         if should_finalize:
-            finalize_chunk()
+            chunk, chunk_text = _finalize_chunk(cur_parts, overlap, cur_speaker, cur_speakers, cur_start, cur_end, cur_segcount)
+            if chunk:
+                chunks.extend(_split_oversized_chunk(chunk, chunk_text, overlap, max_chunk_size, chunk_overlap))
+                # Seed the next chunk with the tail of this one (overlap applied inline)
+                if chunk_overlap > 0:
+                    overlap = chunk_text[-chunk_overlap:].strip()
             # Start new chunk with current segment
-            current_chunk["speaker"] = speaker
-            current_chunk["start_time"] = start
+            cur_parts = []
+            cur_len = 0
+            cur_speakers = None
+            cur_segcount = 0
+            cur_speaker = speaker
+            cur_start = start
         
         # Add segment to current chunk
-        if current_chunk["text"]:
-            current_chunk["text"] += " " + text
-        else:
-            current_chunk["text"] = text
+        if cur_parts:
+            cur_len += 1  # joining space
+        cur_parts.append(text)
+        cur_len += len(text)
         
-        current_chunk["speakers"].add(speaker)
-        current_chunk["end_time"] = end
-        current_chunk["segment_count"] += 1
+        if speaker != cur_speaker:
+            if cur_speakers is None:
+                cur_speakers = {cur_speaker, speaker}
+            else:
+                cur_speakers.add(speaker)
+        cur_end = end
+        cur_segcount += 1
     
     # Finalize the last chunk
-    finalize_chunk()
+    chunk, chunk_text = _finalize_chunk(cur_parts, overlap, cur_speaker, cur_speakers, cur_start, cur_end, cur_segcount)
+    if chunk:
+        # Fold a tiny trailing chunk into its predecessor (5% slack over max)
+        # instead of embedding a context-poor fragment on its own
+        if (chunks and len(chunk_text) < min_chunk_size
+                and len(chunks[-1]["text"]) + 1 + len(chunk_text) <= int(max_chunk_size * 1.05)):
+            _merge_tail_chunk(chunks[-1], chunk, chunk_text)
+        else:
+            chunks.extend(_split_oversized_chunk(chunk, chunk_text, overlap, max_chunk_size, chunk_overlap))
     
-    # Apply overlap between chunks
-    chunks_with_overlap = _apply_overlap(chunks, chunk_overlap)
+    # Meeting-level metadata is identical for every chunk, so build it once
+    base_metadata = _meeting_base_metadata(meeting_id, meeting_metadata)
     
     # Convert chunks to LangChain Documents with rich metadata
-    documents = []
-    total_chunks = len(chunks_with_overlap)
+    total_chunks = len(chunks)
+    for idx, chunk in enumerate(chunks):
+        yield _make_doc(chunk, idx, total_chunks, base_metadata)
+
+
+def _meeting_base_metadata(meeting_id, meeting_metadata):
+    """
+    Build the meeting-level metadata shared by every chunk of a meeting.
+    
+    The speaker mapping is serialized (with orjson) exactly once here.
+    Note: Pinecone only accepts string/number/boolean/list metadata, so we convert dicts to JSON strings
+    """
+    today = datetime.now().strftime("%Y-%m-%d")  # default for missing dates, formatted once
+    speaker_mapping = meeting_metadata.get("speaker_mapping", {})
+    speaker_mapping_json = orjson.dumps(speaker_mapping).decode() if speaker_mapping else "{}"  # Convert dict to JSON string
     
-    for idx, chunk in enumerate(chunks_with_overlap):
-        # Build comprehensive metadata with all available fields
-        # Note: Pinecone only accepts string/number/boolean/list metadata, so we convert dicts to JSON strings
-        speaker_mapping = meeting_metadata.get("speaker_mapping", {})
-        speaker_mapping_json = json.dumps(speaker_mapping) if speaker_mapping else "{}"  # Convert dict to JSON string
+    return {
+        # Meeting Identification
+        "meeting_id": meeting_id,
+        "meeting_date": meeting_metadata.get("meeting_date", today),
+        "meeting_title": meeting_metadata.get("meeting_title", ""),
+        "summary": meeting_metadata.get("summary", ""),  # ✅ Added summary
+        "meeting_duration": meeting_metadata.get("duration", "N/A"),  # ✅ Added total meeting duration
+        "speaker_mapping": speaker_mapping_json,  # ✅ Converted to JSON string for Pinecone compatibility
         
-        metadata = {
-            # Meeting Identification
-            "meeting_id": meeting_id,
-            "meeting_date": meeting_metadata.get("meeting_date", datetime.now().strftime("%Y-%m-%d")),
-            "meeting_title": meeting_metadata.get("meeting_title", ""),
-            "summary": meeting_metadata.get("summary", ""),  # ✅ Added summary
+        # Source Information
+        "source": meeting_metadata.get("source", "unknown"),  # ✅ Added source type
+        "source_file": meeting_metadata.get("source_file", ""),
+        "transcription_model": meeting_metadata.get("transcription_model", "whisperx"),
+        "language": meeting_metadata.get("language", "en"),
+        "date_transcribed": meeting_metadata.get("date_transcribed", today),  # ✅ Added transcription date
+    }
+
+
+def _make_doc(chunk, idx, total_chunks, base_metadata):
+    """
+    Build the Document for one grouped chunk.
+    Only the chunk-specific fields are added on top of the shared base metadata.
+    """
+    text = chunk["text"]
+    speakers = chunk["speakers"]
+    start = chunk["start_time"]
+    end = chunk["end_time"]
+    return Document(
+        page_content=text,
+        metadata={
+            **base_metadata,
             
             # Temporal Information
-            "start_time": chunk["start_time"],
-            "end_time": chunk["end_time"],
-            "duration": chunk["end_time"] - chunk["start_time"],
-            "start_time_formatted": _format_timestamp(chunk["start_time"]),
-            "end_time_formatted": _format_timestamp(chunk["end_time"]),
-            "meeting_duration": meeting_metadata.get("duration", "N/A"),  # ✅ Added total meeting duration
+            "start_time": start,
+            "end_time": end,
+            "duration": end - start,
+            "start_time_formatted": _format_timestamp(start),
+            "end_time_formatted": _format_timestamp(end),
             
             # Speaker Information
             "speaker": chunk["speaker"],
-            "speakers": chunk["speakers"],
-            "speaker_count": len(chunk["speakers"]),
-            "speaker_mapping": speaker_mapping_json,  # ✅ Converted to JSON string for Pinecone compatibility
+            "speakers": speakers,
+            "speaker_count": len(speakers),
             
             # Content Metadata
-            "chunk_type": "conversation_turn" if len(chunk["speakers"]) == 1 else "mixed_speakers",
+            "chunk_type": "conversation_turn" if len(speakers) == 1 else "mixed_speakers",
             "chunk_index": idx,
             "total_chunks": total_chunks,
-            "word_count": len(chunk["text"].split()),
-            "char_count": len(chunk["text"]),
+            "word_count": _word_count(text),
+            "char_count": len(text),
             "segment_count": chunk["segment_count"],
-            
-            # Source Information
-            "source": meeting_metadata.get("source", "unknown"),  # ✅ Added source type
-            "source_file": meeting_metadata.get("source_file", ""),
-            "transcription_model": meeting_metadata.get("transcription_model", "whisperx"),
-            "language": meeting_metadata.get("language", "en"),
-            "date_transcribed": meeting_metadata.get("date_transcribed", datetime.now().strftime("%Y-%m-%d")),  # ✅ Added transcription date
-        }
-        
-        doc = Document(page_content=chunk["text"], metadata=metadata)
-        documents.append(doc)
+        },
+    )
+
+
+def _finalize_chunk(parts, overlap, speaker, speakers, start_time, end_time, segment_count):
+    """
+    Build a chunk dict from accumulated segment state.
+    `speakers` is None for single-speaker chunks.
     
-    return documents
+    Parts are already stripped and non-empty, so the joined text needs no
+    further trimming.
+    
+    Returns:
+        tuple: (chunk dict or None if empty, the chunk's own text without the overlap prefix)
+    """
+    if not parts:
+        return None, ""
+    text = " ".join(parts)
+    chunk = {
+        "text": " ".join((overlap, text)) if overlap else text,
+        "speaker": speaker,
+        "speakers": [speaker] if speakers is None else list(speakers),
+        "start_time": start_time,
+        "end_time": end_time,
+        "segment_count": segment_count
+    }
+    return chunk, text
+
+
+def _merge_tail_chunk(previous, tail, tail_text):
+    """
+    Merge the final chunk into the one before it, in place.
+    Only the tail's own text is appended, so its overlap prefix isn't duplicated.
+    """
+    previous["text"] = f"{previous['text']} {tail_text}"
+    previous["speakers"] = previous["speakers"] + [s for s in tail["speakers"] if s not in previous["speakers"]]
+    previous["end_time"] = tail["end_time"]
+    previous["segment_count"] += tail["segment_count"]
 
 
-def _apply_overlap(chunks, overlap_size):
+def _split_oversized_chunk(chunk, text, overlap, max_chunk_size, chunk_overlap):
     """
-    Apply overlap between consecutive chunks by including trailing text from previous chunk.
+    Re-split a chunk whose own text exceeds max_chunk_size.
+    
+    A single long segment (or one pushed in while the chunk was still below
+    min_chunk_size) can exceed the limit and get truncated by the embedding
+    model. Sub-chunks inherit the speaker metadata and get start/end times
+    interpolated by their position in the text; only the first one carries
+    the overlap prefix from the previous chunk.
     
-    Args:
-        chunks (list): List of chunk dictionaries.
-        overlap_size (int): Number of characters to overlap.
-        
     Returns:
-        list: Chunks with overlap applied.
+        list[dict]: [chunk] unchanged if it fits, otherwise the sub-chunks.
     """
-    if overlap_size <= 0 or len(chunks) <= 1:
-        return chunks
+    if len(text) <= max_chunk_size:
+        return [chunk]
     
-    overlapped_chunks = [chunks[0]]  # First chunk has no overlap
+    pieces = _get_splitter(max_chunk_size, chunk_overlap).split_text(text)
+    start_time = chunk["start_time"]
+    duration = chunk["end_time"] - start_time
+    total_length = sum(len(piece) for piece in pieces)
     
-    for i in range(1, len(chunks)):
-        current = chunks[i].copy()
-        previous = chunks[i - 1]
-        
-        # Get overlap text from previous chunk
-        overlap_text = previous["text"][-overlap_size:].strip()
-        
-        # Prepend overlap to current chunk
-        if overlap_text:
-            current["text"] = overlap_text + " " + current["text"]
-            # Update start_time to include overlap context (keep previous chunk's end region)
-            # Note: We keep the original start_time for temporal accuracy
-        
-        overlapped_chunks.append(current)
+    sub_chunks = []
+    position = 0
+    for idx, piece in enumerate(pieces):
+        piece_start = start_time + duration * position / total_length
+        position += len(piece)
+        sub_chunks.append({
+            **chunk,
+            "text": " ".join((overlap, piece)) if overlap and idx == 0 else piece,
+            "start_time": piece_start,
+            "end_time": start_time + duration * position / total_length,
+        })
+    sub_chunks[-1]["end_time"] = chunk["end_time"]  # avoid float drift on the last boundary
+    return sub_chunks
+
+
+@functools.lru_cache(maxsize=8)
+def _get_splitter(chunk_size, chunk_overlap):
+    """
+    Return a shared RecursiveCharacterTextSplitter for the given sizes.
+    
+    The splitter is stateless between split_text calls, so one instance per
+    (chunk_size, chunk_overlap) pair is reused across uploads.
+    """
+    return RecursiveCharacterTextSplitter(
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap
+    )
+
+
+def _merge_small_chunks(texts, min_chunk_size, max_chunk_size):
+    """
+    Greedily merge undersized splitter outputs into their successor.
     
-    return overlapped_chunks
+    A chunk shorter than min_chunk_size absorbs the following ones as long as
+    the result stays within max_chunk_size, so fewer chunks get embedded.
+    """
+    merged = []
+    buffer = ""
+    for text in texts:
+        if buffer and len(buffer) < min_chunk_size and len(buffer) + 1 + len(text) <= max_chunk_size:
+            buffer = f"{buffer} {text}"
+        else:
+            if buffer:
+                merged.append(buffer)
+            buffer = text
+    if buffer:
+        merged.append(buffer)
+    return merged
 
 
 def _fallback_chunking(transcript_text, meeting_id, meeting_metadata, min_chunk_size, max_chunk_size, chunk_overlap):
@@ -222,46 +357,31 @@ def _fallback_chunking(transcript_text, meeting_id, meeting_metadata, min_chunk_
     """
     meeting_metadata = meeting_metadata or {}
     
-    text_splitter = RecursiveCharacterTextSplitter(
-        chunk_size=max_chunk_size,
-        chunk_overlap=chunk_overlap
-    )
-    
     # Create comprehensive base metadata with consistent field names
-    # Note: Pinecone only accepts string/number/boolean/list metadata, so we convert dicts to JSON strings
-    speaker_mapping = meeting_metadata.get("speaker_mapping", {})
-    speaker_mapping_json = json.dumps(speaker_mapping) if speaker_mapping else "{}"  # Convert dict to JSON string
-    
-    base_metadata = {
-        "meeting_id": meeting_id,
-        "meeting_date": meeting_metadata.get("meeting_date", datetime.now().strftime("%Y-%m-%d")),
-        "meeting_title": meeting_metadata.get("meeting_title", ""),
-        "summary": meeting_metadata.get("summary", ""),  # ✅ Added summary
-        "chunk_type": "full_transcript_chunk",
-        "source": meeting_metadata.get("source", "unknown"),  # ✅ Added source
-        "source_file": meeting_metadata.get("source_file", ""),
-        "transcription_model": meeting_metadata.get("transcription_model", "whisperx"),
-        "language": meeting_metadata.get("language", "en"),
-        "date_transcribed": meeting_metadata.get("date_transcribed", datetime.now().strftime("%Y-%m-%d")),  # ✅ Added transcription date
-        "speaker_mapping": speaker_mapping_json,  # ✅ Converted to JSON string for Pinecone compatibility
-        "meeting_duration": meeting_metadata.get("duration", "N/A"),  # ✅ Added duration
-    }
+    base_metadata = _meeting_base_metadata(meeting_id, meeting_metadata)
+    base_metadata["chunk_type"] = "full_transcript_chunk"
     
     # Split text into chunks
-    texts = text_splitter.split_text(transcript_text)
+    if len(transcript_text) <= max_chunk_size:
+        # Fits in a single chunk - skip the splitter (same result as split_text)
+        stripped = transcript_text.strip()
+        texts = [stripped] if stripped else []
+    else:
+        texts = _get_splitter(max_chunk_size, chunk_overlap).split_text(transcript_text)
+        texts = _merge_small_chunks(texts, min_chunk_size, max_chunk_size)
     
     # Create documents with metadata
     documents = []
     total_chunks = len(texts)
     
     for idx, text in enumerate(texts):
-        metadata = base_metadata.copy()
-        metadata.update({
+        metadata = {
+            **base_metadata,
             "chunk_index": idx,
             "total_chunks": total_chunks,
-            "word_count": len(text.split()),
+            "word_count": _word_count(text),
             "char_count": len(text),
-        })
+        }
         
         doc = Document(page_content=text, metadata=metadata)
         documents.append(doc)
@@ -269,6 +389,20 @@ def _fallback_chunking(transcript_text, meeting_id, meeting_metadata, min_chunk_
     return documents
 
 
+def _word_count(text):
+    """
+    Count whitespace-separated words without building the list of words.
+    
+    Equivalent to len(text.split()); the cheap space count is used whenever
+    the text is single-space separated, otherwise falls back to split().
+    """
+    if not text:
+        return 0
+    if text[0].isspace() or text[-1].isspace() or _IRREGULAR_WS.search(text):
+        return len(text.split())
+    return text.count(" ") + 1
+
+
 def _format_timestamp(seconds):
     """
     Convert seconds to MM:SS format.
@@ -279,8 +413,13 @@ def _format_timestamp(seconds):
     Returns:
         str: Formatted timestamp (MM:SS).
     """
-    if seconds is None:
+    if not seconds:  # None or 0 (the first chunk always starts here)
         return "00:00"
-    minutes = int(seconds // 60)
-    secs = int(seconds % 60)
+    return _format_whole_seconds(int(seconds))
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_whole_seconds(seconds):
+    """Format whole seconds as MM:SS (memoized; chunk boundaries repeat across start/end)."""
+    minutes, secs = divmod(seconds, 60)
     return f"{minutes:02d}:{secs:02d}"
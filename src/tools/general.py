@@ -8,16 +8,48 @@ Tools follow the official @tool decorator pattern from LangChain.
 Reference: https://docs.langchain.com/oss/python/langchain/tools#create-tools
 """
 
+import asyncio
+import hashlib
+import os
 from typing import List, Dict, Any, Optional
 from datetime import datetime
-import uuid
-import requests
-from langchain.tools import tool
-from langchain_core.documents import Document
+import secrets
+import orjson
+from langchain.tools import StructuredTool, tool
 
 from src.retrievers.pipeline import process_transcript_to_documents
-from src.processing.metadata_extractor import MetadataExtractor
+from src.processing.metadata_extractor import get_metadata_extractor
 from src.config.settings import Config
+from src.utils.notion import get_notion_async_client, get_notion_client
+from src.utils.cache import (
+    canonicalize_query, metadata_cache, search_cache, semantic_search_cache, write_json_atomic,
+)
+
+# Max Notion requests in flight during an async import (the client itself
+# paces requests to the ~3 req/s API limit)
+NOTION_MAX_CONCURRENCY = 3
+# Notion block types that carry a rich_text array
+NOTION_TEXT_BLOCK_TYPES = frozenset({
+    "paragraph", "heading_1", "heading_2", "heading_3", "bulleted_list_item",
+    "numbered_list_item", "to_do", "toggle", "code", "quote", "callout", "template",
+})
+
+# Output layouts for search_meetings / list_recent_meetings, compiled once
+SEGMENT_TEMPLATE = (
+    "\n--- Segment {i} ---\n"
+    "Meeting: {meeting_title} (ID: {meeting_id})\n"
+    "Date: {meeting_date}\n"
+    "Summary: {summary}\n"
+    "Speakers: {speakers}\n"
+    "Chunk: {chunk_index}\n"
+    "Content:\n{content}\n"
+).format
+MEETING_LINE_TEMPLATE = (
+    "\n{i}. {meeting_id}\n"
+    "   Date: {date}\n"
+    "   Title: {title}\n"
+    "   Source: {source_file}"
+).format
 
 # Global reference to PineconeManager (will be set during initialization)
 _pinecone_manager = None
@@ -65,45 +97,67 @@ def search_meetings(query: str, max_results: int = 5, meeting_id: Optional[str]
         if meeting_id:
             search_kwargs["filter"] = {"meeting_id": {"$eq": meeting_id}}
         
-        # Get retriever and perform search
-        retriever = _pinecone_manager.get_retriever(
-            namespace=Config.PINECONE_NAMESPACE,
-            search_kwargs=search_kwargs
-        )
-        
-        docs = retriever.invoke(query)
+        # Rephrasings of the same question share a cache entry; the filters
+        # are part of the key so a cached hit never widens or narrows the search
+        cache_key = (canonicalize_query(query), Config.PINECONE_NAMESPACE, max_results, meeting_id)
+        cached = search_cache.get(cache_key)
+        
+        if cached is None:
+            # Paraphrases that canonicalize differently can still match on the
+            # query embedding (which the retriever below reuses from its cache)
+            scope = cache_key[1:]
+            query_vector = _pinecone_manager.embeddings.embed_query(query)
+            cached = semantic_search_cache.get(scope, query_vector)
+            
+            if cached is None:
+                # Get retriever and perform search (with the original query text)
+                retriever = _pinecone_manager.get_retriever(
+                    namespace=Config.PINECONE_NAMESPACE,
+                    search_kwargs=search_kwargs
+                )
+                
+                docs = retriever.invoke(query)
+                
+                # Drop chunks with identical content (overlapping uploads) so they don't waste prompt tokens
+                seen = set()
+                unique_docs = []
+                for doc in docs:
+                    content_hash = hash(doc.page_content)
+                    if content_hash in seen:
+                        continue
+                    seen.add(content_hash)
+                    unique_docs.append(doc)
+                # Stored as plain dicts so the Redis layer can serialize them
+                cached = [{"page_content": d.page_content, "metadata": d.metadata} for d in unique_docs]
+                semantic_search_cache.set(scope, query_vector, cached)
+            
+            search_cache.set(cache_key, cached)
         
-        if not docs:
+        if not cached:
             return "No relevant meeting segments found for your query."
         
-        # Format results
-        result_parts = [f"Found {len(docs)} relevant meeting segments:\n"]
-        
-        for i, doc in enumerate(docs, 1):
-            metadata = doc.metadata
-            meeting_id = metadata.get("meeting_id", "unknown")
-            meeting_date = metadata.get("meeting_date", "N/A")  # Fixed missing variable
-            meeting_title = metadata.get("meeting_title", "Untitled") # Added title
-            chunk_index = metadata.get("chunk_index", "?")
-            summary = metadata.get("summary", "N/A")
-            speakers = metadata.get("speaker_mapping", "N/A")
-            
-            result_parts.append(
-                f"\n--- Segment {i} ---\n"
-                f"Meeting: {meeting_title} (ID: {meeting_id})\n"
-                f"Date: {meeting_date}\n"
-                f"Summary: {summary}\n"
-                f"Speakers: {speakers}\n"
-                f"Chunk: {chunk_index}\n"
-                f"Content:\n{doc.page_content}\n"
-            )
-        
-        return "".join(result_parts)
+        # Format results straight from the cached dicts
+        return f"Found {len(cached)} relevant meeting segments:\n" + "".join(
+            _format_segment(i, doc["metadata"], doc["page_content"]) for i, doc in enumerate(cached, 1)
+        )
         
     except Exception as e:
         return f"Error searching meetings: {str(e)}"
 
 
+def _format_segment(i: int, metadata: Dict[str, Any], content: str) -> str:
+    return SEGMENT_TEMPLATE(
+        i=i,
+        meeting_id=metadata.get("meeting_id", "unknown"),
+        meeting_date=metadata.get("meeting_date", "N/A"),
+        meeting_title=metadata.get("meeting_title", "Untitled"),
+        chunk_index=metadata.get("chunk_index", "?"),
+        summary=metadata.get("summary", "N/A"),
+        speakers=metadata.get("speaker_mapping", "N/A"),
+        content=content,
+    )
+
+
 @tool
 def get_meeting_metadata(meeting_id: str) -> str:
     """
@@ -125,23 +179,14 @@ def get_meeting_metadata(meeting_id: str) -> str:
         return "Error: Pinecone service is not initialized. Cannot retrieve metadata."
     
     try:
-        # Search for any document from this meeting to get metadata
-        retriever = _pinecone_manager.get_retriever(
-            namespace=Config.PINECONE_NAMESPACE,
-            search_kwargs={
-                "k": 1,
-                "filter": {"meeting_id": {"$eq": meeting_id}}
-            }
-        )
-        
-        # Use a generic query to get any chunk from this meeting
-        docs = retriever.invoke("meeting content")
-        
-        if not docs:
-            return f"No meeting found with ID: {meeting_id}"
-        
-        # Extract metadata from the first document
-        metadata = docs[0].metadata
+        # Metadata doesn't change after ingest, so repeat lookups skip the search
+        cache_key = (Config.PINECONE_NAMESPACE, meeting_id)
+        metadata = metadata_cache.get(cache_key)
+        if metadata is None:
+            metadata = _fetch_meeting_metadata(meeting_id)
+            if metadata is None:
+                return f"No meeting found with ID: {meeting_id}"
+            metadata_cache.set(cache_key, metadata)
         
         result_parts = [
             f"Meeting Information for {meeting_id}:\n",
@@ -161,6 +206,29 @@ def get_meeting_metadata(meeting_id: str) -> str:
         return f"Error retrieving meeting metadata: {str(e)}"
 
 
+def _fetch_meeting_metadata(meeting_id):
+    """Return the meeting's metadata, or None if it doesn't exist."""
+    # The per-meeting record is a direct ID lookup (no embedding or search)
+    record = _pinecone_manager.get_meeting_record(meeting_id, namespace=Config.PINECONE_NAMESPACE)
+    if record is not None:
+        return record
+    
+    # Meetings ingested before records existed: search for any chunk instead
+    retriever = _pinecone_manager.get_retriever(
+        namespace=Config.PINECONE_NAMESPACE,
+        search_kwargs={
+            "k": 1,
+            "filter": {"meeting_id": {"$eq": meeting_id}}
+        }
+    )
+    
+    # Use a generic query to get any chunk from this meeting
+    docs = retriever.invoke("meeting content")
+    
+    # Extract metadata from the first document
+    return docs[0].metadata if docs else None
+
+
 @tool
 def list_recent_meetings(limit: int = 10) -> str:
     """
@@ -182,55 +250,40 @@ def list_recent_meetings(limit: int = 10) -> str:
         return "Error: Pinecone service is not initialized. Cannot list meetings."
     
     try:
-        # Get retriever with high k to fetch many documents
-        retriever = _pinecone_manager.get_retriever(
+        # Scan vector metadata directly (no query embedding, no vector values)
+        meetings = _pinecone_manager.list_meetings(
             namespace=Config.PINECONE_NAMESPACE,
-            search_kwargs={"k": 500}  # Fetch many to find unique meetings
+            limit=500  # Scan many vectors to find unique meetings
         )
         
-        # Use a generic query to get documents
-        docs = retriever.invoke("meeting")
+        # Most recent first
+        meetings.sort(key=lambda m: m.get("meeting_date") or "", reverse=True)
         
-        if not docs:
-            return "No meetings found in the system."
+        meetings = meetings[:limit]
         
-        # Extract unique meetings
-        meetings_dict = {}
-        for doc in docs:
-            metadata = doc.metadata
-            meeting_id = metadata.get("meeting_id")
-            
-            if meeting_id and meeting_id not in meetings_dict:
-                meetings_dict[meeting_id] = {
-                    "date": metadata.get("meeting_date", "N/A"),  # ✅ Fixed: was "date"
-                    "title": metadata.get("meeting_title", "N/A"),  # ✅ Fixed: was "title"
-                    "source_file": metadata.get("source_file", "N/A")
-                }
-            
-            # Stop if we've found enough unique meetings
-            if len(meetings_dict) >= limit:
-                break
-        
-        if not meetings_dict:
+        if not meetings:
             return "No meetings found in the system."
         
         # Format results
-        result_parts = [f"Found {len(meetings_dict)} recent meetings:\n"]
-        
-        for i, (meeting_id, info) in enumerate(meetings_dict.items(), 1):
-            result_parts.append(
-                f"\n{i}. {meeting_id}\n"
-                f"   Date: {info['date']}\n"
-                f"   Title: {info['title']}\n"
-                f"   Source: {info['source_file']}"
-            )
-        
-        return "\n".join(result_parts)
+        return "\n".join([
+            f"Found {len(meetings)} recent meetings:\n",
+            *(_format_meeting_line(i, m) for i, m in enumerate(meetings, 1)),
+        ])
         
     except Exception as e:
         return f"Error listing meetings: {str(e)}"
 
 
+def _format_meeting_line(i: int, meeting: Dict[str, Any]) -> str:
+    return MEETING_LINE_TEMPLATE(
+        i=i,
+        meeting_id=meeting["meeting_id"],
+        date=meeting.get("meeting_date") or "N/A",
+        title=meeting.get("meeting_title", "N/A"),
+        source_file=meeting.get("source_file", "N/A"),
+    )
+
+
 @tool
 def get_current_time() -> str:
     """
@@ -245,8 +298,191 @@ def get_current_time() -> str:
     return datetime.now().strftime("%Y-%m-%d %H:%M")
 
 
-@tool
-def import_notion_to_pinecone(query: str) -> str:
+def _page_title(page: Dict[str, Any]) -> str:
+    """Extract the plain-text title of a Notion page ("" if it has none)."""
+    props = page.get("properties", {})
+    # Fast path: standalone pages key their title property as "title";
+    # database pages use the column name, so fall back to scanning by id
+    title_prop = props.get("title")
+    if not title_prop or title_prop.get("id") != "title":
+        title_prop = next((v for v in props.values() if v.get("id") == "title"), None)
+    if title_prop and title_prop.get("title"):
+        return "".join([t.get("plain_text", "") for t in title_prop["title"]])
+    return ""
+
+
+def _select_notion_page(results: List[Dict[str, Any]], query: str):
+    """
+    Pick the best search result for the query: exact title match first,
+    then the first substring match.
+    
+    Returns:
+        (page, title, None) on success, or (None, None, error message) when nothing matches.
+    """
+    exact_match = None
+    substring_match = None
+    query_clean = query.lower().strip()
+    # Each title is extracted once and reused for matching, the result and errors
+    titles = [_page_title(p) for p in results]
+    
+    for p, p_title in zip(results, titles):
+        p_title_clean = p_title.lower().strip()
+        
+        # Check 1: Exact Match
+        if p_title_clean == query_clean:
+            exact_match = (p, p_title)
+            print(f"✅ Exact match found: '{p_title}'")
+            break # Found the perfect match
+        
+        # Check 2: Substring Match (save the first one found)
+        if query_clean in p_title_clean and substring_match is None:
+            substring_match = (p, p_title)
+            print(f"🔍 Substring match candidate: '{p_title}'")
+        
+        # Print for debugging
+        print(f"   - Found result: '{p_title}'")
+    
+    # Decide which page to use
+    if exact_match:
+        return exact_match[0], exact_match[1], None
+    if substring_match:
+        print("⚠️ Using substring match.")
+        return substring_match[0], substring_match[1], None
+    
+    # Generate list of titles found to guide the user
+    titles_found = [title for title in titles if title]
+    return None, None, f"❌ Could not find a specific match for '{query}'. Found these pages instead: {', '.join(titles_found)}. Please try again with the exact name."
+
+
+def _block_plain_text(block: Dict[str, Any]) -> str:
+    """Concatenate the rich_text of a block ("" for blocks without text)."""
+    b_type = block.get("type")
+    # One set lookup rejects images, dividers, child pages, ... up front
+    if b_type not in NOTION_TEXT_BLOCK_TYPES:
+        return ""
+    rich_text = block[b_type].get("rich_text")
+    if not rich_text:
+        return ""
+    # A list comprehension is faster than a generator inside str.join
+    # (join materializes its argument anyway)
+    return "".join([t.get("plain_text", "") for t in rich_text])
+
+
+def _notion_search_payload(query: str) -> Dict[str, Any]:
+    return {
+        "query": query,
+        "filter": {"value": "page", "property": "object"},
+        "sort": {"direction": "descending", "timestamp": "last_edited_time"},
+        "page_size": 25
+    }
+
+
+def _raise_for_blocks_status(resp, block_id: str):
+    """Fail the whole import rather than silently dropping a block's subtree."""
+    if resp.status_code != 200:
+        print(f"⚠️ Error fetching sub-blocks for {block_id}: {resp.text}")
+        raise RuntimeError(f"Notion returned {resp.status_code} while reading block {block_id}; nothing was imported.")
+
+
+def _fetch_blocks_recursive(client, block_id: str, depth: int = 0) -> List[str]:
+    """Recursive helper to fetch blocks and their children."""
+    if depth > 5: # Safety limit for recursion depth
+        return []
+        
+    collected_text = []
+    cursor = None
+    has_more = True
+    
+    while has_more:
+        params = {"page_size": 100}
+        if cursor:
+            params["start_cursor"] = cursor
+            
+        resp = client.get(f"/blocks/{block_id}/children", params=params)
+        _raise_for_blocks_status(resp, block_id)
+            
+        data = resp.json()
+        
+        for block in data.get("results", []):
+            # 1. Extract text from this block
+            plain_text = _block_plain_text(block)
+            if plain_text.strip():
+                collected_text.append(plain_text)
+
+            # 2. Check for children (Recursion)
+            if block.get("has_children", False):
+                collected_text.extend(_fetch_blocks_recursive(client, block["id"], depth + 1))
+
+        has_more = data.get("has_more", False)
+        cursor = data.get("next_cursor")
+        
+    return collected_text
+
+
+async def _afetch_blocks_recursive(client, block_id: str, depth: int = 0, limiter=None) -> List[str]:
+    """
+    Async twin of _fetch_blocks_recursive (same parsing, non-blocking I/O).
+    
+    The next page of children is requested as soon as its cursor is known,
+    and the children of a page's blocks are fetched concurrently, so the
+    pagination round-trips overlap with processing. `limiter` bounds the
+    requests in flight; the client paces them to Notion's rate limit.
+    """
+    if depth > 5: # Safety limit for recursion depth
+        return []
+    if limiter is None:
+        limiter = asyncio.Semaphore(NOTION_MAX_CONCURRENCY)
+    
+    async def fetch_page(cursor):
+        params = {"page_size": 100}
+        if cursor:
+            params["start_cursor"] = cursor
+        async with limiter:
+            return await client.get(f"/blocks/{block_id}/children", params=params)
+    
+    parts = []  # block texts and child-fetch tasks, in document order
+    next_page = asyncio.ensure_future(fetch_page(None))
+    try:
+        while next_page is not None:
+            resp = await next_page
+            next_page = None
+            _raise_for_blocks_status(resp, block_id)
+                
+            data = resp.json()
+            # Speculatively start the next page before processing this one
+            if data.get("has_more", False) and data.get("next_cursor"):
+                next_page = asyncio.ensure_future(fetch_page(data["next_cursor"]))
+            
+            for block in data.get("results", []):
+                plain_text = _block_plain_text(block)
+                if plain_text.strip():
+                    parts.append(plain_text)
+
+                if block.get("has_children", False):
+                    parts.append(asyncio.ensure_future(
+                        _afetch_blocks_recursive(client, block["id"], depth + 1, limiter)
+                    ))
+        
+        tasks = [part for part in parts if not isinstance(part, str)]
+        await asyncio.gather(*tasks)
+    finally:
+        # Don't leave requests running if a page failed or we were cancelled
+        pending = [part for part in parts if not isinstance(part, str) and not part.done()]
+        if next_page is not None:
+            pending.append(next_page)
+        for task in pending:
+            task.cancel()
+    
+    collected_text = []
+    for part in parts:
+        if isinstance(part, str):
+            collected_text.append(part)
+        else:
+            collected_text.extend(part.result())
+    return collected_text
+
+
+def _import_notion_to_pinecone(query: str) -> str:
     """
     Directly import a Notion page to Pinecone by name.
     
@@ -266,69 +502,54 @@ def import_notion_to_pinecone(query: str) -> str:
     if not Config.NOTION_TOKEN:
         return "❌ Error: NOTION_TOKEN not set in configuration."
 
-    headers = {
-        "Authorization": f"Bearer {Config.NOTION_TOKEN}",
-        "Notion-Version": "2022-06-28",
-        "Content-Type": "application/json"
-    }
-
-    def fetch_blocks_recursive(block_id: str, depth: int = 0) -> List[str]:
-        """Recursive helper to fetch blocks and their children."""
-        if depth > 5: # Safety limit for recursion depth
-            return []
+    try:
+        client = get_notion_client()
+        
+        # 1. Search for the page
+        print(f"🔍 Searching Notion for: {query}...")
+        response = client.post("/search", json=_notion_search_payload(query))
+        
+        if response.status_code != 200:
+            return f"❌ Notion Search Error: {response.text}"
             
-        collected_text = []
-        cursor = None
-        has_more = True
-        
-        while has_more:
-            blocks_url = f"https://api.notion.com/v1/blocks/{block_id}/children"
-            params = {"page_size": 100}
-            if cursor:
-                params["start_cursor"] = cursor
-                
-            resp = requests.get(blocks_url, headers=headers, params=params)
-            if resp.status_code != 200:
-                print(f"⚠️ Error fetching sub-blocks for {block_id}: {resp.text}")
-                return []
-                
-            data = resp.json()
-            blocks = data.get("results", [])
+        results = response.json().get("results", [])
+        if not results:
+            return f"❌ No Notion page found matching '{query}'."
             
-            for block in blocks:
-                # 1. Extract text from this block
-                b_type = block.get("type")
-                plain_text = ""
-                if b_type and block.get(b_type) and "rich_text" in block[b_type]:
-                    rich_text = block[b_type]["rich_text"]
-                    plain_text = "".join([t.get("plain_text", "") for t in rich_text])
-                
-                # Append text if present
-                if plain_text.strip():
-                    collected_text.append(plain_text)
+        page, title, error = _select_notion_page(results, query)
+        if error:
+            return error
+        
+        page_id = page["id"]
+        title = title or "Untitled"
+        print(f"📄 Found Page: '{title}' ({page_id})")
 
-                # 2. Check for children (Recursion)
-                if block.get("has_children", False):
-                    # Fetch children text and append
-                    children_text = fetch_blocks_recursive(block["id"], depth + 1)
-                    collected_text.extend(children_text)
+        # 2. Recursive Fetch of All Content
+        all_text_lines = _fetch_blocks_recursive(client, page_id)
+        
+        if not all_text_lines:
+             return f"⚠️ Page '{title}' found but appears empty or has no text blocks."
+
+        full_content = "\n\n".join(all_text_lines)
+        
+        # 3. Upsert to Pinecone
+        return upsert_text_to_pinecone.invoke({"text": full_content, "title": title, "source": "Notion"})
+
+    except Exception as e:
+        return f"❌ Import failed: {str(e)}"
 
-            has_more = data.get("has_more", False)
-            cursor = data.get("next_cursor")
-            
-        return collected_text
+
+async def _aimport_notion_to_pinecone(query: str) -> str:
+    """Async path of import_notion_to_pinecone, used when the agent awaits its tools."""
+    if not Config.NOTION_TOKEN:
+        return "❌ Error: NOTION_TOKEN not set in configuration."
 
     try:
+        client = get_notion_async_client()
+        
         # 1. Search for the page
         print(f"🔍 Searching Notion for: {query}...")
-        search_url = "https://api.notion.com/v1/search"
-        search_payload = {
-            "query": query,
-            "filter": {"value": "page", "property": "object"},
-            "sort": {"direction": "descending", "timestamp": "last_edited_time"},
-            "page_size": 25
-        }
-        response = requests.post(search_url, headers=headers, json=search_payload)
+        response = await client.post("/search", json=_notion_search_payload(query))
         
         if response.status_code != 200:
             return f"❌ Notion Search Error: {response.text}"
@@ -337,81 +558,38 @@ def import_notion_to_pinecone(query: str) -> str:
         if not results:
             return f"❌ No Notion page found matching '{query}'."
             
-        # Select best match
-        best_page = None
-        exact_match = None
-        substring_match = None
-        
-        for p in results:
-            # Extract title for this page
-            p_props = p.get("properties", {})
-            p_title_prop = next((v for k, v in p_props.items() if v["id"] == "title"), None)
-            p_title = ""
-            if p_title_prop and p_title_prop.get("title"):
-                 p_title = "".join([t.get("plain_text", "") for t in p_title_prop.get("title", [])])
-            
-            p_title_clean = p_title.lower().strip()
-            query_clean = query.lower().strip()
-            
-            # Check 1: Exact Match
-            if p_title_clean == query_clean:
-                exact_match = p
-                print(f"✅ Exact match found: '{p_title}'")
-                break # Found the perfect match
-            
-            # Check 2: Substring Match (save the first one found)
-            # Check 2: Substring Match (save the first one found)
-            if query_clean in p_title_clean and substring_match is None:
-                substring_match = p
-                print(f"🔍 Substring match candidate: '{p_title}'")
-            
-            # Print for debugging
-            print(f"   - Found result: '{p_title}'")
-        
-        # Decide which page to use
-        if exact_match:
-            best_page = exact_match
-        elif substring_match:
-            best_page = substring_match
-            print("⚠️ Using substring match.")
-        else:
-            # Generate list of titles found to guide the user
-            titles_found = []
-            for p in results:
-                p_props = p.get("properties", {})
-                p_title_prop = next((v for k, v in p_props.items() if v["id"] == "title"), None)
-                if p_title_prop and p_title_prop.get("title"):
-                     titles_found.append("".join([t.get("plain_text", "") for t in p_title_prop.get("title", [])]))
-            
-            return f"❌ Could not find a specific match for '{query}'. Found these pages instead: {', '.join(titles_found)}. Please try again with the exact name."
-            
-        page = best_page
-        page_id = page["id"]
+        page, title, error = _select_notion_page(results, query)
+        if error:
+            return error
         
-        # Re-extract title for the selected page for final usage
-        props = page.get("properties", {})
-        title_prop = next((v for k, v in props.items() if v["id"] == "title"), None)
-        title = "Untitled"
-        if title_prop and title_prop.get("title"):
-             title = "".join([t.get("plain_text", "") for t in title_prop.get("title", [])])
-             
+        page_id = page["id"]
+        title = title or "Untitled"
         print(f"📄 Found Page: '{title}' ({page_id})")
 
         # 2. Recursive Fetch of All Content
-        all_text_lines = fetch_blocks_recursive(page_id)
+        all_text_lines = await _afetch_blocks_recursive(client, page_id)
         
         if not all_text_lines:
              return f"⚠️ Page '{title}' found but appears empty or has no text blocks."
 
         full_content = "\n\n".join(all_text_lines)
         
-        # 3. Upsert to Pinecone
-        return upsert_text_to_pinecone.invoke({"text": full_content, "title": title, "source": "Notion"})
+        # 3. Upsert to Pinecone (blocking steps run in worker threads)
+        return await upsert_text_to_pinecone.ainvoke({"text": full_content, "title": title, "source": "Notion"})
 
     except Exception as e:
         return f"❌ Import failed: {str(e)}"
 
 
+# Sync and async entry points share the parsing helpers above; the agent's
+# ToolNode awaits the coroutine, other callers can still use .invoke()
+import_notion_to_pinecone = StructuredTool.from_function(
+    func=_import_notion_to_pinecone,
+    coroutine=_aimport_notion_to_pinecone,
+    name="import_notion_to_pinecone",
+)
+
+
 # Export all tools for easy import
 __all__ = [
     "initialize_tools",
@@ -443,12 +621,6 @@ def create_notion_page(title: str, content: str) -> str:
     if not Config.NOTION_TOKEN:
         return "❌ Error: NOTION_TOKEN not set."
 
-    headers = {
-        "Authorization": f"Bearer {Config.NOTION_TOKEN}",
-        "Notion-Version": "2022-06-28",
-        "Content-Type": "application/json"
-    }
-
     # Split content into chunks of 2000 chars (Notion block limit)
     chunks = [content[i:i+2000] for i in range(0, len(content), 2000)]
     
@@ -480,8 +652,8 @@ def create_notion_page(title: str, content: str) -> str:
     }
     
     try:
-        url = "https://api.notion.com/v1/pages"
-        resp = requests.post(url, headers=headers, json=payload)
+        # Pooled client: reuses the keep-alive connection from earlier Notion calls
+        resp = get_notion_client().post("/pages", json=payload)
         
         if resp.status_code == 200:
             data = resp.json()
@@ -494,8 +666,7 @@ def create_notion_page(title: str, content: str) -> str:
         return f"❌ Error creating page: {str(e)}"
 
 
-@tool
-def upsert_text_to_pinecone(text: str, title: str, source: str = "Manual Entry", date: str = None) -> str:
+def _upsert_text_to_pinecone(text: str, title: str, source: str = "Manual Entry", date: str = None) -> str:
     """
     Upsert any text content (e.g., Notion pages, manual notes) to Pinecone.
     
@@ -519,58 +690,153 @@ def upsert_text_to_pinecone(text: str, title: str, source: str = "Manual Entry",
         
     try:
         
+        # 0. Identical re-imports reuse the existing meeting
+        cache_path = _import_cache_path(text, title, source, date)
+        previous_id = _find_previous_import(cache_path)
+        if previous_id:
+            return _already_imported_result(title, previous_id)
+        
         # 1. Extract intelligent metadata
         print(f"🔍 Extracting metadata for '{title}'...")
-        extractor = MetadataExtractor()
+        extractor = get_metadata_extractor()
         extracted = extractor.extract_metadata(text)
         
-        # 2. Resolve final metadata values
-        final_summary = extracted.get("summary") or f"Imported from {source}"
+        # 2-5. Resolve metadata and chunk the text
+        docs, meeting_id, final_date, speaker_mapping = _build_text_documents(
+            extractor, extracted, text, title, source, date
+        )
         
-        # Date logic: Argument > Extracted > Today
-        if date:
-            final_date = date
-        elif extracted.get("meeting_date"):
-            final_date = extracted.get("meeting_date")
-        else:
-            final_date = datetime.now().strftime("%Y-%m-%d")
-            
-        speaker_mapping = extracted.get("speaker_mapping", {})
-            
-        # 3. Apply speaker mapping to text (improves searchability)
-        # Replaces "SPEAKER_00" -> "Name" directly in the text content
-        processed_text = extractor.apply_speaker_mapping(text, speaker_mapping)
-        
-        # 4. Generate ID and prepare metadata
-        meeting_id = f"doc_{uuid.uuid4().hex[:8]}"
-        
-        meeting_metadata = {
-            "meeting_id": meeting_id,
-            "meeting_date": final_date,
-            "date_transcribed": datetime.now().strftime("%Y-%m-%d"),
-            "source": source,
-            "meeting_title": title,
-            "summary": final_summary,
-            "source_file": f"{source.lower()}_upload",
-            "transcription_model": "text_import",
-            "language": "en",
-            "speaker_mapping": speaker_mapping
-        }
+        # 6. Upsert to Pinecone
+        _pinecone_manager.upsert_documents(docs, namespace=Config.PINECONE_NAMESPACE)
+        _remember_import(cache_path, meeting_id)
+        
+        return _upsert_text_result(title, meeting_id, final_date, speaker_mapping)
+        
+    except Exception as e:
+        return f"❌ Error saving to Pinecone: {str(e)}"
+
+
+async def _aupsert_text_to_pinecone(text: str, title: str, source: str = "Manual Entry", date: str = None) -> str:
+    """Async path of upsert_text_to_pinecone; the blocking LLM call runs in a worker thread."""
+    if not _pinecone_manager:
+        return "Error: Pinecone service is not initialized."
+        
+    try:
         
-        # 5. Process text into documents
-        docs = process_transcript_to_documents(
-            transcript_text=processed_text,
-            speaker_data=None, # Uses fallback chunking
-            meeting_id=meeting_id,
-            meeting_metadata=meeting_metadata
+        # 0. Identical re-imports reuse the existing meeting
+        cache_path = _import_cache_path(text, title, source, date)
+        previous_id = await asyncio.to_thread(_find_previous_import, cache_path)
+        if previous_id:
+            return _already_imported_result(title, previous_id)
+        
+        # 1. Extract intelligent metadata (blocking LLM call, kept off the event loop)
+        print(f"🔍 Extracting metadata for '{title}'...")
+        extractor = get_metadata_extractor()
+        extracted = await asyncio.to_thread(extractor.extract_metadata, text)
+        
+        # 2-5. Resolve metadata and chunk the text
+        docs, meeting_id, final_date, speaker_mapping = _build_text_documents(
+            extractor, extracted, text, title, source, date
         )
         
         # 6. Upsert to Pinecone
-        _pinecone_manager.upsert_documents(docs, namespace=Config.PINECONE_NAMESPACE)
+        await _pinecone_manager.aupsert_documents(docs, namespace=Config.PINECONE_NAMESPACE)
+        _remember_import(cache_path, meeting_id)
         
-        return (f"✅ Successfully saved '{title}' to Pinecone (ID: {meeting_id})\n"
-                f"   - Date: {final_date}\n"
-                f"   - Extracted Speakers: {', '.join(speaker_mapping.values()) if speaker_mapping else 'None'}")
+        return _upsert_text_result(title, meeting_id, final_date, speaker_mapping)
         
     except Exception as e:
         return f"❌ Error saving to Pinecone: {str(e)}"
+
+
+def _build_text_documents(extractor, extracted: Dict[str, Any], text: str, title: str, source: str, date: str):
+    """Resolve the final metadata for an imported text and split it into Documents."""
+    final_summary = extracted.get("summary") or f"Imported from {source}"
+    
+    # Date logic: Argument > Extracted > Today
+    if date:
+        final_date = date
+    elif extracted.get("meeting_date"):
+        final_date = extracted.get("meeting_date")
+    else:
+        final_date = datetime.now().strftime("%Y-%m-%d")
+        
+    speaker_mapping = extracted.get("speaker_mapping", {})
+        
+    # Apply speaker mapping to text (improves searchability)
+    # Replaces "SPEAKER_00" -> "Name" directly in the text content
+    processed_text = extractor.apply_speaker_mapping(text, speaker_mapping)
+    
+    # Generate ID and prepare metadata
+    meeting_id = "doc_" + secrets.token_hex(4)
+    
+    meeting_metadata = {
+        "meeting_id": meeting_id,
+        "meeting_date": final_date,
+        "date_transcribed": datetime.now().strftime("%Y-%m-%d"),
+        "source": source,
+        "meeting_title": title,
+        "summary": final_summary,
+        "source_file": f"{source.lower()}_upload",
+        "transcription_model": "text_import",
+        "language": "en",
+        "speaker_mapping": speaker_mapping
+    }
+    
+    # Process text into documents
+    docs = process_transcript_to_documents(
+        transcript_text=processed_text,
+        speaker_data=None, # Uses fallback chunking
+        meeting_id=meeting_id,
+        meeting_metadata=meeting_metadata
+    )
+    return docs, meeting_id, final_date, speaker_mapping
+
+
+def _import_cache_path(text: str, title: str, source: str, date: Optional[str]) -> str:
+    """Disk cache location for an import, keyed by namespace + arguments + content hash."""
+    key = "\0".join([Config.PINECONE_NAMESPACE, title, source, date or "", text])
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+    return os.path.join(Config.CACHE_DIR, "imports", f"{digest}.json")
+
+
+def _find_previous_import(cache_path: str) -> Optional[str]:
+    """Return the meeting_id of an identical earlier import that is still in Pinecone."""
+    try:
+        with open(cache_path, "rb") as f:
+            meeting_id = orjson.loads(f.read())["meeting_id"]
+    except (OSError, orjson.JSONDecodeError, KeyError, TypeError):
+        return None
+    
+    # The meeting may have been deleted since; then import it again
+    if _pinecone_manager.get_meeting_record(meeting_id, namespace=Config.PINECONE_NAMESPACE) is None:
+        return None
+    return meeting_id
+
+
+def _remember_import(cache_path: str, meeting_id: str):
+    """Record a finished import; failures only cost a cache miss."""
+    try:
+        write_json_atomic(cache_path, {"meeting_id": meeting_id})
+    except (OSError, TypeError) as e:
+        print(f"⚠️ Could not cache import record: {e}")
+
+
+def _already_imported_result(title: str, meeting_id: str) -> str:
+    print(f"⏭️ '{title}' already imported as {meeting_id}, skipping")
+    return f"✅ '{title}' is already saved in Pinecone (ID: {meeting_id}); identical content was not re-imported."
+
+
+def _upsert_text_result(title, meeting_id, final_date, speaker_mapping) -> str:
+    return (f"✅ Successfully saved '{title}' to Pinecone (ID: {meeting_id})\n"
+            f"   - Date: {final_date}\n"
+            f"   - Extracted Speakers: {', '.join(speaker_mapping.values()) if speaker_mapping else 'None'}")
+
+
+# The async path keeps the agent's event loop free while the extractor's
+# LLM call and the Pinecone upsert run; CLI callers keep using .invoke()
+upsert_text_to_pinecone = StructuredTool.from_function(
+    func=_upsert_text_to_pinecone,
+    coroutine=_aupsert_text_to_pinecone,
+    name="upsert_text_to_pinecone",
+)
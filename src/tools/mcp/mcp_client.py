@@ -4,8 +4,86 @@ MCP Client Manager for Notion Integration
 Manages connection to Notion MCP server and loads tools.
 """
 
+import asyncio
+import hashlib
+import os
+import time
+
+import orjson
+from langchain_core.tools import StructuredTool
 from langchain_mcp_adapters.client import MultiServerMCPClient
 from typing import List
+from src.config.settings import Config
+from src.utils.cache import write_json_atomic
+
+# How long a server's cached tool list is trusted before reconnecting at startup
+MCP_TOOL_CACHE_TTL = 3600
+
+
+def _tool_cache_path(server_name, config) -> str:
+    """Disk cache location for a server's tool schemas, keyed by its config hash."""
+    raw = orjson.dumps({server_name: config}, option=orjson.OPT_SORT_KEYS, default=str)
+    digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+    return os.path.join(Config.CACHE_DIR, "mcp", f"{digest}.json")
+
+
+def _load_tool_schemas(cache_path):
+    """Return cached tool schemas if present and fresh, else None."""
+    try:
+        if time.time() - os.path.getmtime(cache_path) > MCP_TOOL_CACHE_TTL:
+            return None
+        with open(cache_path, "rb") as f:
+            return orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+
+def _write_tool_schemas(cache_path, tools):
+    """Persist tool schemas; failures only cost a cache miss."""
+    schemas = [
+        {
+            "name": tool.name,
+            "description": tool.description,
+            "args_schema": tool.args_schema if isinstance(tool.args_schema, dict) else tool.args_schema.model_json_schema(),
+        }
+        for tool in tools
+    ]
+    try:
+        write_json_atomic(cache_path, schemas)
+    except (OSError, TypeError) as e:
+        print(f"⚠️ Could not cache MCP tool list: {e}")
+
+
+class _LazyServer:
+    """Loads an MCP server's real tools on the first call of one of its cached tools."""
+    
+    def __init__(self, client, server_name):
+        self.client = client
+        self.server_name = server_name
+        self.tools = None
+    
+    async def get_tool(self, tool_name):
+        if self.tools is None:
+            print(f"🔌 Connecting to MCP server '{self.server_name}'...")
+            server_tools = await self.client.get_tools(server_name=self.server_name)
+            self.tools = {tool.name: tool for tool in server_tools}
+        return self.tools[tool_name]
+
+
+def _lazy_tool(server, schema):
+    """Build a tool from a cached schema that forwards to the real MCP tool."""
+    tool_name = schema["name"]
+    
+    async def _call(**kwargs):
+        tool = await server.get_tool(tool_name)
+        return await tool.ainvoke(kwargs)
+    
+    return StructuredTool(
+        name=tool_name,
+        description=schema["description"],
+        args_schema=schema["args_schema"],
+        coroutine=_call,
+    )
 
 
 class MCPClientManager:
@@ -19,13 +97,13 @@ class MCPClientManager:
             server_configs: Dictionary of server configurations
         """
         self.server_configs = server_configs
-        self.clients = []  # List of active clients
+        self.client = None  # One client shared by every configured server
         self.tools = []
         self._initialized = False
     
     async def initialize(self):
         """
-        Initialize MCP clients and load tools sequentially.
+        Initialize the MCP client and load tools concurrently.
         
         Returns:
             bool: True if at least one server initialized successfully
@@ -38,35 +116,30 @@ class MCPClientManager:
             print("⚠️  No MCP servers configured")
             return False
         
-        print(f"🔌 Initializing {len(self.server_configs)} MCP server(s) sequentially...")
+        print(f"🔌 Initializing {len(self.server_configs)} MCP server(s) concurrently...")
         
-        success_count = 0
+        # A single client holds every server's connection settings; tools are
+        # still loaded per server so one failing server doesn't affect the others.
+        # Servers are contacted at once (startup takes the slowest handshake, not the sum)
+        self.client = MultiServerMCPClient(self.server_configs)
+        server_names = list(self.server_configs)
+        results = await asyncio.gather(
+            *(self._init_server(name, self.server_configs[name]) for name in server_names),
+            return_exceptions=True
+        )
         
-        # Iterate through each server config and initialize separately
-        for server_name, config in self.server_configs.items():
-            try:
-                print(f"   • Connecting to '{server_name}'...")
-                
-                # Create a client for just this server
-                # We wrap it in a single-entry dict because MultiServerMCPClient expects a dict
-                single_server_config = {server_name: config}
-                client = MultiServerMCPClient(single_server_config)
-                
-                # Connect and get tools
-                # This will only block for this specific server
-                server_tools = await client.get_tools()
-                
-                # Store successful client and tools
-                self.clients.append(client)
-                self.tools.extend(server_tools)
-                
-                print(f"   ✅ '{server_name}' connected! Loaded {len(server_tools)} tools")
-                success_count += 1
-                
-            except Exception as e:
-                print(f"   ❌ Failed to connect to '{server_name}': {e}")
+        success_count = 0
+        for server_name, result in zip(server_names, results):
+            if isinstance(result, Exception):
+                print(f"   ❌ Failed to connect to '{server_name}': {result}")
                 # We continue to the next server instead of failing everything
                 continue
+            
+            # Store successful tools (in config order)
+            self.tools.extend(result)
+            
+            print(f"   ✅ '{server_name}' connected! Loaded {len(result)} tools")
+            success_count += 1
         
         self._initialized = True
         
@@ -77,6 +150,27 @@ class MCPClientManager:
             print("❌ MCP initialization failed: No servers connected successfully")
             return False
     
+    async def _init_server(self, server_name, config):
+        """
+        Load a single server's tools.
+        
+        A fresh on-disk tool list (same server config) skips the handshake;
+        the server is then only contacted when one of its tools is called.
+        """
+        cache_path = _tool_cache_path(server_name, config)
+        schemas = _load_tool_schemas(cache_path)
+        if schemas is not None:
+            print(f"   • Using cached tool list for '{server_name}'")
+            server = _LazyServer(self.client, server_name)
+            return [_lazy_tool(server, schema) for schema in schemas]
+        
+        print(f"   • Connecting to '{server_name}'...")
+        
+        # Connect and get tools for just this server
+        server_tools = await self.client.get_tools(server_name=server_name)
+        _write_tool_schemas(cache_path, server_tools)
+        return server_tools
+    
     def get_langchain_tools(self):
         """Get loaded MCP tools in LangChain format."""
         if not self._initialized:
@@ -89,7 +183,14 @@ class MCPClientManager:
         self._initialized = False
         self.tools = []
         
-        # Close all clients
-        # Note: MultiServerMCPClient might not have an explicit close method exposed easily,
-        # but we clear references. The underlying connections should be cleaned up by GC or context managers.
-        self.clients = []
\ No newline at end of file
+        # Release the client deterministically instead of waiting for GC.
+        # langchain-mcp-adapters >= 0.1 opens a session per tool call and closes
+        # it when the call returns, so there is usually nothing left open; clients
+        # that keep sessions alive expose aclose().
+        client, self.client = self.client, None
+        aclose = getattr(client, "aclose", None)
+        if aclose is not None:
+            try:
+                await aclose()
+            except Exception as e:
+                print(f"⚠️  Error closing MCP client: {e}")
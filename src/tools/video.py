@@ -5,33 +5,130 @@ This module defines LangChain tools that enable the agent to handle video upload
 transcription, editing, and storage workflows through conversational interactions.
 """
 
-import os
-import uuid
+import asyncio
+import functools
+import re
+import secrets
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, Dict, Any
-from langchain.tools import tool
+from dataclasses import dataclass, fields, replace
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Dict, Any, List
+from langchain.tools import StructuredTool, tool
 
-from src.processing.transcription import TranscriptionService
-from src.retrievers.pinecone import PineconeManager
 from src.retrievers.pipeline import process_transcript_to_documents
 from src.config.settings import Config
 
+if TYPE_CHECKING:
+    # Annotation-only: importing these pulls in whisperx/torch and the Pinecone client
+    from src.processing.transcription import TranscriptionService
+    from src.retrievers.pinecone import PineconeManager
+
 
 # Global references (will be set during initialization)
 _transcription_service = None
 _pinecone_manager = None
-_video_state = {
-    "uploaded_video_path": None,
-    "transcription_text": None,
-    "transcription_segments": None,
-    "timing_info": None,
-    "show_video_upload": False,
-    "show_transcription_editor": False,
-    "transcription_in_progress": False
-}
-
-
-def initialize_video_tools(transcription_service: TranscriptionService, pinecone_manager: PineconeManager):
+
+
+@dataclass(slots=True)
+class VideoState:
+    """Video workflow state shared by the tools and the Gradio UI."""
+    uploaded_video_path: Optional[Path] = None
+    transcription_text: Optional[str] = None
+    transcription_segments: Optional[List[Dict[str, Any]]] = None
+    timing_info: Optional[str] = None
+    show_video_upload: bool = False
+    show_transcription_editor: bool = False
+    transcription_in_progress: bool = False
+    # Current pipeline stage while transcribing (streamed to the chat)
+    transcription_stage: Optional[str] = None
+    # Set once transcription has run ({} if extraction failed)
+    extracted_metadata: Optional[Dict[str, Any]] = None
+
+    def reset(self):
+        """Restore every field to its default (in place, so shared references stay valid)."""
+        for f in fields(self):
+            setattr(self, f.name, f.default)
+
+
+_video_state = VideoState()
+
+# Path embedded by the UI ("[VIDEO_PATH: /tmp/x.mp4]") or typed after a
+# "Please transcribe ...:" prompt (text after the last colon)
+_VIDEO_PATH_RE = re.compile(r"\[VIDEO_PATH:\s*([^\]]+)\]")
+_TRANSCRIBE_PREFIX_RE = re.compile(r"Please transcribe.*:(.*)", re.DOTALL)
+# Speaker number in "Speaker 0" / "speaker0"
+_SPEAKER_NUMBER_RE = re.compile(r"\d+")
+
+# Tool replies, compiled once
+TRANSCRIPTION_CANCELLED = "🛑 Transcription cancelled; its results were discarded."
+TRANSCRIPTION_DONE_TEMPLATE = """✅ **Transcription Complete!**
+
+**File:** {filename}
+**Title:** {title}
+**Summary:** {summary}
+**Processing Time:** {processing_time:.1f}s
+**Speakers Identified:** {speakers_count}
+
+---
+
+**Transcript Preview (first 1000 characters with Speaker Names):**
+
+{transcript_preview}
+
+---
+
+💡 **Note:** The full transcript is available in the **'Edit Transcript' tab**. Click "Load Transcript" to view and edit the complete text.
+
+**What would you like to do next?**
+1. 💾 Upload this transcription to Pinecone for AI-powered search
+2. 📖 **View/Edit the full transcript** (go to the **"Edit Transcript" tab**, click "Load Transcript" to read the complete text, make any edits if needed, then "Save & Upload to Pinecone")
+3. ❌ Cancel and start over
+
+Just let me know!""".format
+UPLOAD_STARTED_TEMPLATE = """⏳ Uploading to Pinecone in the background...
+
+**Meeting ID:** `{meeting_id}`
+**Title:** {meeting_title}
+**Date:** {meeting_date}
+**Summary:** {summary}
+**Documents Created:** {chunk_count}
+**Duration:** {duration}
+
+The meeting will be searchable in a few seconds (use `check_upload_status` to confirm).""".format
+
+# Every tool that changes the shared state above takes this lock, so they run
+# one at a time (and concurrent transcriptions would compete for the GPU)
+_video_lock = threading.Lock()
+
+# A transcription holds _video_lock for minutes, so a cancel meanwhile only
+# raises this flag; the transcription discards its results when it sees it.
+# _cancel_lock makes "still running?" and "finished, was I cancelled?" atomic.
+_cancel_requested = threading.Event()
+_cancel_lock = threading.Lock()
+# How often a waiting cancel re-checks whether a transcription has started
+_CANCEL_RETRY_SECONDS = 0.5
+
+
+# Pinecone uploads finish in the background (one at a time) so the chat turn
+# returns as soon as the chunks are built; the most recent jobs are kept for
+# status checks
+_upload_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pinecone-upload")
+_upload_jobs: "OrderedDict[str, Future]" = OrderedDict()
+_MAX_UPLOAD_JOBS = 32
+
+
+def _with_video_lock(func):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with _video_lock:
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def initialize_video_tools(transcription_service: "TranscriptionService", pinecone_manager: "PineconeManager"):
     """
     Initialize video tools with required services.
     
@@ -44,26 +141,52 @@ def initialize_video_tools(transcription_service: TranscriptionService, pinecone
     _pinecone_manager = pinecone_manager
 
 
-def get_video_state() -> Dict[str, Any]:
-    """Get current video processing state for UI updates."""
+def get_video_state() -> VideoState:
+    """Get current video processing state for UI updates (the live object, not a copy)."""
     return _video_state
 
 
 def reset_video_state():
     """Reset video state after workflow completion."""
-    global _video_state
-    _video_state = {
-        "uploaded_video_path": None,
-        "transcription_text": None,
-        "transcription_segments": None,
-        "timing_info": None,
-        "show_video_upload": False,
-        "show_transcription_editor": False,
-        "transcription_in_progress": False
-    }
+    _video_state.reset()
+
+
+def _resolve_video_path(video_path: str) -> str:
+    """
+    Extract the video path if it's embedded in brackets, or from
+    "Please transcribe my uploaded video: /path/to/video.mp4".
+    """
+    match = _VIDEO_PATH_RE.search(video_path) or _TRANSCRIBE_PREFIX_RE.search(video_path)
+    return match.group(1).strip() if match else video_path
+
+
+def get_transcription_stage(video_path: str) -> Optional[str]:
+    """
+    Current pipeline stage of the transcription of `video_path` (as passed to
+    transcribe_uploaded_video), or None if that video isn't being transcribed.
+    """
+    current = _video_state.uploaded_video_path
+    if not _video_state.transcription_in_progress or current is None:
+        return None
+    if current != Path(_resolve_video_path(video_path)):
+        return None
+    return _video_state.transcription_stage
+
+
+def _finish_transcription() -> bool:
+    """Mark the running transcription as finished; True if it was cancelled meanwhile."""
+    with _cancel_lock:
+        _video_state.transcription_in_progress = False
+        _video_state.transcription_stage = None
+        if not _cancel_requested.is_set():
+            return False
+        _cancel_requested.clear()
+    reset_video_state()
+    return True
 
 
 @tool
+@_with_video_lock
 def request_video_upload() -> str:
     """
     Request the user to upload a video file for transcription.
@@ -78,15 +201,14 @@ def request_video_upload() -> str:
         User: "I want to upload a video"
         Agent: calls request_video_upload() -> shows video upload UI
     """
-    global _video_state
-    _video_state["show_video_upload"] = True
-    _video_state["show_transcription_editor"] = False
+    _video_state.show_video_upload = True
+    _video_state.show_transcription_editor = False
     
     return "✅ Video upload interface is now ready. Please upload your video file and I'll transcribe it for you."
 
 
-@tool
-def transcribe_uploaded_video(video_path: str) -> str:
+@_with_video_lock
+def _transcribe_uploaded_video(video_path: str) -> str:
     """
     Transcribe an uploaded video file with speaker diarization.
     
@@ -108,70 +230,60 @@ def transcribe_uploaded_video(video_path: str) -> str:
     if not _transcription_service:
         return "❌ Error: Transcription service is not initialized."
     
-    # Extract video path if it's embedded in brackets
-    import re
-    if "[VIDEO_PATH:" in video_path:
-        match = re.search(r'\[VIDEO_PATH:\s*([^\]]+)\]', video_path)
-        if match:
-            video_path = match.group(1).strip()
-    
-    # Also extract from "Please transcribe my uploaded video: /path/to/video.mp4"
-    if "Please transcribe" in video_path and ":" in video_path:
-        video_path = video_path.split(":")[-1].strip()
+    video_path = _resolve_video_path(video_path)
     
-    if not os.path.exists(video_path):
+    # One stat() both checks the file and leaves the name ready for display
+    path = Path(video_path)
+    try:
+        path.stat()
+    except OSError:
         return f"❌ Error: Video file not found"
     
-    global _video_state
-    _video_state["transcription_in_progress"] = True
-    _video_state["uploaded_video_path"] = video_path
+    # Before the long call, so a cancel arriving from now on sees it running
+    with _cancel_lock:
+        _cancel_requested.clear()
+        _video_state.transcription_in_progress = True
+    _video_state.uploaded_video_path = path
     
     # Get just the filename for display
-    filename = os.path.basename(video_path)
+    filename = path.name
     
     try:
-        # Provide initial progress message
-        progress_msg = f"""🎬 **Transcribing: {filename}**
-
-**Processing Pipeline:**
-1. ⏳ Loading audio from video...
-2. ⏳ Transcribing with WhisperX...
-3. ⏳ Aligning word-level timestamps...
-4. ⏳ Identifying speakers...
-5. ⏳ Assigning speakers to text...
-
-⏱️ This may take a few minutes depending on video length. Please wait..."""
-        
-        # Process the video (progress updates handled internally by TranscriptionService)
-        result = _transcription_service.transcribe_video(video_path)
+        # Process the video; stage updates land in the state for the chat to stream
+        result = _transcription_service.transcribe_video(video_path, progress_callback=_report_transcription_stage)
         
         if not result.get("success", False):
-            _video_state["transcription_in_progress"] = False
+            if _finish_transcription():
+                return TRANSCRIPTION_CANCELLED
             return f"❌ Transcription failed: {result.get('error', 'Unknown error')}"
         
+        # Cancelled while the pipeline ran: skip the metadata extraction too
+        if _cancel_requested.is_set() and _finish_transcription():
+            return TRANSCRIPTION_CANCELLED
+        
         # Store results in state
-        _video_state["transcription_text"] = result["transcription"]
-        _video_state["transcription_segments"] = result["raw_data"]["segments"]
-        _video_state["timing_info"] = result["timing_info"]
+        _video_state.transcription_text = result["transcription"]
+        _video_state.transcription_segments = result["raw_data"]["segments"]
+        _video_state.timing_info = result["timing_info"]
         
         # ---------------------------------------------------------
         # INTELLIGENT METADATA EXTRACTION (Immediate)
         # ---------------------------------------------------------
         try:
-            from src.processing.metadata_extractor import MetadataExtractor
-            extractor = MetadataExtractor()
+            from src.processing.metadata_extractor import get_metadata_extractor
+            extractor = get_metadata_extractor()
             
             print("🧠 Extracting intelligent metadata (title, summary, date)...")
-            extracted_data = extractor.extract_metadata(_video_state["transcription_text"])
+            extracted_data = extractor.extract_metadata(_video_state.transcription_text)
             
             # Store metadata in state for later use
-            _video_state["extracted_metadata"] = extracted_data
+            _video_state.extracted_metadata = extracted_data
             
             # Apply speaker mapping if found
             if extracted_data.get("speaker_mapping"):
                 print(f"👥 Applying speaker mapping: {extracted_data['speaker_mapping']}")
-                _video_state["transcription_text"] = extractor.apply_speaker_mapping(
-                    _video_state["transcription_text"], 
+                _video_state.transcription_text = extractor.apply_speaker_mapping(
+                    _video_state.transcription_text, 
                     extracted_data["speaker_mapping"]
                 )
                 # Note: We are NOT updating segments here as it's complex, 
@@ -188,63 +300,68 @@ def transcribe_uploaded_video(video_path: str) -> str:
                     summary_header += f"**Date:** {meeting_date}\n\n"
                 summary_header += f"**Summary:** {summary}\n\n---\n\n"
                 
-                _video_state["transcription_text"] = summary_header + _video_state["transcription_text"]
+                _video_state.transcription_text = summary_header + _video_state.transcription_text
                 print(f"📝 Added summary to transcript for indexing")
                 
         except Exception as e:
             print(f"⚠️ Metadata extraction failed: {e}")
-            _video_state["extracted_metadata"] = {}
+            _video_state.extracted_metadata = {}
 
-        _video_state["transcription_in_progress"] = False
-        _video_state["show_video_upload"] = False
+        if _finish_transcription():
+            return TRANSCRIPTION_CANCELLED
+        _video_state.show_video_upload = False
         
         # Extract key statistics
         speakers_count = result.get("speakers_count", 0)
         processing_time = result.get("processing_time", 0)
         
         # Create a preview of the UPDATED transcript
-        updated_text = _video_state["transcription_text"]
+        updated_text = _video_state.transcription_text
         transcript_preview = updated_text[:1000] + "..." if len(updated_text) > 1000 else updated_text
         
         # Get extracted info for display
-        title = _video_state.get("extracted_metadata", {}).get("title", "Untitled Meeting")
-        summary = _video_state.get("extracted_metadata", {}).get("summary", "No summary available.")
+        title = (_video_state.extracted_metadata or {}).get("title", "Untitled Meeting")
+        summary = (_video_state.extracted_metadata or {}).get("summary", "No summary available.")
         
         # Return formatted transcription with summary (hide temp path)
-        return f"""✅ **Transcription Complete!**
-
-**File:** {filename}
-**Title:** {title}
-**Summary:** {summary}
-**Processing Time:** {processing_time:.1f}s
-**Speakers Identified:** {speakers_count}
-
----
-
-**Transcript Preview (first 1000 characters with Speaker Names):**
-
-{transcript_preview}
-
----
-
-💡 **Note:** The full transcript is available in the **'Edit Transcript' tab**. Click "Load Transcript" to view and edit the complete text.
-
-**What would you like to do next?**
-1. 💾 Upload this transcription to Pinecone for AI-powered search
-2. 📖 **View/Edit the full transcript** (go to the **"Edit Transcript" tab**, click "Load Transcript" to read the complete text, make any edits if needed, then "Save & Upload to Pinecone")
-3. ❌ Cancel and start over
-
-Just let me know!"""
+        return TRANSCRIPTION_DONE_TEMPLATE(
+            filename=filename,
+            title=title,
+            summary=summary,
+            processing_time=processing_time,
+            speakers_count=speakers_count,
+            transcript_preview=transcript_preview,
+        )
         
     except Exception as e:
-        _video_state["transcription_in_progress"] = False
+        if _finish_transcription():
+            return TRANSCRIPTION_CANCELLED
         import traceback
         error_details = traceback.format_exc()
         print(f"Error in transcribe_uploaded_video: {error_details}")
         return f"❌ Error during transcription: {str(e)}"
 
 
+def _report_transcription_stage(fraction: float, desc: str = ""):
+    _video_state.transcription_stage = f"{desc} ({fraction:.0%})"
+
+
+async def _atranscribe_uploaded_video(video_path: str) -> str:
+    """Async path of transcribe_uploaded_video: the pipeline runs in a worker thread."""
+    return await asyncio.to_thread(_transcribe_uploaded_video, video_path)
+
+
+# The agent awaits the coroutine, so minutes of WhisperX work never block its
+# event loop; .invoke() still runs the pipeline inline
+transcribe_uploaded_video = StructuredTool.from_function(
+    func=_transcribe_uploaded_video,
+    coroutine=_atranscribe_uploaded_video,
+    name="transcribe_uploaded_video",
+)
+
+
 @tool               # <-- This tool is maybe not needed!! It is done in the UI (second tab)
+@_with_video_lock
 def request_transcription_edit() -> str:
     """
     Allow the user to manually edit the transcription text.
@@ -259,17 +376,17 @@ def request_transcription_edit() -> str:
         User: "I want to edit the transcription"
         Agent: calls request_transcription_edit() -> shows editable textbox
     """
-    global _video_state
     
-    if not _video_state["transcription_text"]:
+    if not _video_state.transcription_text:
         return "❌ No transcription available to edit. Please transcribe a video first."
     
-    _video_state["show_transcription_editor"] = True
+    _video_state.show_transcription_editor = True
     
     return "✅ Transcription editor is now ready. You can make any changes to the text, then let me know when you're done."
 
 
 @tool
+@_with_video_lock
 def update_transcription(edited_text: str) -> str:
     """
     Update the transcription with user's edits.
@@ -283,19 +400,18 @@ def update_transcription(edited_text: str) -> str:
     Example:
         update_transcription("Corrected transcription text...")
     """
-    global _video_state
     
     if not edited_text:
         return "❌ No edited text provided."
     
-    _video_state["transcription_text"] = edited_text
-    _video_state["show_transcription_editor"] = False
+    _video_state.transcription_text = edited_text
+    _video_state.show_transcription_editor = False
     
     return "✅ Transcription updated successfully! Would you like to upload it to Pinecone now?"
 
 
-@tool
-def upload_transcription_to_pinecone() -> str:
+@_with_video_lock
+def _upload_transcription_to_pinecone() -> str:
     """
     Upload the current transcription to Pinecone vector database for AI-powered search.
     
@@ -312,41 +428,40 @@ def upload_transcription_to_pinecone() -> str:
     if not _pinecone_manager:
         return "❌ Error: Pinecone service is not initialized."
     
-    global _video_state
     
-    if not _video_state["transcription_text"]:
+    if not _video_state.transcription_text:
         return "❌ No transcription available to upload. Please transcribe a video first."
     
     try:
-        # Import MetadataExtractor
-        from src.processing.metadata_extractor import MetadataExtractor
+        # Import the shared metadata extractor
+        from src.processing.metadata_extractor import get_metadata_extractor
         
         # Check if we already extracted metadata in Step 1
-        if "extracted_metadata" in _video_state and _video_state["extracted_metadata"]:
+        if _video_state.extracted_metadata:
             print("🧠 Using pre-extracted metadata from transcription step.")
-            extracted_data = _video_state["extracted_metadata"]
+            extracted_data = _video_state.extracted_metadata
         else:
             # Fallback: Extract now if not done (e.g. legacy state)
-            extractor = MetadataExtractor()
+            extractor = get_metadata_extractor()
             print("🧠 Extracting intelligent metadata (title, summary, date)...")
-            extracted_data = extractor.extract_metadata(_video_state["transcription_text"])
+            extracted_data = extractor.extract_metadata(_video_state.transcription_text)
             
             # Apply speaker mapping if found
             if extracted_data.get("speaker_mapping"):
                 print(f"👥 Applying speaker mapping: {extracted_data['speaker_mapping']}")
-                _video_state["transcription_text"] = extractor.apply_speaker_mapping(
-                    _video_state["transcription_text"], 
+                _video_state.transcription_text = extractor.apply_speaker_mapping(
+                    _video_state.transcription_text, 
                     extracted_data["speaker_mapping"]
                 )
         
         # Generate unique meeting ID
-        meeting_id = f"meeting_{uuid.uuid4().hex[:8]}"
+        meeting_id = "meeting_" + secrets.token_hex(4)
         
         # Use extracted date if available, else today
         meeting_date = extracted_data.get("meeting_date") or datetime.now().strftime("%Y-%m-%d")
         
         # Create comprehensive metadata with consistent field names
-        video_filename = os.path.basename(_video_state["uploaded_video_path"]) if _video_state["uploaded_video_path"] else "unknown"
+        video_filename = _video_state.uploaded_video_path.name if _video_state.uploaded_video_path else "unknown"
         
         meeting_metadata = {
             "meeting_id": meeting_id,
@@ -362,7 +477,7 @@ def upload_transcription_to_pinecone() -> str:
         }
         
         # Process transcription into documents
-        segments = _video_state.get("transcription_segments", [])
+        segments = _video_state.transcription_segments
         
         # Calculate duration and format as MM:SS
         total_duration_seconds = segments[-1]["end"] if segments else 0
@@ -374,36 +489,92 @@ def upload_transcription_to_pinecone() -> str:
         meeting_metadata["duration"] = formatted_duration
         
         docs = process_transcript_to_documents(
-            _video_state["transcription_text"],
+            _video_state.transcription_text,
             segments,
             meeting_id,
             meeting_metadata=meeting_metadata
         )
         
-        # Upload to Pinecone
-        _pinecone_manager.upsert_documents(docs)
-        
-        # Calculate statistics
-        avg_chunk_size = sum(d.metadata['char_count'] for d in docs) // len(docs) if docs else 0
-        
-        # Reset state after successful upload
+        # Upload in the background; the state is freed for the next video now
+        # and handed back by _run_upload if the upload fails
+        _upload_jobs[meeting_id] = _upload_executor.submit(_run_upload, docs, replace(_video_state))
+        if len(_upload_jobs) > _MAX_UPLOAD_JOBS:
+            _upload_jobs.popitem(last=False)
         reset_video_state()
         
-        return f"""✅ Successfully uploaded to Pinecone!
-
-**Meeting ID:** `{meeting_id}`
-**Title:** {meeting_metadata['title']}
-**Date:** {meeting_date}
-**Summary:** {meeting_metadata['summary']}
-**Documents Created:** {len(docs)}
-**Duration:** {formatted_duration}
-
-You can now ask me questions about this meeting!"""
+        return UPLOAD_STARTED_TEMPLATE(
+            meeting_id=meeting_id,
+            meeting_title=meeting_metadata["meeting_title"],
+            meeting_date=meeting_date,
+            summary=meeting_metadata["summary"],
+            chunk_count=len(docs),
+            duration=formatted_duration,
+        )
         
     except Exception as e:
         return f"❌ Error uploading to Pinecone: {str(e)}"
 
 
+def _run_upload(docs, snapshot: VideoState) -> Optional[Dict[str, Any]]:
+    """
+    Background job: embed and upsert the chunks.
+    
+    Returns None on success, else {"error": ..., "restored": bool} where
+    `restored` says whether the transcript was put back for a retry.
+    """
+    try:
+        _pinecone_manager.upsert_documents(docs)
+        return None
+    except Exception as e:
+        # Give the transcript back for a retry, unless a new video took its place
+        with _video_lock:
+            restored = not _video_state.transcription_text
+            if restored:
+                for f in fields(snapshot):
+                    setattr(_video_state, f.name, getattr(snapshot, f.name))
+        return {"error": str(e), "restored": restored}
+
+
+async def _aupload_transcription_to_pinecone() -> str:
+    """Async path of upload_transcription_to_pinecone (chunking, embedding and upsert in a worker thread)."""
+    return await asyncio.to_thread(_upload_transcription_to_pinecone)
+
+
+upload_transcription_to_pinecone = StructuredTool.from_function(
+    func=_upload_transcription_to_pinecone,
+    coroutine=_aupload_transcription_to_pinecone,
+    name="upload_transcription_to_pinecone",
+)
+
+
+@tool
+def check_upload_status(meeting_id: str) -> str:
+    """
+    Check whether a background Pinecone upload has finished.
+    
+    Use this tool when the user asks if their uploaded meeting is ready, or before
+    searching a meeting that upload_transcription_to_pinecone has just started storing.
+    
+    Args:
+        meeting_id: The meeting ID returned by upload_transcription_to_pinecone
+    
+    Returns:
+        Status message for the upload
+    """
+    job = _upload_jobs.get(meeting_id.strip().strip("`"))
+    if job is None:
+        return f"❌ No upload found for meeting `{meeting_id}`."
+    if not job.done():
+        return f"⏳ Upload of `{meeting_id}` is still in progress. Please check again in a few seconds."
+    
+    failure = job.result()
+    if failure is not None:
+        if failure["restored"]:
+            return f"❌ Upload of `{meeting_id}` failed: {failure['error']}. The transcript is loaded again, so you can try uploading again."
+        return f"❌ Upload of `{meeting_id}` failed: {failure['error']}. A newer transcription has replaced it, so this transcript would need to be uploaded from its video again."
+    return f"✅ Meeting `{meeting_id}` is stored in Pinecone. You can now ask me questions about it!"
+
+
 @tool
 def cancel_video_workflow() -> str:
     """
@@ -418,11 +589,26 @@ def cancel_video_workflow() -> str:
         User: "Never mind, I don't want to upload a video"
         Agent: calls cancel_video_workflow() -> resets state
     """
-    reset_video_state()
+    # Don't wait minutes for a running transcription: have it discard its
+    # results. A transcription may take the lock after the check, so the
+    # lock is only waited on briefly before checking again.
+    while True:
+        with _cancel_lock:
+            if _video_state.transcription_in_progress:
+                _cancel_requested.set()
+                return "✅ Video workflow cancelled. The transcription in progress will be discarded. What else can I help you with?"
+        if _video_lock.acquire(timeout=_CANCEL_RETRY_SECONDS):
+            break
+    
+    try:
+        reset_video_state()
+    finally:
+        _video_lock.release()
     return "✅ Video workflow cancelled. What else can I help you with?"
 
 
 @tool
+@_with_video_lock
 def update_speaker_names(speaker_mapping: str) -> str:
     """
     Update speaker names in the current transcript by replacing generic labels (SPEAKER_00, SPEAKER_01, etc.) 
@@ -442,11 +628,11 @@ def update_speaker_names(speaker_mapping: str) -> str:
         User: "Speaker 0 is John and speaker 1 is Sarah"
         Agent: calls update_speaker_names("0=John, 1=Sarah")
     """
-    if not _video_state.get("transcription_text"):
+    if not _video_state.transcription_text:
         return "❌ No transcription available. Please transcribe a video first."
     
     try:
-        from src.processing.metadata_extractor import MetadataExtractor
+        from src.processing.metadata_extractor import get_metadata_extractor
         
         # Parse the speaker_mapping string into a dictionary
         mapping = {}
@@ -465,8 +651,7 @@ def update_speaker_names(speaker_mapping: str) -> str:
                     key = f"SPEAKER_{int(key):02d}"
                 elif not key.startswith("SPEAKER_"):
                     # Try to extract number from formats like "Speaker 0" or "speaker0"
-                    import re
-                    match = re.search(r'\d+', key)
+                    match = _SPEAKER_NUMBER_RE.search(key)
                     if match:
                         key = f"SPEAKER_{int(match.group()):02d}"
                 
@@ -476,18 +661,16 @@ def update_speaker_names(speaker_mapping: str) -> str:
             return "❌ Could not parse speaker mapping. Please use format: 'SPEAKER_00=John Smith, SPEAKER_01=Sarah Jones' or '0=John, 1=Sarah'"
         
         # Apply the mapping
-        extractor = MetadataExtractor()
-        original_text = _video_state["transcription_text"]
+        extractor = get_metadata_extractor()
+        original_text = _video_state.transcription_text
         updated_text = extractor.apply_speaker_mapping(original_text, mapping)
         
         # Update the state
-        _video_state["transcription_text"] = updated_text
+        _video_state.transcription_text = updated_text
         
         # Also update the extracted_metadata if it exists
-        if "extracted_metadata" in _video_state:
-            if "speaker_mapping" not in _video_state["extracted_metadata"]:
-                _video_state["extracted_metadata"]["speaker_mapping"] = {}
-            _video_state["extracted_metadata"]["speaker_mapping"].update(mapping)
+        if _video_state.extracted_metadata is not None:
+            _video_state.extracted_metadata.setdefault("speaker_mapping", {}).update(mapping)
         
         # Count replacements
         changes = []
@@ -516,12 +699,14 @@ The transcript has been updated. You can:
 __all__ = [
     "initialize_video_tools",
     "get_video_state",
+    "get_transcription_stage",
     "reset_video_state",
     "request_video_upload",
     "transcribe_uploaded_video",
     "request_transcription_edit",
     "update_transcription",
     "upload_transcription_to_pinecone",
+    "check_upload_status",
     "cancel_video_workflow",
     "update_speaker_names"
 ]
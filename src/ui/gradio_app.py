@@ -1,14 +1,14 @@
 import os
 import random
-import uuid
+import secrets
 from datetime import datetime
 from typing import Dict, Any
 
 import gradio as gr
 
 from src.config.settings import Config
-from src.processing.metadata_extractor import MetadataExtractor
-from src.retrievers.pinecone import PineconeManager
+from src.processing.metadata_extractor import get_metadata_extractor
+from src.retrievers.pinecone import get_pinecone_manager
 from src.retrievers.pipeline import process_transcript_to_documents
 from src.tools.video import get_video_state, reset_video_state, _video_state
 
@@ -169,7 +169,7 @@ You can ask me to:
     def load_transcript_for_editing():
         """Load the current transcription from video state."""
         video_state = get_video_state()
-        transcript = video_state.get("transcription_text", "")
+        transcript = video_state.transcription_text or ""
         
         if not transcript:
             return "", "⚠️ No transcription available. Please transcribe a video first in the Chat tab."
@@ -185,19 +185,19 @@ You can ask me to:
         
         try:
             # Update the video state with edited text
-            _video_state["transcription_text"] = edited_text
+            _video_state.transcription_text = edited_text
             
             # Get video state
             video_state = get_video_state()
             
             # Initialize Pinecone manager
-            pinecone_mgr = PineconeManager()
+            pinecone_mgr = get_pinecone_manager()
             
             # ---------------------------------------------------------
             # INTELLIGENT METADATA EXTRACTION
             # ---------------------------------------------------------
             try:
-                extractor = MetadataExtractor()
+                extractor = get_metadata_extractor()
                 
                 print("🧠 Extracting intelligent metadata (title, summary, date)...")
                 extracted_data = extractor.extract_metadata(edited_text)
@@ -213,13 +213,13 @@ You can ask me to:
                 extracted_data = {}
 
             # Generate unique meeting ID
-            meeting_id = f"meeting_{uuid.uuid4().hex[:8]}"
+            meeting_id = "meeting_" + secrets.token_hex(4)
             
             # Use extracted date if available, else today
             meeting_date = extracted_data.get("meeting_date") or datetime.now().strftime("%Y-%m-%d")
             
             # Create comprehensive metadata with consistent field names
-            video_filename = os.path.basename(video_state["uploaded_video_path"]) if video_state.get("uploaded_video_path") else "edited_transcript"
+            video_filename = video_state.uploaded_video_path.name if video_state.uploaded_video_path else "edited_transcript"
             
             meeting_metadata = {
                 "meeting_id": meeting_id,
@@ -235,7 +235,7 @@ You can ask me to:
             }
             
             # Process transcription into documents
-            segments = video_state.get("transcription_segments", [])
+            segments = video_state.transcription_segments
             
             # Calculate duration and format as MM:SS
             total_duration_seconds = segments[-1]["end"] if segments else 0
@@ -302,7 +302,7 @@ The agent will acknowledge your upload and help you analyze the meeting.
     def list_all_meetings():
         """List all meetings stored in Pinecone with metadata."""
         try:
-            pinecone_mgr = PineconeManager()
+            pinecone_mgr = get_pinecone_manager()
             meetings = pinecone_mgr.list_meetings(limit=1000)
             
             if not meetings:
@@ -0,0 +1,251 @@
+import contextlib
+import hashlib
+import itertools
+import json
+import os
+import re
+import string
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+import orjson
+from src.config.settings import Config
+
+_WS_RE = re.compile(r"\s+")
+_PUNCT_TBL = str.maketrans("", "", string.punctuation)
+_STOP = frozenset({"the", "a", "please", "could", "you", "me"})
+
+
+def canonicalize_query(query: str) -> str:
+    """
+    Normalize a search query for use as a cache key.
+
+    Lowercases, strips punctuation, collapses whitespace and drops a few
+    filler words, so "Please summarize the meeting." and "summarize meeting"
+    share one entry. Only the key is normalized - the retriever still gets
+    the original query.
+    """
+    tokens = _WS_RE.sub(" ", query.lower().translate(_PUNCT_TBL)).split()
+    return " ".join(t for t in tokens if t not in _STOP)
+
+
+def write_json_atomic(path: str, obj, option: int = 0):
+    """
+    Write `obj` as JSON (orjson `option` flags) to `path`.
+    
+    Goes through a uniquely named temp file in the same directory and
+    os.replace, so readers never see a partial file and concurrent writers
+    (threads or processes) can't clobber each other's temp file. Raises
+    OSError/TypeError; disk caches treat a failure as a cache miss.
+    """
+    data = orjson.dumps(obj, option=option)
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
+
+class RedisQueryCache:
+    """
+    Redis-backed cache shared across workers and restarts.
+
+    Values must be JSON-serializable; they are stored with orjson under
+    hashed keys and their TTL is refreshed on every hit.
+    """
+
+    PREFIX = "rag:v1:"
+
+    def __init__(self, url, ttl=3600):
+        import redis  # Optional dependency, only needed when REDIS_URL is set
+
+        self.ttl = ttl
+        # from_url builds a connection pool shared by every call on this client
+        self._client = redis.Redis.from_url(url)
+
+    def _key(self, key):
+        raw = json.dumps(key, sort_keys=True, default=str).encode("utf-8")
+        return self.PREFIX + hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+    def get(self, key):
+        redis_key = self._key(key)
+        try:
+            # GET + EXPIRE in a single round-trip
+            value, _ = self._client.pipeline().get(redis_key).expire(redis_key, self.ttl).execute()
+        except Exception as e:
+            print(f"⚠️ Redis cache read failed: {e}")
+            return None
+        return orjson.loads(value) if value else None
+
+    def set(self, key, value):
+        try:
+            self._client.setex(self._key(key), self.ttl, orjson.dumps(value))
+        except Exception as e:
+            print(f"⚠️ Redis cache write failed: {e}")
+
+    def clear(self):
+        try:
+            keys = list(self._client.scan_iter(match=self.PREFIX + "*", count=500))
+            if keys:
+                self._client.unlink(*keys)
+        except Exception as e:
+            print(f"⚠️ Redis cache clear failed: {e}")
+
+
+class QueryCache:
+    """
+    Small thread-safe LRU cache with a time-to-live per entry.
+
+    An optional second-level cache (e.g. RedisQueryCache) is consulted on
+    local misses and written through on every set.
+    """
+
+    def __init__(self, maxsize=256, ttl=300, l2=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.l2 = l2
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return the cached value for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at >= time.monotonic():
+                    self._data.move_to_end(key)
+                    return value
+                del self._data[key]
+        
+        if self.l2 is None:
+            return None
+        value = self.l2.get(key)
+        if value is not None:
+            self._set_local(key, value)
+        return value
+
+    def set(self, key, value):
+        self._set_local(key, value)
+        if self.l2 is not None:
+            self.l2.set(key, value)
+
+    def _set_local(self, key, value):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+        if self.l2 is not None:
+            self.l2.clear()
+
+
+class SemanticCache:
+    """
+    Thread-safe LRU cache keyed on query embeddings.
+
+    A lookup returns the value of the most similar cached query if its cosine
+    similarity reaches `threshold`. Entries are partitioned by an exact scope
+    key (namespace, k, filters), so a paraphrase never reuses results from a
+    differently filtered search.
+    """
+
+    def __init__(self, maxsize=256, ttl=300, threshold=0.95):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.threshold = threshold
+        self._data = OrderedDict()  # id -> (scope, vector, expires_at, value)
+        self._index = {}  # scope -> (ids, matrix), rebuilt after any change
+        self._ids = itertools.count()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _normalize(vector):
+        vector = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def _scope_index(self, scope):
+        index = self._index.get(scope)
+        if index is None:
+            ids = [i for i, entry in self._data.items() if entry[0] == scope]
+            matrix = np.stack([self._data[i][1] for i in ids]) if ids else None
+            index = self._index[scope] = (ids, matrix)
+        return index
+
+    def get(self, scope, vector):
+        """Return the value cached for the closest query in scope, or None."""
+        query = self._normalize(vector)
+        with self._lock:
+            ids, matrix = self._scope_index(scope)
+            if not ids:
+                return None
+            scores = matrix @ query
+            best = int(np.argmax(scores))
+            if scores[best] < self.threshold:
+                return None
+            entry_id = ids[best]
+            _, _, expires_at, value = self._data[entry_id]
+            if expires_at < time.monotonic():
+                del self._data[entry_id]
+                self._index.pop(scope, None)
+                return None
+            self._data.move_to_end(entry_id)
+            return value
+
+    def set(self, scope, vector, value):
+        with self._lock:
+            self._data[next(self._ids)] = (scope, self._normalize(vector), time.monotonic() + self.ttl, value)
+            self._index.pop(scope, None)
+            while len(self._data) > self.maxsize:
+                _, (evicted_scope, _, _, _) = self._data.popitem(last=False)
+                self._index.pop(evicted_scope, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._index.clear()
+
+
+def _make_shared_cache():
+    """Build the optional Redis layer from Config.REDIS_URL."""
+    if not Config.REDIS_URL:
+        return None
+    try:
+        cache = RedisQueryCache(Config.REDIS_URL, ttl=Config.REDIS_CACHE_TTL)
+        print("✅ Redis search cache enabled")
+        return cache
+    except ImportError as e:
+        print(f"❌ Redis dependencies not installed: {e}")
+        print("   Install with: pip install redis")
+        return None
+
+
+# Shared cache for search_meetings results; cleared whenever the index changes
+search_cache = QueryCache(l2=_make_shared_cache())
+
+# Per-meeting metadata is static after ingest; cleared alongside search_cache
+metadata_cache = QueryCache(maxsize=512, ttl=3600)
+
+# Paraphrase-tolerant layer behind search_cache, matched on query embeddings
+semantic_search_cache = SemanticCache(threshold=Config.SEMANTIC_CACHE_THRESHOLD)
+
+
+def clear_index_caches():
+    """Drop every cache derived from the Pinecone index (call after writes)."""
+    search_cache.clear()
+    semantic_search_cache.clear()
+    metadata_cache.clear()
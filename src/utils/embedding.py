@@ -1,11 +1,149 @@
+import functools
+import hashlib
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
 from langchain_openai import OpenAIEmbeddings
 from src.config.settings import Config
+from src.utils.cache import canonicalize_query
+
+# Stay well under SQLite's bound-parameter limit per lookup
+_SQLITE_BATCH = 500
+
+
+class DocumentEmbeddingStore:
+    """
+    SQLite store of document embeddings keyed by content hash.
+
+    Vectors are kept as float32 bytes (the precision Pinecone stores), so a
+    re-import or a repeated boilerplate chunk never pays for a second
+    embedding call. Failures are logged and only cost a cache miss.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def _connect(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute("CREATE TABLE IF NOT EXISTS embeddings (key BLOB PRIMARY KEY, vector BLOB NOT NULL)")
+        return conn
+
+    def get_many(self, keys: List[bytes]) -> Dict[bytes, np.ndarray]:
+        found = {}
+        try:
+            conn = self._connect()
+            try:
+                for i in range(0, len(keys), _SQLITE_BATCH):
+                    batch = keys[i:i + _SQLITE_BATCH]
+                    rows = conn.execute(
+                        f"SELECT key, vector FROM embeddings WHERE key IN ({','.join('?' * len(batch))})", batch
+                    )
+                    for key, vector in rows:
+                        found[key] = np.frombuffer(vector, dtype=np.float32)
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            print(f"⚠️ Embedding cache read failed: {e}")
+        return found
+
+    def put_many(self, items: Iterable[Tuple[bytes, np.ndarray]]):
+        try:
+            conn = self._connect()
+            try:
+                with conn:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                        ((key, vector.tobytes()) for key, vector in items)
+                    )
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            print(f"⚠️ Embedding cache write failed: {e}")
+
+
+class CachedQueryEmbeddings(Embeddings):
+    """
+    Wrap an embedding model with an LRU cache for query embeddings.
+
+    Repeated (or trivially rephrased) questions skip the OpenAI round-trip.
+    Document embeddings go through the optional content-hash `store`.
+    """
+
+    def __init__(self, embeddings: Embeddings, maxsize: int = 1024, store: DocumentEmbeddingStore = None):
+        self.embeddings = embeddings
+        self.maxsize = maxsize
+        self.store = store
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        # Vectors from different models must never be mixed up
+        self._key_prefix = f"{getattr(embeddings, 'model', type(embeddings).__name__)}\0".encode("utf-8")
+
+    def embed_query(self, text: str) -> List[float]:
+        # Keyed on the canonical form, but a miss embeds the original text
+        key = canonicalize_query(text) or text
+        with self._lock:
+            vector = self._cache.get(key)
+            if vector is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return list(vector)
+            self.misses += 1
+        
+        vector = tuple(self.embeddings.embed_query(text))
+        with self._lock:
+            self._cache[key] = vector
+            if len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+        return list(vector)
+
+    def _document_keys(self, texts: List[str]):
+        keys = [hashlib.blake2b(self._key_prefix + text.encode("utf-8"), digest_size=20).digest() for text in texts]
+        found = self.store.get_many(list(set(keys)))
+        # Identical texts within one call are embedded once
+        missing = {key: text for key, text in zip(keys, texts) if key not in found}
+        return keys, found, missing
+
+    def _store_documents(self, found, missing, vectors):
+        new = {key: np.asarray(vector, dtype=np.float32) for key, vector in zip(missing, vectors)}
+        self.store.put_many(new.items())
+        found.update(new)
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        if self.store is None:
+            return self.embeddings.embed_documents(texts)
+
+        keys, found, missing = self._document_keys(texts)
+        if missing:
+            self._store_documents(found, missing, self.embeddings.embed_documents(list(missing.values())))
+        return [found[key].tolist() for key in keys]
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        if self.store is None:
+            return await self.embeddings.aembed_documents(texts)
+
+        keys, found, missing = self._document_keys(texts)
+        if missing:
+            self._store_documents(found, missing, await self.embeddings.aembed_documents(list(missing.values())))
+        return [found[key].tolist() for key in keys]
+
 
+@functools.lru_cache(maxsize=None)
 def get_embedding_model():
     """
-    Initialize and return the OpenAI Embeddings model.
+    Initialize and return the OpenAI Embeddings model (shared per process).
     """
-    return OpenAIEmbeddings(
-        openai_api_key=Config.OPENAI_API_KEY,
-        model="text-embedding-3-small"  # Using a cost-effective and performant model
+    return CachedQueryEmbeddings(
+        OpenAIEmbeddings(
+            openai_api_key=Config.OPENAI_API_KEY,
+            model="text-embedding-3-small"  # Using a cost-effective and performant model
+        ),
+        store=DocumentEmbeddingStore(os.path.join(Config.CACHE_DIR, "embeddings.sqlite3"))
     )
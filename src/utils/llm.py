@@ -0,0 +1,37 @@
+import functools
+import importlib.util
+
+import httpx
+from langchain_openai import ChatOpenAI
+from src.config.settings import Config
+
+# Keep-alive pool shared by every chat session so new conversations reuse
+# warm TCP/TLS connections instead of paying a handshake per request.
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=64, max_connections=128)
+HTTP_TIMEOUT = 60
+# HTTP/2 multiplexing needs the optional `h2` package (httpx[http2])
+HTTP2_ENABLED = importlib.util.find_spec("h2") is not None
+
+
+@functools.lru_cache(maxsize=None)
+def get_chat_model(model=None, temperature=0.7):
+    """
+    Return a process-wide ChatOpenAI client for the given model settings.
+
+    The underlying sync and async httpx clients are pooled, so every agent
+    built from this model shares the same connections.
+    """
+    return ChatOpenAI(
+        model=model or Config.MODEL_NAME,
+        temperature=temperature,
+        openai_api_key=Config.OPENAI_API_KEY,
+        streaming=False,
+        http_client=httpx.Client(
+            timeout=HTTP_TIMEOUT,
+            transport=httpx.HTTPTransport(http2=HTTP2_ENABLED, limits=HTTP_LIMITS, retries=2),
+        ),
+        http_async_client=httpx.AsyncClient(
+            timeout=HTTP_TIMEOUT,
+            transport=httpx.AsyncHTTPTransport(http2=HTTP2_ENABLED, limits=HTTP_LIMITS, retries=2),
+        ),
+    )
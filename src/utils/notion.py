@@ -0,0 +1,152 @@
+import asyncio
+import functools
+import threading
+import time
+
+import httpx
+from src.config.settings import Config
+from src.utils.llm import HTTP2_ENABLED
+
+NOTION_API_URL = "https://api.notion.com/v1"
+NOTION_VERSION = "2022-06-28"
+NOTION_TIMEOUT = 30
+# A handful of keep-alive connections is plenty for one workspace token
+NOTION_LIMITS = httpx.Limits(max_keepalive_connections=8, max_connections=16)
+# Notion allows an average of 3 requests/second per integration
+NOTION_RATE_PER_SECOND = 3.0
+NOTION_BURST = 3
+# Rate-limited (429) or briefly unavailable responses are retried this often
+NOTION_MAX_RETRIES = 4
+_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket.
+    
+    `reserve()` takes a token and returns how long the caller must wait before
+    sending, so the same bucket paces sync and async callers alike.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Going negative books a future slot for this caller
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+
+# The limit is per token, so every Notion client in the process shares one bucket
+notion_rate_limiter = RateLimiter(NOTION_RATE_PER_SECOND, NOTION_BURST)
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Honour Retry-After (seconds) when Notion sends it, else back off exponentially."""
+    try:
+        return max(float(response.headers["Retry-After"]), 0.0)
+    except (KeyError, ValueError):
+        return 0.5 * 2 ** attempt
+
+
+class _RateLimitedTransport(httpx.BaseTransport):
+    """Paces requests through notion_rate_limiter and retries 429/5xx responses."""
+
+    def __init__(self, transport: httpx.BaseTransport):
+        self._transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        for attempt in range(NOTION_MAX_RETRIES + 1):
+            delay = notion_rate_limiter.reserve()
+            if delay:
+                time.sleep(delay)
+            response = self._transport.handle_request(request)
+            if response.status_code not in _RETRY_STATUSES or attempt == NOTION_MAX_RETRIES:
+                return response
+            delay = _retry_delay(response, attempt)
+            response.close()
+            print(f"⏳ Notion returned {response.status_code}, retrying in {delay:.1f}s...")
+            time.sleep(delay)
+
+    def close(self):
+        self._transport.close()
+
+
+class _AsyncRateLimitedTransport(httpx.AsyncBaseTransport):
+    """Async twin of _RateLimitedTransport (waits without blocking the loop)."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        for attempt in range(NOTION_MAX_RETRIES + 1):
+            delay = notion_rate_limiter.reserve()
+            if delay:
+                await asyncio.sleep(delay)
+            response = await self._transport.handle_async_request(request)
+            if response.status_code not in _RETRY_STATUSES or attempt == NOTION_MAX_RETRIES:
+                return response
+            delay = _retry_delay(response, attempt)
+            await response.aclose()
+            print(f"⏳ Notion returned {response.status_code}, retrying in {delay:.1f}s...")
+            await asyncio.sleep(delay)
+
+    async def aclose(self):
+        await self._transport.aclose()
+
+
+def _notion_headers():
+    return {
+        "Authorization": f"Bearer {Config.NOTION_TOKEN}",
+        "Notion-Version": NOTION_VERSION,
+        "Content-Type": "application/json"
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def get_notion_client():
+    """
+    Return a process-wide Notion HTTP client.
+
+    Requests share a keep-alive pool (and HTTP/2 when `h2` is installed),
+    so repeated imports don't pay a TCP/TLS handshake per call. Every request
+    is paced to Notion's rate limit, and 429s are retried after Retry-After.
+    """
+    return httpx.Client(
+        base_url=NOTION_API_URL,
+        headers=_notion_headers(),
+        timeout=NOTION_TIMEOUT,
+        transport=_RateLimitedTransport(
+            httpx.HTTPTransport(http2=HTTP2_ENABLED, limits=NOTION_LIMITS, retries=2)
+        ),
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _get_notion_async_client(loop):
+    return httpx.AsyncClient(
+        base_url=NOTION_API_URL,
+        headers=_notion_headers(),
+        timeout=NOTION_TIMEOUT,
+        transport=_AsyncRateLimitedTransport(
+            httpx.AsyncHTTPTransport(http2=HTTP2_ENABLED, limits=NOTION_LIMITS, retries=2)
+        ),
+    )
+
+
+def get_notion_async_client():
+    """
+    Return the pooled async Notion client for the running event loop.
+
+    Async connections are bound to the loop that opened them, so one client
+    is kept per loop.
+    """
+    return _get_notion_async_client(asyncio.get_running_loop())
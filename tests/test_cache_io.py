@@ -0,0 +1,49 @@
+import os
+import tempfile
+import threading
+import unittest
+import orjson
+from src.utils.cache import write_json_atomic
+
+class TestWriteJsonAtomic(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, "nested", "entry.json")
+
+    def test_writes_and_creates_directory(self):
+        write_json_atomic(self.path, {"meeting_id": "meeting_1"})
+
+        with open(self.path, "rb") as f:
+            self.assertEqual(orjson.loads(f.read()), {"meeting_id": "meeting_1"})
+
+    def test_concurrent_writers_in_one_process_do_not_clash(self):
+        errors = []
+
+        def write(i):
+            try:
+                for _ in range(50):
+                    write_json_atomic(self.path, {"writer": i})
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=write, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        with open(self.path, "rb") as f:
+            self.assertIn(orjson.loads(f.read())["writer"], range(8))
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), ["entry.json"])
+
+    def test_unserializable_value_writes_nothing(self):
+        with self.assertRaises(TypeError):
+            write_json_atomic(self.path, {"bad": object()})
+
+        # Serialization fails before anything touches the disk
+        self.assertFalse(os.path.exists(os.path.dirname(self.path)))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import os
+import tempfile
+import unittest
+from langchain_core.embeddings import Embeddings
+from src.utils.embedding import CachedQueryEmbeddings, DocumentEmbeddingStore
+
+class CountingEmbeddings(Embeddings):
+    model = "fake-model"
+
+    def __init__(self):
+        self.embedded = []
+
+    def embed_documents(self, texts):
+        self.embedded.extend(texts)
+        return [[float(len(t)), 1.0, 0.5] for t in texts]
+
+    def embed_query(self, text):
+        return self.embed_documents([text])[0]
+
+class TestDocumentEmbeddingCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = DocumentEmbeddingStore(os.path.join(self.tmp.name, "embeddings.sqlite3"))
+        self.inner = CountingEmbeddings()
+        self.embeddings = CachedQueryEmbeddings(self.inner, store=self.store)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_repeated_texts_are_embedded_once(self):
+        first = self.embeddings.embed_documents(["a", "bb", "a"])
+        second = self.embeddings.embed_documents(["bb", "ccc"])
+
+        self.assertEqual(self.inner.embedded, ["a", "bb", "ccc"])
+        self.assertEqual(first, [[1.0, 1.0, 0.5], [2.0, 1.0, 0.5], [1.0, 1.0, 0.5]])
+        self.assertEqual(second, [[2.0, 1.0, 0.5], [3.0, 1.0, 0.5]])
+
+    def test_store_survives_new_wrapper(self):
+        self.embeddings.embed_documents(["same chunk"])
+        other = CountingEmbeddings()
+
+        CachedQueryEmbeddings(other, store=self.store).embed_documents(["same chunk"])
+
+        self.assertEqual(other.embedded, [])
+
+    def test_different_model_does_not_share_vectors(self):
+        self.embeddings.embed_documents(["same chunk"])
+        other = CountingEmbeddings()
+        other.model = "other-model"
+
+        CachedQueryEmbeddings(other, store=self.store).embed_documents(["same chunk"])
+
+        self.assertEqual(other.embedded, ["same chunk"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,11 +1,31 @@
+import os
+import tempfile
 import unittest
 from unittest.mock import MagicMock, patch
+from src.config.settings import Config
+from src.tools import general
 from src.tools.general import upsert_text_to_pinecone, initialize_tools
 
 class TestGenericUpsert(unittest.TestCase):
     def setUp(self):
         self.mock_pinecone_manager = MagicMock()
+        # Fresh index: no earlier import of the same content exists
+        self.mock_pinecone_manager.get_meeting_record.return_value = None
         initialize_tools(self.mock_pinecone_manager)
+        # Keep the import cache out of the working tree and separate per test
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        cache_path = general._import_cache_path
+        patcher = patch('src.tools.general._import_cache_path',
+                        side_effect=lambda *args: os.path.join(tmp.name, os.path.basename(cache_path(*args))))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        # No live LLM call (and no metadata cache written to the working tree)
+        patcher = patch('src.tools.general.get_metadata_extractor')
+        self.mock_extractor = patcher.start().return_value
+        self.addCleanup(patcher.stop)
+        self.mock_extractor.extract_metadata.return_value = {}
+        self.mock_extractor.apply_speaker_mapping.side_effect = lambda text, mapping: text
 
     @patch('src.tools.general.process_transcript_to_documents')
     def test_upsert_text_to_pinecone(self, mock_process):
@@ -26,7 +46,22 @@ class TestGenericUpsert(unittest.TestCase):
         self.mock_pinecone_manager.upsert_documents.assert_called_once()
         args, kwargs = self.mock_pinecone_manager.upsert_documents.call_args
         self.assertEqual(args[0], mock_docs)
-        self.assertEqual(kwargs['namespace'], "default")
+        self.assertEqual(kwargs['namespace'], Config.PINECONE_NAMESPACE)
+
+    @patch('src.tools.general.process_transcript_to_documents')
+    def test_identical_reimport_is_skipped(self, mock_process):
+        mock_process.return_value = [MagicMock()]
+        args = {"text": "Same page content.", "title": "Notion Page", "source": "Notion"}
+
+        first = upsert_text_to_pinecone.invoke(args)
+        self.mock_pinecone_manager.get_meeting_record.return_value = {"meeting_id": "existing"}
+        second = upsert_text_to_pinecone.invoke(args)
+
+        self.assertIn("Successfully saved", first)
+        self.assertIn("already saved", second)
+        self.assertIn(first.split("(ID: ")[1].split(")")[0], second)
+        self.mock_pinecone_manager.upsert_documents.assert_called_once()
+        self.mock_extractor.extract_metadata.assert_called_once()
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,43 @@
+import threading
+import unittest
+from collections import OrderedDict
+from unittest.mock import patch
+from src.agents import conversational
+from src.agents.conversational import ConversationalMeetingAgent
+
+class TestHistoryCache(unittest.TestCase):
+    def setUp(self):
+        # Only the history cache is exercised; skip building tools and the graph
+        self.agent = ConversationalMeetingAgent.__new__(ConversationalMeetingAgent)
+        self.agent._history_cache = OrderedDict()
+        self.agent._history_lock = threading.Lock()
+
+    def contents(self, history):
+        return [m.content for m in self.agent._history_messages(history)]
+
+    def test_sessions_with_same_opening_do_not_share_turns(self):
+        first = [["hi", "hello"], ["my salary is 100k", "noted"], ["thanks", "bye"]]
+        second = [["hi", "hello"], ["what meetings do I have?", "three"], ["thanks", "bye"]]
+
+        self.contents(first)
+
+        self.assertNotIn("my salary is 100k", self.contents(second))
+        self.assertIn("what meetings do I have?", self.contents(second))
+
+    def test_only_new_entries_are_converted(self):
+        history = [["q1", "a1"], ["q2", "a2"]]
+        self.contents(history)
+
+        with patch.object(conversational, "_history_item_messages", wraps=conversational._history_item_messages) as convert:
+            result = self.contents(history + [["q3", "a3"]])
+
+        self.assertEqual(result, ["q1", "a1", "q2", "a2", "q3", "a3"])
+        self.assertEqual(convert.call_count, 1)
+
+    def test_edited_history_is_reconverted(self):
+        self.contents([["q1", "a1"], ["q2", "a2"]])
+
+        self.assertEqual(self.contents([["q1", "a1"], ["q2 edited", "a2"]]), ["q1", "a1", "q2 edited", "a2"])
+
+if __name__ == '__main__':
+    unittest.main()
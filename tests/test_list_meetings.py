@@ -0,0 +1,44 @@
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from src.retrievers.pinecone import MEETINGS_NAMESPACE_SUFFIX, PineconeManager
+
+def make_matches(*metadatas):
+    return SimpleNamespace(matches=[SimpleNamespace(metadata=m) for m in metadatas])
+
+class TestListMeetings(unittest.TestCase):
+    def setUp(self):
+        # Skip __init__ (it connects to Pinecone); only the index is needed
+        self.manager = PineconeManager.__new__(PineconeManager)
+        self.manager._probe_vector = [1.0, 1.0]
+        self.manager.index = MagicMock()
+        self.results = {
+            "ns" + MEETINGS_NAMESPACE_SUFFIX: make_matches(
+                {"meeting_id": "meeting_new", "meeting_title": "From record", "meeting_duration": "10:00"},
+            ),
+            "ns": make_matches(
+                {"meeting_id": "meeting_new", "meeting_title": "From chunk", "duration": "09:59"},
+                {"meeting_id": "meeting_old", "meeting_title": "Legacy", "duration": "05:00"},
+                {"meeting_id": "meeting_old", "meeting_title": "Legacy", "duration": "05:00"},
+            ),
+        }
+        self.manager.index.query.side_effect = lambda namespace, **kwargs: self.results[namespace]
+
+    def test_legacy_meetings_without_records_are_listed(self):
+        meetings = self.manager.list_meetings(namespace="ns")
+
+        self.assertEqual([m["meeting_id"] for m in meetings], ["meeting_new", "meeting_old"])
+        self.assertEqual(meetings[0]["meeting_title"], "From record")
+        self.assertEqual(meetings[0]["meeting_duration"], "10:00")
+        self.assertEqual(meetings[1]["meeting_title"], "Legacy")
+        self.assertEqual(meetings[1]["meeting_duration"], "05:00")
+
+    def test_records_namespace_empty_falls_back_to_chunks(self):
+        self.results["ns" + MEETINGS_NAMESPACE_SUFFIX] = make_matches()
+
+        meetings = self.manager.list_meetings(namespace="ns")
+
+        self.assertEqual([m["meeting_title"] for m in meetings], ["From chunk", "Legacy"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+import httpx
+from src.tools.general import _afetch_blocks_recursive, _fetch_blocks_recursive
+from src.utils import notion
+from src.utils.notion import RateLimiter, _AsyncRateLimitedTransport, _RateLimitedTransport
+
+def paragraph(text, has_children=False, block_id="b"):
+    return {
+        "id": block_id, "type": "paragraph", "has_children": has_children,
+        "paragraph": {"rich_text": [{"plain_text": text}]},
+    }
+
+class TestRateLimiter(unittest.TestCase):
+    def test_burst_then_paced(self):
+        limiter = RateLimiter(rate=10.0, burst=2)
+
+        delays = [limiter.reserve() for _ in range(4)]
+
+        self.assertEqual(delays[:2], [0.0, 0.0])
+        self.assertAlmostEqual(delays[2], 0.1, places=2)
+        self.assertAlmostEqual(delays[3], 0.2, places=2)
+
+class TestNotionTransport(unittest.TestCase):
+    def setUp(self):
+        # Plenty of tokens so only the retry logic is exercised
+        patcher = patch.object(notion, "notion_rate_limiter", RateLimiter(rate=1000.0, burst=1000))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.calls = 0
+
+    def handler(self, request):
+        self.calls += 1
+        if self.calls == 1:
+            return httpx.Response(429, headers={"Retry-After": "0"})
+        return httpx.Response(200, json={"results": [paragraph("hello")], "has_more": False})
+
+    def test_429_is_retried(self):
+        client = httpx.Client(base_url="https://notion.test", transport=_RateLimitedTransport(httpx.MockTransport(self.handler)))
+
+        self.assertEqual(_fetch_blocks_recursive(client, "page"), ["hello"])
+        self.assertEqual(self.calls, 2)
+
+    def test_429_is_retried_async(self):
+        async def run():
+            async with httpx.AsyncClient(
+                base_url="https://notion.test", transport=_AsyncRateLimitedTransport(httpx.MockTransport(self.handler))
+            ) as client:
+                return await _afetch_blocks_recursive(client, "page")
+
+        self.assertEqual(asyncio.run(run()), ["hello"])
+        self.assertEqual(self.calls, 2)
+
+    def test_failed_subtree_fails_the_import(self):
+        def handler(request):
+            if "/blocks/page/" in request.url.path:
+                return httpx.Response(200, json={"results": [paragraph("top", True, "child")], "has_more": False})
+            return httpx.Response(404, json={"message": "not found"})
+
+        async def run():
+            async with httpx.AsyncClient(base_url="https://notion.test", transport=httpx.MockTransport(handler)) as client:
+                return await _afetch_blocks_recursive(client, "page")
+
+        with self.assertRaises(RuntimeError):
+            asyncio.run(run())
+        with self.assertRaises(RuntimeError):
+            _fetch_blocks_recursive(httpx.Client(base_url="https://notion.test", transport=httpx.MockTransport(handler)), "page")
+
+if __name__ == '__main__':
+    unittest.main()
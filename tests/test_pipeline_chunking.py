@@ -0,0 +1,160 @@
+import json
+import types
+import unittest
+from src.retrievers.pipeline import iter_documents, process_transcript_to_documents
+
+def make_segments(count, speaker="SPEAKER_00", words=20):
+    segments = []
+    for i in range(count):
+        text = " ".join(f"w{i}_{j}" for j in range(words))
+        segments.append({"text": text, "speaker": speaker, "start": i * 5.0, "end": i * 5.0 + 4.0})
+    return segments
+
+class TestPipelineChunking(unittest.TestCase):
+    def test_chunks_respect_max_size_and_keep_all_text(self):
+        segments = make_segments(100)
+
+        docs = process_transcript_to_documents(
+            "", segments, "meeting_1", min_chunk_size=500, max_chunk_size=1000, chunk_overlap=0
+        )
+
+        self.assertGreater(len(docs), 1)
+        for doc in docs:
+            self.assertLessEqual(len(doc.page_content), 1000)
+        self.assertEqual(" ".join(d.page_content for d in docs), " ".join(s["text"] for s in segments))
+
+    def test_small_segments_from_different_speakers_are_grouped(self):
+        segments = make_segments(4, words=3)
+        segments[1]["speaker"] = "SPEAKER_01"
+
+        docs = process_transcript_to_documents("", segments, "meeting_1")
+
+        self.assertEqual(len(docs), 1)
+        self.assertEqual(sorted(docs[0].metadata["speakers"]), ["SPEAKER_00", "SPEAKER_01"])
+        self.assertEqual(docs[0].metadata["chunk_type"], "mixed_speakers")
+        self.assertEqual(docs[0].metadata["segment_count"], 4)
+        self.assertEqual(docs[0].metadata["start_time"], 0.0)
+        self.assertEqual(docs[0].metadata["end_time"], 19.0)
+
+    def test_overlap_prefixes_tail_of_previous_chunk(self):
+        segments = make_segments(100)
+        plain = process_transcript_to_documents(
+            "", segments, "meeting_1", min_chunk_size=500, max_chunk_size=1000, chunk_overlap=0
+        )
+
+        docs = process_transcript_to_documents(
+            "", segments, "meeting_1", min_chunk_size=500, max_chunk_size=1000, chunk_overlap=50
+        )
+
+        self.assertEqual(len(docs), len(plain))
+        self.assertEqual(docs[0].page_content, plain[0].page_content)
+        for i in range(1, len(docs)):
+            tail = plain[i - 1].page_content[-50:].strip()
+            self.assertEqual(docs[i].page_content, f"{tail} {plain[i].page_content}")
+
+    def test_metadata_fields(self):
+        metadata = {"meeting_title": "Weekly Sync", "speaker_mapping": {"SPEAKER_00": "Ann"}}
+
+        docs = process_transcript_to_documents(
+            "", make_segments(30), "meeting_1", meeting_metadata=metadata,
+            min_chunk_size=500, max_chunk_size=1000, chunk_overlap=0
+        )
+
+        for idx, doc in enumerate(docs):
+            self.assertEqual(doc.metadata["meeting_id"], "meeting_1")
+            self.assertEqual(doc.metadata["meeting_title"], "Weekly Sync")
+            self.assertEqual(json.loads(doc.metadata["speaker_mapping"]), {"SPEAKER_00": "Ann"})
+            self.assertEqual(doc.metadata["chunk_index"], idx)
+            self.assertEqual(doc.metadata["total_chunks"], len(docs))
+            self.assertEqual(doc.metadata["char_count"], len(doc.page_content))
+            self.assertEqual(doc.metadata["word_count"], len(doc.page_content.split()))
+            self.assertEqual(doc.metadata["start_time_formatted"][2], ":")
+
+    def test_fallback_chunking_without_speaker_data(self):
+        text = " ".join(f"word{i}" for i in range(2000))
+
+        docs = process_transcript_to_documents(text, None, "doc_1", max_chunk_size=3000, chunk_overlap=200)
+
+        self.assertGreater(len(docs), 1)
+        for doc in docs:
+            self.assertEqual(doc.metadata["chunk_type"], "full_transcript_chunk")
+            self.assertLessEqual(len(doc.page_content), 3000)
+
+    def test_short_text_without_speaker_data_is_single_chunk(self):
+        docs = process_transcript_to_documents("  short note \n", None, "doc_1", max_chunk_size=3000)
+
+        self.assertEqual(len(docs), 1)
+        self.assertEqual(docs[0].page_content, "short note")
+        self.assertEqual(docs[0].metadata["total_chunks"], 1)
+        self.assertEqual(process_transcript_to_documents("   ", None, "doc_1"), [])
+
+    def test_fallback_merges_undersized_splits(self):
+        # The oversized paragraph leaves a short remainder next to a short paragraph
+        text = " ".join(["word"] * 700) + "\n\n" + " ".join(["tail"] * 60)
+
+        docs = process_transcript_to_documents(text, None, "doc_1", max_chunk_size=3000, chunk_overlap=0)
+
+        self.assertEqual(len(docs), 2)
+        self.assertTrue(docs[1].page_content.endswith("tail"))
+        self.assertEqual(docs[1].metadata["total_chunks"], 2)
+
+    def test_iter_documents_yields_same_documents(self):
+        segments = make_segments(60)
+
+        stream = iter_documents("", segments, "meeting_1", min_chunk_size=500, max_chunk_size=1000)
+
+        self.assertIsInstance(stream, types.GeneratorType)
+        self.assertEqual(
+            list(stream),
+            process_transcript_to_documents("", segments, "meeting_1", min_chunk_size=500, max_chunk_size=1000),
+        )
+
+    def test_oversized_segment_is_split(self):
+        segments = make_segments(3)
+        segments[1]["text"] = " ".join(f"long{j}" for j in range(600))
+
+        docs = process_transcript_to_documents(
+            "", segments, "meeting_1", min_chunk_size=500, max_chunk_size=1000, chunk_overlap=0
+        )
+
+        self.assertGreater(len(docs), 3)
+        for doc in docs:
+            self.assertLessEqual(len(doc.page_content), 1000)
+        times = [(d.metadata["start_time"], d.metadata["end_time"]) for d in docs]
+        self.assertEqual(times, sorted(times))
+        self.assertEqual(times[0][0], 0.0)
+        self.assertEqual(times[-1][1], 14.0)
+
+    def test_tiny_tail_chunk_is_merged_into_previous(self):
+        # 24 segments fill the first chunk; the 25th alone would be a tiny tail
+        segments = [
+            {"text": f"{i:02d}" + "x" * 38, "speaker": "SPEAKER_00", "start": i * 5.0, "end": i * 5.0 + 4.0}
+            for i in range(25)
+        ]
+        segments[-1]["speaker"] = "SPEAKER_01"
+
+        docs = process_transcript_to_documents(
+            "", segments, "meeting_1", min_chunk_size=500, max_chunk_size=1000, chunk_overlap=0
+        )
+
+        self.assertEqual(len(docs), 1)
+        self.assertLessEqual(len(docs[0].page_content), 1050)
+        self.assertEqual(docs[0].metadata["segment_count"], 25)
+        self.assertEqual(docs[0].metadata["end_time"], 124.0)
+        self.assertEqual(docs[0].metadata["speakers"], ["SPEAKER_00", "SPEAKER_01"])
+
+    def test_repeated_and_empty_segments_are_skipped(self):
+        segments = make_segments(3, words=3)
+        segments.insert(1, dict(segments[0], start=4.0, end=5.0))
+        segments.insert(2, {"text": "  ", "speaker": "SPEAKER_00", "start": 5.0, "end": 5.1})
+        # The same words from another speaker are kept
+        segments.append(dict(segments[-1], speaker="SPEAKER_01"))
+
+        docs = process_transcript_to_documents("", segments, "meeting_1")
+
+        self.assertEqual(docs[0].metadata["segment_count"], 4)
+        self.assertEqual(docs[0].page_content.count(segments[0]["text"]), 1)
+        self.assertEqual(docs[0].page_content.count(segments[-1]["text"]), 2)
+
+if __name__ == '__main__':
+    unittest.main()
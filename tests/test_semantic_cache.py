@@ -0,0 +1,30 @@
+import unittest
+from src.utils.cache import SemanticCache
+
+class TestSemanticCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = SemanticCache(maxsize=2, threshold=0.95)
+
+    def test_similar_query_in_same_scope_hits(self):
+        self.cache.set(("ns", 5, None), [1.0, 0.0, 0.1], "docs")
+
+        self.assertEqual(self.cache.get(("ns", 5, None), [2.0, 0.0, 0.25]), "docs")
+        self.assertIsNone(self.cache.get(("ns", 5, None), [0.0, 1.0, 0.0]))
+
+    def test_scope_must_match_exactly(self):
+        self.cache.set(("ns", 5, None), [1.0, 0.0], "docs")
+
+        self.assertIsNone(self.cache.get(("ns", 5, "meeting_1"), [1.0, 0.0]))
+        self.assertIsNone(self.cache.get(("ns", 3, None), [1.0, 0.0]))
+
+    def test_evicts_least_recently_used(self):
+        self.cache.set("scope", [1.0, 0.0, 0.0], "a")
+        self.cache.set("scope", [0.0, 1.0, 0.0], "b")
+        self.cache.get("scope", [1.0, 0.0, 0.0])
+        self.cache.set("scope", [0.0, 0.0, 1.0], "c")
+
+        self.assertEqual(self.cache.get("scope", [1.0, 0.0, 0.0]), "a")
+        self.assertIsNone(self.cache.get("scope", [0.0, 1.0, 0.0]))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+import unittest
+from unittest.mock import patch
+from src.processing.metadata_extractor import MetadataExtractor
+
+class TestSpeakerMapping(unittest.TestCase):
+    @patch('src.processing.metadata_extractor.get_chat_model')
+    def setUp(self, mock_get_chat_model):
+        self.extractor = MetadataExtractor()
+
+    def test_replaces_all_labels(self):
+        transcript = "SPEAKER_00: Hi.\nSPEAKER_01: Hello.\nSPEAKER_00: Bye."
+        mapping = {"SPEAKER_00": "John", "SPEAKER_01": "Sarah"}
+
+        result = self.extractor.apply_speaker_mapping(transcript, mapping)
+
+        self.assertEqual(result, "John: Hi.\nSarah: Hello.\nJohn: Bye.")
+
+    def test_longer_labels_take_precedence(self):
+        transcript = "SPEAKER_1 and SPEAKER_10"
+        mapping = {"SPEAKER_1": "Ann", "SPEAKER_10": "Bob"}
+
+        result = self.extractor.apply_speaker_mapping(transcript, mapping)
+
+        self.assertEqual(result, "Ann and Bob")
+
+    def test_replaced_names_are_not_rescanned(self):
+        # A name containing another label must not be rewritten again
+        transcript = "SPEAKER_00 / SPEAKER_01"
+        mapping = {"SPEAKER_00": "SPEAKER_01 (Host)", "SPEAKER_01": "Sarah"}
+
+        result = self.extractor.apply_speaker_mapping(transcript, mapping)
+
+        self.assertEqual(result, "SPEAKER_01 (Host) / Sarah")
+
+    def test_empty_mapping_returns_transcript(self):
+        self.assertEqual(self.extractor.apply_speaker_mapping("text", {}), "text")
+
+if __name__ == '__main__':
+    unittest.main()
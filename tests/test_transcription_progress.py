@@ -0,0 +1,66 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+from langchain_core.messages import AIMessage
+from src.agents import conversational
+from src.tools import video
+
+def transcribe_call(video_path):
+    message = AIMessage(content="", tool_calls=[
+        {"name": "transcribe_uploaded_video", "args": {"video_path": video_path}, "id": "call_1"},
+    ])
+    return {"agent": {"llm_messages": [message]}}
+
+class TestTranscriptionProgress(unittest.TestCase):
+    def setUp(self):
+        handle, self.video_path = tempfile.mkstemp(suffix=".mp4")
+        os.close(handle)
+        self.addCleanup(os.remove, self.video_path)
+        self.addCleanup(video.reset_video_state)
+        patcher = patch.object(conversational, "_PROGRESS_POLL_SECONDS", 0.01)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def run_turn(self, events_before_wait):
+        async def events():
+            for event in events_before_wait:
+                yield event
+            await asyncio.sleep(0.1)  # the tool runs
+            yield {"tools": {"llm_messages": []}}
+            video.get_video_state().transcription_stage = "a later stage"
+            await asyncio.sleep(0.1)  # the agent writes its answer
+            yield {"agent": {"llm_messages": [AIMessage(content="done")]}}
+
+        async def collect():
+            return [event async for event in conversational._with_transcription_progress(events())]
+
+        return asyncio.run(collect())
+
+    def start_transcription(self, path):
+        state = video.get_video_state()
+        state.transcription_in_progress = True
+        state.uploaded_video_path = Path(path)
+        state.transcription_stage = "📝 Transcribing audio... (40%)"
+
+    def test_own_transcription_progress_is_relayed(self):
+        self.start_transcription(self.video_path)
+
+        events = self.run_turn([transcribe_call(f"[VIDEO_PATH: {self.video_path}]")])
+
+        self.assertEqual([e["progress"] for e in events if "progress" in e], ["📝 Transcribing audio... (40%)"])
+        # Nothing is relayed once the tool call has completed
+        self.assertEqual([next(iter(e)) for e in events], ["agent", "progress", "tools", "agent"])
+
+    def test_other_chats_transcription_is_not_relayed(self):
+        self.start_transcription("/tmp/someone-elses-video.mp4")
+
+        with_call = self.run_turn([transcribe_call(self.video_path)])
+        without_call = self.run_turn([])
+
+        self.assertFalse(any("progress" in e for e in with_call + without_call))
+
+if __name__ == '__main__':
+    unittest.main()
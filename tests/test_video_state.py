@@ -0,0 +1,150 @@
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+from src.tools import video
+
+class BlockingTranscriptionService:
+    """Stands in for TranscriptionService; returns once `release` is set."""
+
+    def __init__(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def transcribe_video(self, video_path, progress_callback=None):
+        self.started.set()
+        self.release.wait(5)
+        return {
+            "success": True,
+            "transcription": "SPEAKER_00: hello",
+            "raw_data": {"segments": [{"text": "hello", "speaker": "SPEAKER_00", "start": 0.0, "end": 1.0}]},
+            "timing_info": "",
+        }
+
+class TestVideoStateLocking(unittest.TestCase):
+    def setUp(self):
+        self.service = BlockingTranscriptionService()
+        video.initialize_video_tools(self.service, None)
+        video.reset_video_state()
+        handle, self.video_path = tempfile.mkstemp(suffix=".mp4")
+        os.close(handle)
+        self.addCleanup(os.remove, self.video_path)
+        self.addCleanup(video.reset_video_state)
+
+    def start_transcription(self):
+        results = []
+        thread = threading.Thread(target=lambda: results.append(video.transcribe_uploaded_video.invoke({"video_path": self.video_path})))
+        thread.start()
+        self.assertTrue(self.service.started.wait(5))
+        return thread, results
+
+    @patch("src.processing.metadata_extractor.get_metadata_extractor")
+    def test_cancel_during_transcription_discards_results(self, mock_get_extractor):
+        thread, results = self.start_transcription()
+
+        cancelled = video.cancel_video_workflow.invoke({})
+        self.service.release.set()
+        thread.join(5)
+
+        self.assertIn("discarded", cancelled)
+        self.assertEqual(results, [video.TRANSCRIPTION_CANCELLED])
+        self.assertIsNone(video.get_video_state().transcription_text)
+        self.assertFalse(video.get_video_state().transcription_in_progress)
+        mock_get_extractor.assert_not_called()
+
+    def test_cancel_does_not_block_on_transcription_that_just_took_the_lock(self):
+        replies = []
+        with patch.object(video, "_CANCEL_RETRY_SECONDS", 0.01), video._video_lock:
+            # A transcription holds the lock but hasn't marked itself running yet
+            cancel = threading.Thread(target=lambda: replies.append(video.cancel_video_workflow.invoke({})))
+            cancel.start()
+            cancel.join(0.05)
+            self.assertTrue(cancel.is_alive())
+            with video._cancel_lock:
+                video.get_video_state().transcription_in_progress = True
+            cancel.join(1)
+
+            self.assertFalse(cancel.is_alive())
+        self.assertIn("discarded", replies[0])
+        self.assertTrue(video._cancel_requested.is_set())
+        video._cancel_requested.clear()
+
+    @patch("src.processing.metadata_extractor.get_metadata_extractor")
+    def test_edit_waits_for_running_transcription(self, mock_get_extractor):
+        mock_get_extractor.return_value.extract_metadata.return_value = {}
+        thread, _ = self.start_transcription()
+
+        edit = threading.Thread(target=lambda: video.update_transcription.invoke({"edited_text": "edited"}))
+        edit.start()
+        edit.join(0.2)
+        self.assertTrue(edit.is_alive())
+
+        self.service.release.set()
+        thread.join(5)
+        edit.join(5)
+
+        # The edit lands after the transcription, not underneath it
+        self.assertEqual(video.get_video_state().transcription_text, "edited")
+
+class FailingPinecone:
+    def __init__(self):
+        self.release = threading.Event()
+
+    def upsert_documents(self, docs):
+        self.release.wait(5)
+        raise RuntimeError("index unavailable")
+
+class TestBackgroundUpload(unittest.TestCase):
+    def setUp(self):
+        self.pinecone = FailingPinecone()
+        video.initialize_video_tools(None, self.pinecone)
+        self.addCleanup(video.reset_video_state)
+
+    def load_transcript(self, text="SPEAKER_00: hello"):
+        state = video.get_video_state()
+        state.transcription_text = text
+        state.transcription_segments = [{"text": "hello", "speaker": "SPEAKER_00", "start": 0.0, "end": 1.0}]
+        state.extracted_metadata = {"title": "Sync", "summary": "Notes"}
+
+    def upload(self):
+        reply = video.upload_transcription_to_pinecone.invoke({})
+        return reply.split("`")[1]
+
+    def test_failed_upload_restores_transcript(self):
+        self.load_transcript()
+        meeting_id = self.upload()
+        self.pinecone.release.set()
+        video._upload_jobs[meeting_id].result(5)
+
+        status = video.check_upload_status.invoke({"meeting_id": meeting_id})
+
+        self.assertIn("loaded again", status)
+        self.assertEqual(video.get_video_state().transcription_text, "SPEAKER_00: hello")
+
+    def test_failed_upload_does_not_claim_restore_over_newer_video(self):
+        self.load_transcript()
+        meeting_id = self.upload()
+        self.load_transcript("SPEAKER_00: newer video")
+        self.pinecone.release.set()
+        video._upload_jobs[meeting_id].result(5)
+
+        status = video.check_upload_status.invoke({"meeting_id": meeting_id})
+
+        self.assertIn("newer transcription", status)
+        self.assertEqual(video.get_video_state().transcription_text, "SPEAKER_00: newer video")
+
+    def test_job_history_is_capped(self):
+        self.pinecone.release.set()
+        with patch.object(video, "_MAX_UPLOAD_JOBS", 2):
+            ids = []
+            for _ in range(3):
+                self.load_transcript()
+                ids.append(self.upload())
+
+        self.assertEqual(list(video._upload_jobs)[-2:], ids[1:])
+        self.assertNotIn(ids[0], video._upload_jobs)
+        self.assertLessEqual(len(video._upload_jobs), 2)
+
+if __name__ == '__main__':
+    unittest.main()